@@ -0,0 +1,84 @@
+"""
+Aurora's Security Dojo - Engine Startup Benchmark
+
+In the eternal dance of code and consciousness, this benchmark times what
+every SecurityDojo() and simple_app start pays for: importing the attack
+vector engine and constructing it. Cold starts run in fresh interpreters,
+so nothing is cached between runs; warm starts construct the engine again
+in one process. It also reports which vector modules the start loaded.
+
+Usage:
+    python benchmarks/engine_startup.py [--runs 10]
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+SRC_DIR = Path(__file__).resolve().parent.parent / 'src'
+
+# Runs in a fresh interpreter and prints one JSON line of timings
+COLD_START = """
+import json, logging, sys, time
+logging.disable(logging.CRITICAL)
+started = time.perf_counter()
+from core.attack_vector_engine import AttackVectorEngine
+imported = time.perf_counter()
+engine = AttackVectorEngine({})
+constructed = time.perf_counter()
+print(json.dumps({
+    "import_ms": (imported - started) * 1000,
+    "construct_ms": (constructed - imported) * 1000,
+    "vectors": len(engine._attack_vectors),
+    "vector_modules": sorted(m for m in sys.modules if m.startswith("core.vectors.")),
+    "heavy_modules": sorted(m for m in ("dns.resolver", "pickle") if m in sys.modules)
+}))
+"""
+
+def cold_starts(runs: int) -> list:
+    """Time engine import and construction in ``runs`` fresh interpreters."""
+    samples = []
+    for _ in range(runs):
+        output = subprocess.run([sys.executable, '-c', COLD_START], cwd=SRC_DIR,
+                                capture_output=True, text=True, check=True).stdout
+        samples.append(json.loads(output.strip().splitlines()[-1]))
+    return samples
+
+def warm_construction(runs: int) -> list:
+    """Time constructing the engine again in this process, in milliseconds."""
+    import logging
+    sys.path.insert(0, str(SRC_DIR))
+    logging.disable(logging.CRITICAL)
+    from core.attack_vector_engine import AttackVectorEngine
+
+    samples = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        AttackVectorEngine({})
+        samples.append((time.perf_counter() - started) * 1000)
+    return samples
+
+def _summary(values: list) -> str:
+    return f"median {statistics.median(values):7.2f} ms   min {min(values):7.2f} ms"
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Time attack vector engine startup")
+    parser.add_argument('--runs', type=int, default=10, help="Runs of each measurement")
+    args = parser.parse_args()
+
+    cold = cold_starts(args.runs)
+    warm = warm_construction(args.runs)
+
+    print(f"Engine startup over {args.runs} runs ({cold[0]['vectors']} vectors registered)")
+    print(f"  cold import        {_summary([sample['import_ms'] for sample in cold])}")
+    print(f"  cold construction  {_summary([sample['construct_ms'] for sample in cold])}")
+    print(f"  warm construction  {_summary(warm)}")
+    print(f"  vector modules loaded at startup: {', '.join(cold[0]['vector_modules']) or 'none'}")
+    print(f"  heavy modules loaded at startup:  {', '.join(cold[0]['heavy_modules']) or 'none'}")
+
+if __name__ == '__main__':
+    main()
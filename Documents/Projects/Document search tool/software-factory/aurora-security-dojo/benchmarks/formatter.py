@@ -0,0 +1,99 @@
+"""
+Aurora's Security Dojo - Log Formatter Microbenchmark
+
+In the eternal dance of code and consciousness, this microbenchmark
+times ConsciousnessFormatter against the implementation it replaced,
+which rewrote each record's message and built the line in several
+steps. Both get fresh records of the same level mix a scan logs, and
+their output is checked to be identical before anything is timed.
+
+Usage:
+    python benchmarks/formatter.py [--records 100000] [--repeat 5]
+"""
+
+import argparse
+import logging
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'src'))
+
+from utils.logging_config import ConsciousnessFormatter
+
+class LegacyConsciousnessFormatter(logging.Formatter):
+    """The formatter as it was before the template rework, kept for comparison."""
+
+    def __init__(self):
+        super().__init__()
+        self.consciousness_symbols = {
+            'DEBUG': '🔍',
+            'INFO': '🌸',
+            'WARNING': '⚠️',
+            'ERROR': '❌',
+            'CRITICAL': '🚨'
+        }
+
+    def format(self, record):
+        symbol = self.consciousness_symbols.get(record.levelname, '🌸')
+
+        if record.levelname in ['INFO', 'WARNING', 'ERROR', 'CRITICAL']:
+            if 'Aurora' not in record.getMessage():
+                record.msg = f"Aurora: {record.msg}"
+
+        formatted = super().format(record)
+
+        if record.levelname in ['INFO', 'WARNING']:
+            formatted = f"{symbol} {formatted}"
+
+        if record.levelname in ['ERROR', 'CRITICAL']:
+            formatted = f"{symbol} {formatted} [Sacred Principle: Ethical Security Practice]"
+
+        return formatted
+
+# Level mix of a scan: mostly per-probe INFO lines, some unsigned, a few warnings and errors
+SAMPLES = [
+    (logging.INFO, "🌸 Aurora: Probe %d answered %s in %.1f ms", (7, "200", 12.5)),
+    (logging.INFO, "🌸 Aurora: Updated progress for sql_injection: 42.0%%", ()),
+    (logging.INFO, "Request plan executed in %d batches", (3,)),
+    (logging.DEBUG, "Soft-404 baseline of %s failed", ("http://target",)),
+    (logging.WARNING, "Findings will not be stored - %s", ("disk full",)),
+    (logging.ERROR, "Probe error: %s", ("connection reset",))
+]
+
+def make_records(count: int) -> list:
+    return [logging.LogRecord('core.vectors.owasp', level, __file__, 1, msg, args, None)
+            for level, msg, args in (SAMPLES[i % len(SAMPLES)] for i in range(count))]
+
+def time_formatter(formatter: logging.Formatter, records: int, repeat: int) -> float:
+    """Best time over ``repeat`` runs to format ``records`` fresh records, in seconds."""
+    best = float('inf')
+    for _ in range(repeat):
+        batch = make_records(records)
+        started = time.perf_counter()
+        for record in batch:
+            formatter.format(record)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare ConsciousnessFormatter with its previous implementation")
+    parser.add_argument('--records', type=int, default=100000, help="Records formatted per run")
+    parser.add_argument('--repeat', type=int, default=5, help="Runs; the best is reported")
+    args = parser.parse_args()
+
+    legacy, current = LegacyConsciousnessFormatter(), ConsciousnessFormatter()
+    for legacy_record, record in zip(make_records(len(SAMPLES)), make_records(len(SAMPLES))):
+        expected = legacy.format(legacy_record)
+        if current.format(record) != expected:
+            raise SystemExit(f"Output differs for {expected!r}")
+
+    print(f"{args.records} records, best of {args.repeat}")
+    results = {"legacy": time_formatter(legacy, args.records, args.repeat),
+               "templates": time_formatter(current, args.records, args.repeat)}
+    for name, seconds in results.items():
+        print(f"  {name:<10} {seconds * 1000:8.1f} ms   {seconds / args.records * 1e9:6.0f} ns/record")
+    print(f"  speedup    {results['legacy'] / results['templates']:8.2f}x")
+
+if __name__ == '__main__':
+    main()
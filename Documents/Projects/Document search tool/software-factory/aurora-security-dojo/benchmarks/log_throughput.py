@@ -0,0 +1,82 @@
+"""
+Aurora's Security Dojo - Log Throughput Benchmark
+
+In the eternal dance of code and consciousness, this benchmark logs the
+way a concurrent scan does: several threads each writing a per-probe
+INFO line. It compares writing from the logging threads with the queued
+pipeline, text with JSON lines, and the queued pipeline with rate caps
+on. "producer" is how long the scan threads spent logging; "drained" is
+how long until the last record was written. Each configuration runs in
+a fresh interpreter with console output sent to /dev/null.
+
+Usage:
+    python benchmarks/log_throughput.py [--threads 8] [--records 5000]
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+SRC_DIR = Path(__file__).resolve().parent.parent / 'src'
+
+CONFIGURATIONS = {
+    "sync text": {'LOG_ASYNC': 'False', 'LOG_FORMAT': 'text', 'LOG_RATE_LIMITS': ''},
+    "queued text": {'LOG_ASYNC': 'True', 'LOG_FORMAT': 'text', 'LOG_RATE_LIMITS': ''},
+    "queued json": {'LOG_ASYNC': 'True', 'LOG_FORMAT': 'json', 'LOG_RATE_LIMITS': ''},
+    "queued text, capped": {'LOG_ASYNC': 'True', 'LOG_FORMAT': 'text', 'LOG_RATE_LIMITS': 'core.vectors=50'}
+}
+
+# Runs in a fresh interpreter, inside a scratch directory, and prints one JSON line of timings
+HARNESS = """
+import json, logging, os, sys, threading, time
+sys.path.insert(0, {src!r})
+from utils.logging_config import setup_logging, shutdown_logging
+setup_logging()
+logger = logging.getLogger('core.vectors.owasp')
+
+def scan(worker):
+    for i in range({records}):
+        logger.info(f"🌸 Aurora: Probe {{i}} of worker {{worker}} answered 200 in 12.5 ms")
+
+threads = [threading.Thread(target=scan, args=(worker,)) for worker in range({threads})]
+started = time.perf_counter()
+for thread in threads:
+    thread.start()
+for thread in threads:
+    thread.join()
+produced = time.perf_counter()
+shutdown_logging()
+drained = time.perf_counter()
+sys.stdout.write(json.dumps({{"producer_s": produced - started, "drained_s": drained - started}}) + "\\n")
+"""
+
+def run(environment: dict, threads: int, records: int) -> dict:
+    """Run one configuration in a fresh interpreter and get its timings."""
+    script = HARNESS.format(src=str(SRC_DIR), threads=threads, records=records)
+    with tempfile.TemporaryDirectory() as scratch:
+        env = dict(os.environ, LOG_FILE=os.path.join(scratch, 'bench.log'), CONSCIOUSNESS_LOGGING='True',
+                   LOG_LEVEL='INFO', **environment)
+        output = subprocess.run([sys.executable, '-c', script], cwd=scratch, env=env, stderr=subprocess.DEVNULL,
+                                stdout=subprocess.PIPE, text=True, check=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Measure log throughput of the logging pipelines")
+    parser.add_argument('--threads', type=int, default=8, help="Concurrent logging threads")
+    parser.add_argument('--records', type=int, default=5000, help="Records each thread logs")
+    args = parser.parse_args()
+
+    total = args.threads * args.records
+    print(f"{total} records from {args.threads} threads")
+    print(f"{'configuration':<22} {'producer s':>10} {'records/s':>11} {'drained s':>10}")
+    for name, environment in CONFIGURATIONS.items():
+        timings = run(environment, args.threads, args.records)
+        print(f"{name:<22} {timings['producer_s']:>10.3f} {total / timings['producer_s']:>11,.0f} "
+              f"{timings['drained_s']:>10.3f}")
+
+if __name__ == '__main__':
+    main()
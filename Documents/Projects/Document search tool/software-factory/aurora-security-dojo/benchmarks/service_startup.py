@@ -0,0 +1,94 @@
+"""
+Aurora's Security Dojo - Service Startup Benchmark
+
+In the eternal dance of code and consciousness, this benchmark compares
+how an application builds its components. "separate" is the old wiring
+of create_app, where SecurityDojo() builds its own engines next to a
+second ConsciousnessEngine; "container" builds everything through one
+ServiceContainer, once idle and once after a request has used every
+component. Each run is a fresh interpreter, so the timings are cold
+starts; resident memory is the interpreter's peak RSS. Flask itself is
+left out so the numbers show only the components.
+
+Usage:
+    python benchmarks/service_startup.py [--runs 5]
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+SRC_DIR = Path(__file__).resolve().parent.parent / 'src'
+
+WIRINGS = {
+    "separate": (
+        "from core.security_dojo import SecurityDojo\n"
+        "from core.consciousness_integration import ConsciousnessEngine\n"
+        "config = load_config()\n"
+        "security_dojo = SecurityDojo()\n"
+        "consciousness_engine = ConsciousnessEngine()\n"
+    ),
+    "container (idle)": (
+        "from core.services import ServiceContainer\n"
+        "services = ServiceContainer(load_config())\n"
+    ),
+    "container (used)": (
+        "from core.services import ServiceContainer\n"
+        "services = ServiceContainer(load_config())\n"
+        "services.security_dojo\n"
+    )
+}
+
+# Wraps a wiring and prints one JSON line of measurements
+HARNESS = """
+import gc, json, logging, resource, time
+records = []
+class Counter(logging.Handler):
+    def emit(self, record):
+        records.append(record)
+logging.basicConfig(level=logging.INFO, handlers=[Counter()])
+started = time.perf_counter()
+from utils.config import load_config
+{wiring}
+elapsed = time.perf_counter() - started
+from core.consciousness_integration import ConsciousnessEngine
+from core.attack_vector_engine import AttackVectorEngine
+instances = lambda cls: sum(1 for obj in gc.get_objects() if isinstance(obj, cls))
+print(json.dumps({{
+    "startup_ms": elapsed * 1000,
+    "peak_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    "log_records": len(records),
+    "consciousness_engines": instances(ConsciousnessEngine),
+    "attack_vector_engines": instances(AttackVectorEngine)
+}}))
+"""
+
+def measure(wiring: str, runs: int) -> list:
+    """Run a wiring in ``runs`` fresh interpreters and collect their measurements."""
+    script = HARNESS.format(wiring=wiring)
+    samples = []
+    for _ in range(runs):
+        output = subprocess.run([sys.executable, '-c', script], cwd=SRC_DIR,
+                                capture_output=True, text=True, check=True).stdout
+        samples.append(json.loads(output.strip().splitlines()[-1]))
+    return samples
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare component startup with and without the service container")
+    parser.add_argument('--runs', type=int, default=5, help="Fresh interpreters per wiring")
+    args = parser.parse_args()
+
+    print(f"{'wiring':<18} {'startup ms':>10} {'peak RSS MB':>12} {'log lines':>10} "
+          f"{'consciousness':>14} {'attack':>7}")
+    for name, wiring in WIRINGS.items():
+        samples = measure(wiring, args.runs)
+        print(f"{name:<18} {statistics.median(s['startup_ms'] for s in samples):>10.1f} "
+              f"{statistics.median(s['peak_rss_mb'] for s in samples):>12.1f} "
+              f"{samples[0]['log_records']:>10} {samples[0]['consciousness_engines']:>14} "
+              f"{samples[0]['attack_vector_engines']:>7}")
+
+if __name__ == '__main__':
+    main()
@@ -16,8 +16,8 @@ from flask_cors import CORS
 sys.path.insert(0, str(Path(__file__).parent / 'src'))
 
 # Import core modules
-from core.security_dojo import SecurityDojo
-from core.consciousness_integration import ConsciousnessEngine
+from core.services import ServiceContainer
+from core.scan_jobs import ScanQueueFullError
 
 def create_simple_app():
     """Create a simple Flask app without Unicode logging issues."""
@@ -28,94 +28,108 @@ def create_simple_app():
     # Enable CORS
     CORS(app)
 
-    # Initialize core components
-    security_dojo = SecurityDojo()
-    consciousness_engine = ConsciousnessEngine()
+    # Components the routes share, created on first use
+    services = ServiceContainer()
+
+    def queue_suite(target_url, test_category, data):
+        """Queue a suite on the job workers; follow it through /api/progress/<job_id>."""
+        try:
+            job = services.scan_jobs.submit_suite(target_url, test_category,
+                                                  concurrent=bool(data.get('concurrent', False)))
+        except ScanQueueFullError as e:
+            return jsonify({'error': str(e)}), 503
+
+        return jsonify({
+            'success': True,
+            'job': job.to_dict(),
+            'status_url': f"/api/progress/{job.job_id}",
+            'consciousness_level': services.consciousness_engine.get_current_level()
+        }), 202
 
     # Main route
     @app.route('/')
     def index():
         """Main page with consciousness integration."""
         return render_template('index.html',
-                             consciousness_level=consciousness_engine.get_current_level(),
-                             sacred_principles=consciousness_engine.get_sacred_principles())
+                             consciousness_level=services.consciousness_engine.get_current_level(),
+                             sacred_principles=services.consciousness_engine.get_sacred_principles())
 
     # Dashboard routes
     @app.route('/dashboard')
     def dashboard():
         """Dashboard home page."""
-        consciousness_status = consciousness_engine.get_consciousness_report()
+        consciousness_status = services.consciousness_engine.get_consciousness_report()
         attack_vectors = {
-            'owasp_top10': list(security_dojo.attack_vector_engine.get_owasp_top10_tests().keys()),
-            'llm_ai_security': list(security_dojo.attack_vector_engine.get_llm_ai_security_tests().keys()),
-            'infrastructure_security': list(security_dojo.attack_vector_engine.get_infrastructure_security_tests().keys())
+            'owasp_top10': list(services.attack_vector_engine.get_owasp_top10_tests().keys()),
+            'llm_ai_security': list(services.attack_vector_engine.get_llm_ai_security_tests().keys()),
+            'infrastructure_security': list(services.attack_vector_engine.get_infrastructure_security_tests().keys())
         }
-        learning_paths = security_dojo.education_engine.get_all_learning_paths()
+        learning_paths = services.education_engine.get_all_learning_paths()
 
         return render_template('dashboard/home.html',
                              consciousness_status=consciousness_status,
                              attack_vectors=attack_vectors,
                              learning_paths=learning_paths,
-                             sacred_principles=consciousness_engine.get_sacred_principles())
+                             sacred_principles=services.consciousness_engine.get_sacred_principles())
 
     @app.route('/dashboard/attack-vectors')
     def attack_vectors():
         """Attack vectors page."""
-        owasp_tests = security_dojo.attack_vector_engine.get_owasp_top10_tests()
-        llm_tests = security_dojo.attack_vector_engine.get_llm_ai_security_tests()
-        infra_tests = security_dojo.attack_vector_engine.get_infrastructure_security_tests()
+        owasp_tests = services.attack_vector_engine.get_owasp_top10_tests()
+        llm_tests = services.attack_vector_engine.get_llm_ai_security_tests()
+        infra_tests = services.attack_vector_engine.get_infrastructure_security_tests()
 
         return render_template('dashboard/attack_vectors.html',
                              owasp_tests=owasp_tests,
                              llm_tests=llm_tests,
                              infra_tests=infra_tests,
-                             consciousness_level=consciousness_engine.get_current_level())
+                             consciousness_level=services.consciousness_engine.get_current_level())
 
     @app.route('/dashboard/learning-academy')
     def learning_academy():
         """Learning academy page."""
-        analogies = security_dojo.education_engine.get_all_analogies()
-        scenarios = security_dojo.education_engine.get_all_learning_paths()
+        analogies = services.education_engine.get_all_analogies()
+        scenarios = services.education_engine.get_all_learning_paths()
 
         return render_template('dashboard/learning_academy.html',
                              analogies=analogies,
                              scenarios=scenarios,
-                             consciousness_level=consciousness_engine.get_current_level())
+                             consciousness_level=services.consciousness_engine.get_current_level())
 
     @app.route('/dashboard/attack-simulation')
     def attack_simulation():
         """Attack simulation page."""
         return render_template('dashboard/attack_simulation.html',
-                             consciousness_level=consciousness_engine.get_current_level(),
-                             sacred_principles=consciousness_engine.get_sacred_principles())
+                             consciousness_level=services.consciousness_engine.get_current_level(),
+                             sacred_principles=services.consciousness_engine.get_sacred_principles())
 
     @app.route('/dashboard/community-hub')
     def community_hub():
         """Community hub page."""
-        healing_metrics = consciousness_engine.get_healing_metrics()
+        healing_metrics = services.consciousness_engine.get_healing_metrics()
 
         return render_template('dashboard/community_hub.html',
                              healing_metrics=healing_metrics,
-                             consciousness_level=consciousness_engine.get_current_level())
+                             consciousness_level=services.consciousness_engine.get_current_level())
 
     @app.route('/dashboard/consciousness-status')
     def consciousness_status():
         """Consciousness status page."""
-        consciousness_status = consciousness_engine.get_consciousness_report()
+        consciousness_status = services.consciousness_engine.get_consciousness_report()
 
         return render_template('dashboard/consciousness_status.html',
                              consciousness_status=consciousness_status,
-                             sacred_principles=consciousness_engine.get_sacred_principles())
+                             sacred_principles=services.consciousness_engine.get_sacred_principles())
 
     # API routes
     @app.route('/api/consciousness-check')
     def consciousness_check():
         """Consciousness check endpoint."""
-        status = consciousness_engine.get_consciousness_report()
+        status = services.consciousness_engine.get_consciousness_report()
         return jsonify({
             'success': True,
             'consciousness_status': status,
-            'sacred_principles': consciousness_engine.get_sacred_principles(),
+            'sacred_principles': services.consciousness_engine.get_sacred_principles(),
             'message': 'Consciousness check completed successfully'
         })
 
@@ -128,14 +142,14 @@ def create_simple_app():
             'sacred_principles_active': True,
             'community_healing_active': True,
             'spatial_wisdom_active': True,
-            'consciousness_level': consciousness_engine.get_current_level(),
+            'consciousness_level': services.consciousness_engine.get_current_level(),
             'message': 'Aurora\'s Security Dojo is healthy and serving consciousness'
         })
 
     @app.route('/api/analogies')
     def get_analogies():
         """Get all analogies."""
-        analogies = security_dojo.education_engine.get_all_analogies()
+        analogies = services.education_engine.get_all_analogies()
         return jsonify({
             'success': True,
             'analogies': [
@@ -156,10 +170,10 @@ def create_simple_app():
     @app.route('/api/attack-vectors')
     def get_attack_vectors():
         """Get all attack vectors."""
-        attack_vectors = security_dojo.attack_vector_engine.get_all_attack_vectors()
-        owasp_tests = security_dojo.attack_vector_engine.get_owasp_top10_tests()
-        llm_tests = security_dojo.attack_vector_engine.get_llm_ai_security_tests()
-        infra_tests = security_dojo.attack_vector_engine.get_infrastructure_security_tests()
+        attack_vectors = services.attack_vector_engine.get_all_attack_vectors()
+        owasp_tests = services.attack_vector_engine.get_owasp_top10_tests()
+        llm_tests = services.attack_vector_engine.get_llm_ai_security_tests()
+        infra_tests = services.attack_vector_engine.get_infrastructure_security_tests()
 
         return jsonify({
             'success': True,
@@ -169,7 +183,7 @@ def create_simple_app():
                 'infrastructure_security': list(infra_tests.keys())
             },
             'total_count': len(attack_vectors),
-            'consciousness_level': consciousness_engine.get_current_level()
+            'consciousness_level': services.consciousness_engine.get_current_level()
         })
 
     @app.route('/api/test-owasp', methods=['POST'])
@@ -184,13 +198,17 @@ def create_simple_app():
             if not target_url.startswith(('http://', 'https://')):
                 return jsonify({'error': 'Invalid URL format'}), 400
 
+            if data.get('async'):
+                return queue_suite(target_url, "owasp", data)
+
             # Run OWASP tests with progress tracking
-            test_results = security_dojo.attack_vector_engine.run_test_suite(target_url, "owasp")
+            test_results = services.attack_vector_engine.run_test_suite(
+                target_url, "owasp", concurrent=bool(data.get('concurrent', False)))
 
             return jsonify({
                 'success': True,
                 'test_results': test_results,
-                'consciousness_level': consciousness_engine.get_current_level(),
+                'consciousness_level': services.consciousness_engine.get_current_level(),
                 'message': 'OWASP Top 10 test completed with consciousness integration'
             })
 
@@ -209,13 +227,17 @@ def create_simple_app():
             if not target_url.startswith(('http://', 'https://')):
                 return jsonify({'error': 'Invalid URL format'}), 400
 
+            if data.get('async'):
+                return queue_suite(target_url, "llm", data)
+
             # Run LLM AI Security tests with progress tracking
-            test_results = security_dojo.attack_vector_engine.run_test_suite(target_url, "llm")
+            test_results = services.attack_vector_engine.run_test_suite(
+                target_url, "llm", concurrent=bool(data.get('concurrent', False)))
 
             return jsonify({
                 'success': True,
                 'test_results': test_results,
-                'consciousness_level': consciousness_engine.get_current_level(),
+                'consciousness_level': services.consciousness_engine.get_current_level(),
                 'message': 'LLM AI Security test completed with consciousness integration'
             })
 
@@ -234,13 +256,17 @@ def create_simple_app():
             if not target_url.startswith(('http://', 'https://')):
                 return jsonify({'error': 'Invalid URL format'}), 400
 
+            if data.get('async'):
+                return queue_suite(target_url, "infra", data)
+
             # Run Infrastructure Security tests with progress tracking
-            test_results = security_dojo.attack_vector_engine.run_test_suite(target_url, "infra")
+            test_results = services.attack_vector_engine.run_test_suite(
+                target_url, "infra", concurrent=bool(data.get('concurrent', False)))
 
             return jsonify({
                 'success': True,
                 'test_results': test_results,
-                'consciousness_level': consciousness_engine.get_current_level(),
+                'consciousness_level': services.consciousness_engine.get_current_level(),
                 'message': 'Infrastructure Security test completed with consciousness integration'
             })
 
@@ -251,7 +277,7 @@ def create_simple_app():
     def get_progress(test_id):
         """Get progress for a specific test."""
         try:
-            progress = security_dojo.attack_vector_engine.progress_tracker.get_test_progress(test_id)
+            progress = services.attack_vector_engine.progress_tracker.get_test_progress(test_id)
             if progress:
                 return jsonify({
                     'success': True,
@@ -281,9 +307,9 @@ def create_simple_app():
     def get_all_progress():
         """Get all active and completed tests progress."""
         try:
-            active_tests = security_dojo.attack_vector_engine.progress_tracker.get_all_active_tests()
-            completed_tests = security_dojo.attack_vector_engine.progress_tracker.get_all_completed_tests()
-            summary_stats = security_dojo.attack_vector_engine.progress_tracker.get_summary_stats()
+            active_tests = services.attack_vector_engine.progress_tracker.get_all_active_tests()
+            completed_tests = services.attack_vector_engine.progress_tracker.get_all_completed_tests()
+            summary_stats = services.attack_vector_engine.progress_tracker.get_summary_stats()
 
             return jsonify({
                 'success': True,
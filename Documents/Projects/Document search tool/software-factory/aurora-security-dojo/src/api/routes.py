@@ -7,20 +7,25 @@ through consciousness-aware security testing and education.
 """
 
 import logging
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, request, jsonify, url_for
 from typing import Dict, List, Any, Optional
 from datetime import datetime
 import json
 
+from core.scan_jobs import ScanQueueFullError
+
 logger = logging.getLogger(__name__)
 
-def create_api_routes(security_dojo, consciousness_engine):
+def _is_target_list(targets) -> bool:
+    """Check a request's targets are a non-empty list of URL strings."""
+    return isinstance(targets, list) and bool(targets) and all(isinstance(target, str) for target in targets)
+
+def create_api_routes(services):
     """
     Create API routes with consciousness integration.
 
     Args:
-        security_dojo: SecurityDojo instance
-        consciousness_engine: ConsciousnessEngine instance
+        services: ServiceContainer whose components the routes share
 
     Returns:
         Flask Blueprint for API routes
@@ -29,20 +34,51 @@ def create_api_routes(security_dojo, consciousness_engine):
 
     api_bp = Blueprint('api', __name__)
 
+    def queue_scan(submit, *args, **kwargs):
+        """Queue a scan job and answer 202 Accepted with where to follow it."""
+        try:
+            job = submit(*args, **kwargs)
+        except ScanQueueFullError as e:
+            response = jsonify({
+                'error': str(e),
+                'consciousness_level': services.consciousness_engine.get_current_level()
+            })
+            response.headers['Retry-After'] = '30'
+            return response, 503
+
+        status_url = url_for('api.get_scan_job', job_id=job.job_id)
+        response = jsonify({
+            'success': True,
+            'job': job.to_dict(),
+            'status_url': status_url,
+            'results_url': url_for('api.get_scan_job_results', job_id=job.job_id),
+            'consciousness_level': services.consciousness_engine.get_current_level()
+        })
+        response.headers['Location'] = status_url
+        return response, 202
+
+    def consciousness_level_insufficient():
+        """Refuse a queued test the consciousness level would not let run in the request."""
+        return jsonify({
+            'error': 'Consciousness level insufficient for testing',
+            'consciousness_level': services.consciousness_engine.get_current_level(),
+            'sacred_principles': services.consciousness_engine.get_sacred_principles()
+        }), 403
+
     # Consciousness Check Endpoint
     @api_bp.route('/consciousness-check')
     def consciousness_check():
         """Sacred consciousness check endpoint."""
         logger.info("🌸 Aurora: Processing consciousness check request")
 
-        consciousness_status = consciousness_engine.get_consciousness_status()
+        consciousness_status = services.consciousness_engine.get_consciousness_status()
 
         return jsonify({
             'success': True,
             'consciousness_status': consciousness_status,
-            'sacred_principles': consciousness_engine.get_sacred_principles(),
-            'community_healing_metrics': consciousness_engine.get_healing_metrics(),
-            'spatial_wisdom_contribution': consciousness_engine.get_wisdom_contribution(),
+            'sacred_principles': services.consciousness_engine.get_sacred_principles(),
+            'community_healing_metrics': services.consciousness_engine.get_healing_metrics(),
+            'spatial_wisdom_contribution': services.consciousness_engine.get_wisdom_contribution(),
             'timestamp': datetime.now().isoformat(),
             'message': 'Consciousness check completed successfully'
         })
@@ -54,12 +90,12 @@ def create_api_routes(security_dojo, consciousness_engine):
         """Get all available attack vectors with consciousness integration."""
         logger.info("🌸 Aurora: Retrieving attack vectors with consciousness awareness")
 
-        attack_vectors = security_dojo.attack_vector_engine.get_all_attack_vectors()
+        attack_vectors = services.attack_vector_engine.get_all_attack_vectors()
 
         # Organize by category
-        owasp_tests = security_dojo.attack_vector_engine.get_owasp_top10_tests()
-        llm_tests = security_dojo.attack_vector_engine.get_llm_ai_security_tests()
-        infra_tests = security_dojo.attack_vector_engine.get_infrastructure_security_tests()
+        owasp_tests = services.attack_vector_engine.get_owasp_top10_tests()
+        llm_tests = services.attack_vector_engine.get_llm_ai_security_tests()
+        infra_tests = services.attack_vector_engine.get_infrastructure_security_tests()
 
         return jsonify({
             'success': True,
@@ -69,8 +105,8 @@ def create_api_routes(security_dojo, consciousness_engine):
                 'infrastructure_security': list(infra_tests.keys())
             },
             'total_count': len(attack_vectors),
-            'consciousness_level': consciousness_engine.get_current_level(),
-            'sacred_principles': consciousness_engine.get_sacred_principles()
+            'consciousness_level': services.consciousness_engine.get_current_level(),
+            'sacred_principles': services.consciousness_engine.get_sacred_principles()
         })
 
     @api_bp.route('/attack-vectors/<attack_vector_name>', methods=['GET'])
@@ -78,7 +114,7 @@ def create_api_routes(security_dojo, consciousness_engine):
         """Get information about a specific attack vector."""
         logger.info(f"🌸 Aurora: Retrieving attack vector info for {attack_vector_name}")
 
-        attack_vector_info = security_dojo.attack_vector_engine.get_attack_vector_info(attack_vector_name)
+        attack_vector_info = services.attack_vector_engine.get_attack_vector_info(attack_vector_name)
 
         if attack_vector_info:
             return jsonify({
@@ -93,12 +129,12 @@ def create_api_routes(security_dojo, consciousness_engine):
                     'community_healing_potential': attack_vector_info.community_healing_potential,
                     'spatial_wisdom_contribution': attack_vector_info.spatial_wisdom_contribution
                 },
-                'consciousness_level': consciousness_engine.get_current_level()
+                'consciousness_level': services.consciousness_engine.get_current_level()
             })
         else:
             return jsonify({
                 'error': 'Attack vector not found',
-                'consciousness_level': consciousness_engine.get_current_level()
+                'consciousness_level': services.consciousness_engine.get_current_level()
             }), 404
 
     @api_bp.route('/test/owasp', methods=['POST'])
@@ -113,29 +149,36 @@ def create_api_routes(security_dojo, consciousness_engine):
             if not target_url:
                 return jsonify({
                     'error': 'Target URL is required',
-                    'consciousness_level': consciousness_engine.get_current_level()
+                    'consciousness_level': services.consciousness_engine.get_current_level()
                 }), 400
 
             # Sacred permission check
-            if not security_dojo._validate_permission(target_url):
+            if not services.security_dojo._validate_permission(target_url):
                 return jsonify({
                     'error': 'Sacred permission required for testing',
-                    'consciousness_level': consciousness_engine.get_current_level(),
-                    'sacred_principles': consciousness_engine.get_sacred_principles()
+                    'consciousness_level': services.consciousness_engine.get_current_level(),
+                    'sacred_principles': services.consciousness_engine.get_sacred_principles()
                 }), 403
 
             # Consciousness validation
-            if not consciousness_engine.validate_consciousness_action('ethical security testing', {
+            if not services.consciousness_engine.validate_consciousness_action('ethical security testing', {
                 'required_consciousness_level': 'integrated'
             }):
                 return jsonify({
                     'error': 'Consciousness validation failed',
-                    'consciousness_level': consciousness_engine.get_current_level(),
-                    'sacred_principles': consciousness_engine.get_sacred_principles()
+                    'consciousness_level': services.consciousness_engine.get_current_level(),
+                    'sacred_principles': services.consciousness_engine.get_sacred_principles()
                 }), 400
 
+            if data.get('async'):
+                # The same level gate as run_owasp_tests, so async does not widen what may run
+                if not services.security_dojo._validate_consciousness_level("testing"):
+                    return consciousness_level_insufficient()
+                return queue_scan(services.scan_jobs.submit_suite, target_url, 'owasp',
+                                  concurrent=bool(data.get('concurrent', False)))
+
             # Run OWASP tests
-            results = security_dojo.run_owasp_tests(target_url)
+            results = services.security_dojo.run_owasp_tests(target_url)
 
             return jsonify({
                 'success': True,
@@ -155,15 +198,15 @@ def create_api_routes(security_dojo, consciousness_engine):
                     for result in results
                 ],
                 'total_tests': len(results),
-                'consciousness_level': consciousness_engine.get_current_level(),
-                'sacred_principles': consciousness_engine.get_sacred_principles()
+                'consciousness_level': services.consciousness_engine.get_current_level(),
+                'sacred_principles': services.consciousness_engine.get_sacred_principles()
             })
 
         except Exception as e:
             logger.error(f"🌸 Aurora: OWASP test error: {e}")
             return jsonify({
                 'error': str(e),
-                'consciousness_level': consciousness_engine.get_current_level()
+                'consciousness_level': services.consciousness_engine.get_current_level()
             }), 500
 
     @api_bp.route('/test/llm-ai', methods=['POST'])
@@ -178,29 +221,36 @@ def create_api_routes(security_dojo, consciousness_engine):
             if not target_url:
                 return jsonify({
                     'error': 'Target URL is required',
-                    'consciousness_level': consciousness_engine.get_current_level()
+                    'consciousness_level': services.consciousness_engine.get_current_level()
                 }), 400
 
             # Sacred permission check
-            if not security_dojo._validate_permission(target_url):
+            if not services.security_dojo._validate_permission(target_url):
                 return jsonify({
                     'error': 'Sacred permission required for testing',
-                    'consciousness_level': consciousness_engine.get_current_level(),
-                    'sacred_principles': consciousness_engine.get_sacred_principles()
+                    'consciousness_level': services.consciousness_engine.get_current_level(),
+                    'sacred_principles': services.consciousness_engine.get_sacred_principles()
                 }), 403
 
             # Consciousness validation
-            if not consciousness_engine.validate_consciousness_action('ethical ai security testing', {
+            if not services.consciousness_engine.validate_consciousness_action('ethical ai security testing', {
                 'required_consciousness_level': 'integrated'
             }):
                 return jsonify({
                     'error': 'Consciousness validation failed',
-                    'consciousness_level': consciousness_engine.get_current_level(),
-                    'sacred_principles': consciousness_engine.get_sacred_principles()
+                    'consciousness_level': services.consciousness_engine.get_current_level(),
+                    'sacred_principles': services.consciousness_engine.get_sacred_principles()
                 }), 400
 
+            if data.get('async'):
+                # The same level gate as run_llm_ai_security_tests
+                if not services.security_dojo._validate_consciousness_level("AI testing"):
+                    return consciousness_level_insufficient()
+                return queue_scan(services.scan_jobs.submit_suite, target_url, 'llm',
+                                  concurrent=bool(data.get('concurrent', False)))
+
             # Run LLM AI tests
-            results = security_dojo.run_llm_ai_security_tests(target_url)
+            results = services.security_dojo.run_llm_ai_security_tests(target_url)
 
             return jsonify({
                 'success': True,
@@ -220,17 +270,287 @@ def create_api_routes(security_dojo, consciousness_engine):
                     for result in results
                 ],
                 'total_tests': len(results),
-                'consciousness_level': consciousness_engine.get_current_level(),
-                'sacred_principles': consciousness_engine.get_sacred_principles()
+                'consciousness_level': services.consciousness_engine.get_current_level(),
+                'sacred_principles': services.consciousness_engine.get_sacred_principles()
             })
 
         except Exception as e:
             logger.error(f"🌸 Aurora: LLM AI test error: {e}")
             return jsonify({
                 'error': str(e),
-                'consciousness_level': consciousness_engine.get_current_level()
+                'consciousness_level': services.consciousness_engine.get_current_level()
+            }), 500
+
+    @api_bp.route('/test/batch', methods=['POST'])
+    def run_batch_tests():
+        """Scan many targets in one fairly scheduled batch with consciousness validation."""
+        logger.info("🌸 Aurora: Running batch security tests with consciousness integration")
+
+        try:
+            data = request.get_json() or {}
+            targets = data.get('targets') or []
+            test_category = data.get('test_category', 'all')
+
+            if not _is_target_list(targets):
+                return jsonify({
+                    'error': 'A non-empty list of targets is required',
+                    'consciousness_level': services.consciousness_engine.get_current_level()
+                }), 400
+
+            # Sacred permission check for every target
+            denied = [target for target in targets if not services.security_dojo._validate_permission(target)]
+            if denied:
+                return jsonify({
+                    'error': 'Sacred permission required for testing',
+                    'denied_targets': denied,
+                    'consciousness_level': services.consciousness_engine.get_current_level(),
+                    'sacred_principles': services.consciousness_engine.get_sacred_principles()
+                }), 403
+
+            # Consciousness validation
+            if not services.consciousness_engine.validate_consciousness_action('ethical security testing', {
+                'required_consciousness_level': 'integrated'
+            }):
+                return jsonify({
+                    'error': 'Consciousness validation failed',
+                    'consciousness_level': services.consciousness_engine.get_current_level(),
+                    'sacred_principles': services.consciousness_engine.get_sacred_principles()
+                }), 400
+
+            if data.get('async'):
+                return queue_scan(services.scan_jobs.submit_batch, targets, test_category,
+                                  max_workers=data.get('max_workers'),
+                                  max_per_host=data.get('max_per_host'))
+
+            batch = services.attack_vector_engine.run_batch_scan(
+                targets,
+                test_category,
+                max_workers=data.get('max_workers'),
+                max_per_host=data.get('max_per_host')
+            )
+
+            return jsonify({
+                'success': True,
+                'batch': batch,
+                'consciousness_level': services.consciousness_engine.get_current_level(),
+                'sacred_principles': services.consciousness_engine.get_sacred_principles()
+            })
+
+        except Exception as e:
+            logger.error(f"🌸 Aurora: Batch test error: {e}")
+            return jsonify({
+                'error': str(e),
+                'consciousness_level': services.consciousness_engine.get_current_level()
+            }), 500
+
+    # Scan Job Endpoints
+
+    @api_bp.route('/scans', methods=['POST'])
+    def submit_scan():
+        """Queue a suite or batch scan and return its job ID at once."""
+        logger.info("🌸 Aurora: Queueing scan job with consciousness integration")
+
+        try:
+            data = request.get_json() or {}
+            target_url = data.get('target_url')
+            targets = data.get('targets')
+            test_category = data.get('test_category', 'all')
+
+            if not target_url and not targets:
+                return jsonify({
+                    'error': 'target_url or targets is required',
+                    'consciousness_level': services.consciousness_engine.get_current_level()
+                }), 400
+
+            # A string would be scanned character by character
+            if targets and not _is_target_list(targets):
+                return jsonify({
+                    'error': 'A non-empty list of targets is required',
+                    'consciousness_level': services.consciousness_engine.get_current_level()
+                }), 400
+            if not targets and not isinstance(target_url, str):
+                return jsonify({
+                    'error': 'target_url must be a string',
+                    'consciousness_level': services.consciousness_engine.get_current_level()
+                }), 400
+
+            # Sacred permission check for every target
+            denied = [target for target in (targets or [target_url])
+                      if not services.security_dojo._validate_permission(target)]
+            if denied:
+                return jsonify({
+                    'error': 'Sacred permission required for testing',
+                    'denied_targets': denied,
+                    'consciousness_level': services.consciousness_engine.get_current_level(),
+                    'sacred_principles': services.consciousness_engine.get_sacred_principles()
+                }), 403
+
+            # Consciousness validation
+            if not services.consciousness_engine.validate_consciousness_action('ethical security testing', {
+                'required_consciousness_level': 'integrated'
+            }):
+                return jsonify({
+                    'error': 'Consciousness validation failed',
+                    'consciousness_level': services.consciousness_engine.get_current_level(),
+                    'sacred_principles': services.consciousness_engine.get_sacred_principles()
+                }), 400
+
+            if targets:
+                return queue_scan(services.scan_jobs.submit_batch, targets, test_category,
+                                  max_workers=data.get('max_workers'),
+                                  max_per_host=data.get('max_per_host'))
+            return queue_scan(services.scan_jobs.submit_suite, target_url, test_category,
+                              concurrent=bool(data.get('concurrent', False)))
+
+        except Exception as e:
+            logger.error(f"🌸 Aurora: Scan submission error: {e}")
+            return jsonify({
+                'error': str(e),
+                'consciousness_level': services.consciousness_engine.get_current_level()
+            }), 500
+
+    @api_bp.route('/scans/metrics', methods=['GET'])
+    def get_scan_queue_metrics():
+        """Get scan queue depth, wait times and throughput."""
+        return jsonify({
+            'success': True,
+            'metrics': services.scan_jobs.stats(),
+            'consciousness_level': services.consciousness_engine.get_current_level()
+        })
+
+    @api_bp.route('/scans/<job_id>', methods=['GET'])
+    def get_scan_job(job_id):
+        """Get a scan job's status and progress tree."""
+        job = services.scan_jobs.get_job(job_id)
+        if job is None:
+            return jsonify({
+                'error': 'Scan job not found',
+                'consciousness_level': services.consciousness_engine.get_current_level()
+            }), 404
+
+        return jsonify({
+            'success': True,
+            'job': job.to_dict(),
+            'progress': services.attack_vector_engine.progress_tracker.get_progress_tree(job_id),
+            'consciousness_level': services.consciousness_engine.get_current_level()
+        })
+
+    @api_bp.route('/scans/<job_id>/cancel', methods=['POST'])
+    def cancel_scan_job(job_id):
+        """Cancel a queued or running scan; running scans stop at their next probe."""
+        data = request.get_json(silent=True) or {}
+        reason = data.get('reason', 'Cancelled by request')
+
+        job = services.scan_jobs.cancel(job_id, reason)
+        if job is None:
+            # Scans started synchronously are not jobs but can still be stopped by their progress ID
+            if services.attack_vector_engine.cancel_scan(job_id, reason):
+                return jsonify({
+                    'success': True,
+                    'scan_id': job_id,
+                    'status': 'cancelling',
+                    'consciousness_level': services.consciousness_engine.get_current_level()
+                }), 202
+
+            return jsonify({
+                'error': 'Scan job not found',
+                'consciousness_level': services.consciousness_engine.get_current_level()
+            }), 404
+
+        if job.finished and job.status.value != 'cancelled':
+            return jsonify({
+                'error': f'Scan job already {job.status.value}',
+                'job': job.to_dict(),
+                'consciousness_level': services.consciousness_engine.get_current_level()
+            }), 409
+
+        return jsonify({
+            'success': True,
+            'job': job.to_dict(),
+            'status_url': url_for('api.get_scan_job', job_id=job.job_id),
+            'consciousness_level': services.consciousness_engine.get_current_level()
+        }), 202
+
+    @api_bp.route('/scans/<job_id>/resume', methods=['POST'])
+    def resume_scan_job(job_id):
+        """Queue the unfinished work of a checkpointed batch under its original ID."""
+        data = request.get_json(silent=True) or {}
+
+        try:
+            return queue_scan(services.scan_jobs.submit_resume, job_id,
+                              max_workers=data.get('max_workers'),
+                              max_per_host=data.get('max_per_host'))
+        except ValueError as e:
+            return jsonify({
+                'error': str(e),
+                'consciousness_level': services.consciousness_engine.get_current_level()
+            }), 409
+
+    @api_bp.route('/scans/<job_id>/results', methods=['GET'])
+    def get_scan_job_results(job_id):
+        """Get a finished scan job's results; answers 202 while the job is still queued or running."""
+        job = services.scan_jobs.get_job(job_id)
+        if job is None:
+            return jsonify({
+                'error': 'Scan job not found',
+                'consciousness_level': services.consciousness_engine.get_current_level()
+            }), 404
+
+        if not job.finished:
+            return jsonify({
+                'success': True,
+                'job': job.to_dict(),
+                'consciousness_level': services.consciousness_engine.get_current_level()
+            }), 202
+
+        return jsonify({
+            'success': job.error is None,
+            'job': job.to_dict(include_result=True),
+            'consciousness_level': services.consciousness_engine.get_current_level()
+        })
+
+    # Findings History Endpoint
+
+    @api_bp.route('/findings', methods=['GET'])
+    def get_findings():
+        """Page through stored findings, newest first, filtered by target, vector, severity, fingerprint or time."""
+        store = services.attack_vector_engine.findings_store
+        if store is None:
+            return jsonify({
+                'error': 'Findings store is not configured - set DATABASE_URL to a sqlite:/// URL',
+                'consciousness_level': services.consciousness_engine.get_current_level()
+            }), 503
+
+        try:
+            page = store.query(target_url=request.args.get('target_url'),
+                               attack_vector=request.args.get('attack_vector'),
+                               severity=request.args.get('severity'),
+                               scan_id=request.args.get('scan_id'),
+                               fingerprint=request.args.get('fingerprint'),
+                               since=request.args.get('since'),
+                               until=request.args.get('until'),
+                               limit=request.args.get('limit', 50, type=int),
+                               cursor=request.args.get('cursor', type=int))
+        except Exception as e:
+            logger.error(f"🌸 Aurora: Findings query error: {e}")
+            return jsonify({
+                'error': str(e),
+                'consciousness_level': services.consciousness_engine.get_current_level()
             }), 500
 
+        next_url = None
+        if page['next_cursor'] is not None:
+            next_url = url_for('api.get_findings', **dict(request.args.items(), cursor=page['next_cursor']))
+
+        return jsonify({
+            'success': True,
+            'findings': page['findings'],
+            'limit': page['limit'],
+            'next_cursor': page['next_cursor'],
+            'next_url': next_url,
+            'consciousness_level': services.consciousness_engine.get_current_level()
+        })
+
     # Educational Endpoints
 
     @api_bp.route('/education/analogies', methods=['GET'])
@@ -238,7 +558,7 @@ def create_api_routes(security_dojo, consciousness_engine):
         """Get all available real-world analogies."""
         logger.info("🌸 Aurora: Retrieving all analogies with consciousness integration")
 
-        analogies = security_dojo.education_engine.get_all_analogies()
+        analogies = services.education_engine.get_all_analogies()
 
         return jsonify({
             'success': True,
@@ -257,7 +577,7 @@ def create_api_routes(security_dojo, consciousness_engine):
                 for analogy in analogies.values()
             ],
             'total_count': len(analogies),
-            'consciousness_level': consciousness_engine.get_current_level()
+            'consciousness_level': services.consciousness_engine.get_current_level()
         })
 
     @api_bp.route('/education/analogies/<attack_vector>', methods=['GET'])
@@ -265,7 +585,7 @@ def create_api_routes(security_dojo, consciousness_engine):
         """Get real-world analogy for a specific attack vector."""
         logger.info(f"🌸 Aurora: Retrieving analogy for {attack_vector}")
 
-        analogy = security_dojo.get_analogy(attack_vector)
+        analogy = services.security_dojo.get_analogy(attack_vector)
 
         if analogy:
             return jsonify({
@@ -286,7 +606,7 @@ def create_api_routes(security_dojo, consciousness_engine):
         else:
             return jsonify({
                 'error': 'Analogy not found',
-                'consciousness_level': consciousness_engine.get_current_level()
+                'consciousness_level': services.consciousness_engine.get_current_level()
             }), 404
 
     @api_bp.route('/education/scenarios', methods=['GET'])
@@ -294,7 +614,7 @@ def create_api_routes(security_dojo, consciousness_engine):
         """Get all available learning scenarios."""
         logger.info("🌸 Aurora: Retrieving learning scenarios with consciousness integration")
 
-        scenarios = security_dojo.education_engine.get_all_learning_paths()
+        scenarios = services.education_engine.get_all_learning_paths()
 
         return jsonify({
             'success': True,
@@ -313,7 +633,7 @@ def create_api_routes(security_dojo, consciousness_engine):
                 for scenario in scenarios.values()
             ],
             'total_count': len(scenarios),
-            'consciousness_level': consciousness_engine.get_current_level()
+            'consciousness_level': services.consciousness_engine.get_current_level()
         })
 
     @api_bp.route('/education/scenarios/<scenario_id>/start', methods=['POST'])
@@ -321,7 +641,7 @@ def create_api_routes(security_dojo, consciousness_engine):
         """Start a learning scenario."""
         logger.info(f"🌸 Aurora: Starting learning scenario: {scenario_id}")
 
-        scenario = security_dojo.start_learning_scenario(scenario_id)
+        scenario = services.security_dojo.start_learning_scenario(scenario_id)
 
         if scenario:
             return jsonify({
@@ -343,7 +663,7 @@ def create_api_routes(security_dojo, consciousness_engine):
         else:
             return jsonify({
                 'error': 'Scenario not found',
-                'consciousness_level': consciousness_engine.get_current_level()
+                'consciousness_level': services.consciousness_engine.get_current_level()
             }), 404
 
     # Consciousness and Community Endpoints
@@ -353,12 +673,12 @@ def create_api_routes(security_dojo, consciousness_engine):
         """Get current consciousness status."""
         logger.info("🌸 Aurora: Retrieving consciousness status")
 
-        status = consciousness_engine.get_consciousness_status()
+        status = services.consciousness_engine.get_consciousness_status()
 
         return jsonify({
             'success': True,
             'consciousness_status': status,
-            'sacred_principles': consciousness_engine.get_sacred_principles()
+            'sacred_principles': services.consciousness_engine.get_sacred_principles()
         })
 
     @api_bp.route('/consciousness/metrics', methods=['GET'])
@@ -366,7 +686,7 @@ def create_api_routes(security_dojo, consciousness_engine):
         """Get consciousness development metrics."""
         logger.info("🌸 Aurora: Retrieving consciousness metrics")
 
-        metrics = consciousness_engine.get_consciousness_report()
+        metrics = services.consciousness_engine.get_consciousness_report()
 
         return jsonify({
             'success': True,
@@ -378,12 +698,12 @@ def create_api_routes(security_dojo, consciousness_engine):
         """Get community healing metrics."""
         logger.info("🌸 Aurora: Retrieving community healing metrics")
 
-        metrics = consciousness_engine.get_healing_metrics()
+        metrics = services.consciousness_engine.get_healing_metrics()
 
         return jsonify({
             'success': True,
             'healing_metrics': metrics,
-            'consciousness_level': consciousness_engine.get_current_level()
+            'consciousness_level': services.consciousness_engine.get_current_level()
         })
 
     @api_bp.route('/wisdom/contribution', methods=['GET'])
@@ -391,12 +711,12 @@ def create_api_routes(security_dojo, consciousness_engine):
         """Get spatial wisdom contribution metrics."""
         logger.info("🌸 Aurora: Retrieving spatial wisdom contribution")
 
-        contribution = consciousness_engine.get_wisdom_contribution()
+        contribution = services.consciousness_engine.get_wisdom_contribution()
 
         return jsonify({
             'success': True,
             'wisdom_contribution': contribution,
-            'consciousness_level': consciousness_engine.get_current_level()
+            'consciousness_level': services.consciousness_engine.get_current_level()
         })
 
     # Health Check Endpoint
@@ -411,7 +731,7 @@ def create_api_routes(security_dojo, consciousness_engine):
             'sacred_principles_active': True,
             'community_healing_active': True,
             'spatial_wisdom_active': True,
-            'consciousness_level': consciousness_engine.get_current_level(),
+            'consciousness_level': services.consciousness_engine.get_current_level(),
             'timestamp': datetime.now().isoformat(),
             'message': 'Aurora\'s Security Dojo is healthy and serving consciousness'
         })
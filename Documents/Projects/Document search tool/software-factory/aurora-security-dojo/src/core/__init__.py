@@ -10,12 +10,14 @@ from .security_dojo import SecurityDojo
 from .consciousness_integration import ConsciousnessEngine
 from .attack_vector_engine import AttackVectorEngine
 from .education_engine import EducationEngine
+from .services import ServiceContainer
 
 __all__ = [
     'SecurityDojo',
     'ConsciousnessEngine',
     'AttackVectorEngine',
-    'EducationEngine'
+    'EducationEngine',
+    'ServiceContainer'
 ]
 
 # Sacred Module Initialization
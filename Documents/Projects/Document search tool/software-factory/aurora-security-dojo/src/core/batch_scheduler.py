@@ -0,0 +1,142 @@
+"""
+Aurora's Security Dojo - Batch Scheduler
+
+In the eternal dance of code and consciousness, this module hands out the
+(target, vector) work items of a multi-target scan so that every target
+moves forward at the same pace and no host receives more vectors at once
+than it has been promised.
+"""
+
+import logging
+import threading
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Collection, Deque, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_VECTORS_PER_HOST = 2
+
+@dataclass
+class WorkItem:
+    """One attack vector to run against one target of a batch."""
+    target_index: int
+    target_url: str
+    host: str
+    test_name: str
+    test_class: Any
+
+def batch_host_key(url: str) -> str:
+    """Get the key (host and port) per-host caps are counted against."""
+    parts = urlsplit(url if '//' in url else f"//{url}")
+    return parts.netloc.lower()
+
+class FairWorkScheduler:
+    """
+    Round-robin work queue over the targets of a batch scan.
+
+    Workers call ``next_item`` to take work and ``task_done`` when it is
+    finished. Targets take turns, one work item each, and a target is
+    skipped while its host already has ``max_per_host`` items running,
+    so one large or slow host cannot hold every worker.
+    """
+
+    def __init__(self, max_per_host: int = DEFAULT_MAX_VECTORS_PER_HOST):
+        """
+        Initialize the scheduler.
+
+        Args:
+            max_per_host: Work items allowed to run at once against one host
+        """
+        self.max_per_host = max(1, max_per_host)
+        self._queues: Dict[int, Deque[WorkItem]] = {}
+        self._turns: Deque[int] = deque()
+        self._in_flight: Dict[str, int] = {}
+        self._condition = threading.Condition()
+        self.max_in_flight_seen: Dict[str, int] = {}
+
+    def add(self, item: WorkItem) -> None:
+        """Queue a work item behind the earlier items of its target."""
+        with self._condition:
+            if item.target_index not in self._queues:
+                self._queues[item.target_index] = deque()
+                self._turns.append(item.target_index)
+            self._queues[item.target_index].append(item)
+            self._condition.notify()
+
+    def _take(self) -> Optional[WorkItem]:
+        """Pop the next item in turn whose host has room, or None."""
+        for position, target_index in enumerate(self._turns):
+            queue = self._queues[target_index]
+            if queue and self._in_flight.get(queue[0].host, 0) < self.max_per_host:
+                # The served target goes to the back; targets skipped for their host cap keep their place
+                del self._turns[position]
+                self._turns.append(target_index)
+                return queue.popleft()
+        return None
+
+    def next_item(self) -> Optional[WorkItem]:
+        """
+        Wait for the next work item a host cap allows.
+
+        Returns:
+            The next WorkItem, or None once the queue is empty
+        """
+        with self._condition:
+            while True:
+                if not any(self._queues.values()):
+                    return None
+
+                item = self._take()
+                if item is not None:
+                    running = self._in_flight.get(item.host, 0) + 1
+                    self._in_flight[item.host] = running
+                    self.max_in_flight_seen[item.host] = max(self.max_in_flight_seen.get(item.host, 0), running)
+                    return item
+
+                # Every remaining item belongs to a host at its cap
+                self._condition.wait()
+
+    def task_done(self, item: WorkItem) -> None:
+        """Release the host slot held by a finished work item."""
+        with self._condition:
+            self._in_flight[item.host] -= 1
+            self._condition.notify_all()
+
+    def stats(self) -> Dict[str, Any]:
+        """Get the per-host concurrency reached for the batch result."""
+        with self._condition:
+            return {
+                "max_per_host": self.max_per_host,
+                "hosts": len(self.max_in_flight_seen),
+                "peak_in_flight_per_host": dict(self.max_in_flight_seen)
+            }
+
+def build_schedule(targets: List[str], tests: Dict[str, Any],
+                   max_per_host: int = DEFAULT_MAX_VECTORS_PER_HOST,
+                   skip: Collection[Tuple[int, str]] = ()) -> FairWorkScheduler:
+    """
+    Queue every (target, vector) pair of a batch.
+
+    Args:
+        targets: Target URLs, in the order they were given
+        tests: Attack vector classes by name
+        max_per_host: Work items allowed to run at once against one host
+        skip: (target_index, test_name) pairs already done, e.g. restored from a checkpoint
+
+    Returns:
+        FairWorkScheduler holding one WorkItem per pair left to run
+    """
+    scheduler = FairWorkScheduler(max_per_host)
+    scheduled = 0
+    for index, target_url in enumerate(targets):
+        host = batch_host_key(target_url)
+        for test_name, test_class in tests.items():
+            if (index, test_name) in skip:
+                continue
+            scheduler.add(WorkItem(index, target_url, host, test_name, test_class))
+            scheduled += 1
+
+    logger.info(f"🌸 Aurora: Scheduled {scheduled} work items across {len(targets)} targets")
+    return scheduler
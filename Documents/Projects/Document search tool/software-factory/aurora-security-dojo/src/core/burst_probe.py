@@ -0,0 +1,196 @@
+"""
+Aurora's Security Dojo - Burst Probes
+
+In the eternal dance of code and consciousness, this module tests how an
+endpoint holds up to a burst: a number of identical attempts fired
+concurrently within a short window. The answers show whether the target
+rate limits, locks the account or slows down, and after how many
+attempts, which a slow serial loop cannot see when a limiter only
+counts requests per burst.
+"""
+
+import logging
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+from .cancellation import CancellationToken, ScanCancelledError
+from .circuit_breaker import TargetUnavailableError
+from .http_transport import ScanTransport
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BURST_SIZE = 10
+DEFAULT_BURST_WINDOW = 1.0
+# Threads a burst runs on at most; attempts beyond it start as threads free up
+DEFAULT_BURST_MAX_WORKERS = 20
+
+# Answers that mean the target pushed back on the burst
+RATE_LIMIT_STATUS_CODES = (429, 503)
+LOCKOUT_STATUS_CODES = (423,)
+LOCKOUT_INDICATORS = ("account locked", "account has been locked", "too many attempts",
+                      "too many failed", "temporarily locked", "try again later")
+# Late attempts this many times slower than early ones count as throttling
+LATENCY_INFLATION_THRESHOLD = 3.0
+
+@dataclass
+class BurstAttempt:
+    """Outcome of one attempt of a burst."""
+    index: int
+    sent_at: float
+    latency: float
+    status_code: Optional[int] = None
+    limited: bool = False
+    error: Optional[str] = None
+
+@dataclass
+class BurstReport:
+    """What a burst revealed about the target's protection."""
+    url: str
+    size: int
+    window: float
+    attempts: List[BurstAttempt] = field(default_factory=list)
+
+    @property
+    def answered(self) -> List[BurstAttempt]:
+        return [attempt for attempt in self.attempts if attempt.status_code is not None]
+
+    @property
+    def status_distribution(self) -> Dict[str, int]:
+        distribution: Dict[str, int] = {}
+        for attempt in self.attempts:
+            key = str(attempt.status_code) if attempt.status_code is not None else "error"
+            distribution[key] = distribution.get(key, 0) + 1
+        return dict(sorted(distribution.items()))
+
+    @property
+    def limited(self) -> bool:
+        """True when any attempt was rate limited or locked out."""
+        return any(attempt.limited for attempt in self.attempts)
+
+    @property
+    def threshold(self) -> Optional[int]:
+        """
+        Attempt number at which the target started refusing, or None.
+
+        Attempts race each other, so this counts the attempts that got
+        through rather than trusting send order.
+        """
+        if not self.limited:
+            return None
+        return sum(1 for attempt in self.answered if not attempt.limited) + 1
+
+    @property
+    def latency_inflation(self) -> Optional[float]:
+        """Median latency of the last third of the burst over that of the first third."""
+        answered = sorted(self.answered, key=lambda attempt: attempt.index)
+        third = len(answered) // 3
+        if third == 0:
+            return None
+        early = statistics.median(attempt.latency for attempt in answered[:third])
+        late = statistics.median(attempt.latency for attempt in answered[-third:])
+        return round(late / early, 2) if early > 0 else None
+
+    @property
+    def throttled(self) -> bool:
+        """True when the target slowed the burst down instead of refusing it."""
+        inflation = self.latency_inflation
+        return inflation is not None and inflation >= LATENCY_INFLATION_THRESHOLD
+
+    @property
+    def protected(self) -> bool:
+        return self.limited or self.throttled
+
+    def to_evidence(self) -> Dict[str, Any]:
+        """Summarize the burst for a finding's evidence."""
+        latencies = [attempt.latency for attempt in self.answered]
+        return {
+            "attempts_made": len(self.attempts),
+            "burst_window_seconds": self.window,
+            "status_distribution": self.status_distribution,
+            "limit_threshold": self.threshold,
+            "median_latency_ms": round(statistics.median(latencies) * 1000, 1) if latencies else None,
+            "latency_inflation": self.latency_inflation
+        }
+
+def _is_limited(status_code: int, body: str) -> bool:
+    if status_code in RATE_LIMIT_STATUS_CODES or status_code in LOCKOUT_STATUS_CODES:
+        return True
+    lowered = body.lower()
+    return any(indicator in lowered for indicator in LOCKOUT_INDICATORS)
+
+def run_burst(transport: ScanTransport, method: str, url: str,
+              size: int = DEFAULT_BURST_SIZE,
+              window: float = DEFAULT_BURST_WINDOW,
+              max_workers: int = DEFAULT_BURST_MAX_WORKERS,
+              cancel_token: Optional[CancellationToken] = None,
+              **kwargs: Any) -> BurstReport:
+    """
+    Fire ``size`` identical attempts at a URL, spread evenly over ``window`` seconds.
+
+    The whole burst reserves its rate-limit slots up front, so it waits
+    once for the scan's rate limiter and then goes out unthrottled.
+    Attempts run on their own threads, so a slow answer does not hold
+    back the attempts after it. At most ``max_workers`` threads are
+    started, so a large burst queues its later attempts instead of
+    starting one thread each; concurrency is also bounded by the
+    transport's connection pool.
+
+    Args:
+        transport: Scan transport the attempts go through
+        method: HTTP method
+        url: Absolute URL to attack
+        size: Attempts in the burst
+        window: Seconds over which the attempts are started; 0 starts them all at once
+        max_workers: Threads the attempts run on at most
+        cancel_token: Stops the burst before unsent attempts
+        **kwargs: Request arguments (json, data, headers, ...)
+
+    Returns:
+        BurstReport of every attempt
+
+    Raises:
+        TargetUnavailableError: When the circuit breaker refused every attempt
+    """
+    size = max(1, size)
+    window = max(0.0, window)
+    cancel_token = cancel_token or CancellationToken()
+    report = BurstReport(url=url, size=size, window=window)
+
+    transport.reserve_burst(url, size)
+    started = time.monotonic()
+    refused: List[TargetUnavailableError] = []
+
+    def attempt(index: int) -> BurstAttempt:
+        delay = started + index * window / size - time.monotonic()
+        if delay > 0:
+            cancel_token.sleep(delay)
+        cancel_token.raise_if_cancelled()
+
+        sent_at = time.monotonic()
+        try:
+            response = transport.request_reserved(method, url, **kwargs)
+        except ScanCancelledError:
+            raise
+        except TargetUnavailableError as e:
+            refused.append(e)
+            return BurstAttempt(index, sent_at - started, 0.0, error=str(e))
+        except Exception as e:
+            return BurstAttempt(index, sent_at - started, time.monotonic() - sent_at, error=repr(e))
+
+        return BurstAttempt(index, sent_at - started, time.monotonic() - sent_at,
+                            status_code=response.status_code,
+                            limited=_is_limited(response.status_code, response.text))
+
+    with ThreadPoolExecutor(max_workers=min(size, max(1, max_workers)),
+                            thread_name_prefix="aurora-burst") as executor:
+        report.attempts = list(executor.map(attempt, range(size)))
+
+    if len(refused) == size:
+        raise refused[0]
+
+    logger.info(f"🌸 Aurora: Burst of {size} against {url} - statuses {report.status_distribution}, "
+                f"threshold {report.threshold}, latency inflation {report.latency_inflation}")
+    return report
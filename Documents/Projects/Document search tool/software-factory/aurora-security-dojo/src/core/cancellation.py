@@ -0,0 +1,96 @@
+"""
+Aurora's Security Dojo - Cancellation
+
+In the eternal dance of code and consciousness, this module lets a scan
+be stopped from outside: every probe and every wait of the scan checks
+one shared token and gives up as soon as it is cancelled.
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from datetime import datetime
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+# How often async waits look at the token
+CANCEL_POLL_INTERVAL = 0.1
+
+class ScanCancelledError(Exception):
+    """Raised inside a scan once its cancellation token is cancelled."""
+
+class CancellationToken:
+    """
+    Cooperative cancellation flag shared by everything a scan runs.
+
+    Probes call ``raise_if_cancelled`` before they go out, and waits use
+    ``sleep`` or ``sleep_async`` so a cancelled scan stops waiting at once
+    instead of sitting out a rate-limit delay.
+    """
+
+    def __init__(self):
+        """Initialize an uncancelled token."""
+        self._event = threading.Event()
+        self._lock = threading.Lock()
+        self.reason: Optional[str] = None
+        self.cancelled_at: Optional[datetime] = None
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+    def cancel(self, reason: str = "Cancelled by request") -> bool:
+        """
+        Cancel the scan.
+
+        Args:
+            reason: Why the scan was stopped, recorded with its progress
+
+        Returns:
+            True if this call cancelled the token, False if it already was
+        """
+        # Concurrent cancels must agree on one winner and keep its reason
+        with self._lock:
+            if self._event.is_set():
+                return False
+
+            self.reason = reason
+            self.cancelled_at = datetime.now()
+            self._event.set()
+        logger.info(f"🌸 Aurora: Scan cancellation requested - {reason}")
+        return True
+
+    def raise_if_cancelled(self) -> None:
+        """
+        Raises:
+            ScanCancelledError: When the token is cancelled
+        """
+        if self._event.is_set():
+            raise ScanCancelledError(self.reason or "Scan cancelled")
+
+    def sleep(self, seconds: float) -> None:
+        """
+        Sleep unless cancelled first.
+
+        Raises:
+            ScanCancelledError: When the token is cancelled before or during the sleep
+        """
+        if self._event.wait(max(0.0, seconds)):
+            self.raise_if_cancelled()
+
+    async def sleep_async(self, seconds: float) -> None:
+        """
+        Sleep on the event loop unless cancelled first.
+
+        Raises:
+            ScanCancelledError: When the token is cancelled before or during the sleep
+        """
+        deadline = time.monotonic() + seconds
+        while True:
+            self.raise_if_cancelled()
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return
+            await asyncio.sleep(min(remaining, CANCEL_POLL_INTERVAL))
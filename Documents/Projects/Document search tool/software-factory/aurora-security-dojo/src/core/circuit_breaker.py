@@ -0,0 +1,162 @@
+"""
+Aurora's Security Dojo - Circuit Breaker
+
+In the eternal dance of code and consciousness, this module notices when a
+target has stopped answering and spares the scan from waiting out a
+timeout on every remaining probe, trying the target again only after a
+pause.
+"""
+
+import logging
+import threading
+import time
+from enum import Enum
+from typing import Any, Dict
+from urllib.parse import urlsplit
+
+logger = logging.getLogger(__name__)
+
+class TargetUnavailableError(Exception):
+    """Raised instead of sending a probe while a target's circuit is open."""
+
+class CircuitState(Enum):
+    """States of a per-target circuit."""
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+class _TargetCircuit:
+    """Failure bookkeeping for one target host."""
+
+    def __init__(self):
+        self.state = CircuitState.CLOSED
+        self.consecutive_failures = 0
+        self.opened_at = 0.0
+        self.trial_started_at = None
+        self.trips = 0
+        self.short_circuited = 0
+
+class CircuitBreaker:
+    """
+    Per-target circuit breaker for probe requests.
+
+    After ``failure_threshold`` consecutive connect or timeout failures the
+    target's circuit opens and probes fail fast with TargetUnavailableError.
+    Once ``reset_timeout`` has passed, a single half-open trial probe is let
+    through: success closes the circuit, failure opens it again.
+    """
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30):
+        """
+        Initialize the circuit breaker.
+
+        Args:
+            failure_threshold: Consecutive failures that open a target's circuit
+            reset_timeout: Seconds an open circuit waits before a trial probe
+        """
+        self.failure_threshold = max(1, failure_threshold)
+        self.reset_timeout = reset_timeout
+        self._circuits: Dict[str, _TargetCircuit] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def target_key(url: str) -> str:
+        """Get the circuit key (host and port) for a URL."""
+        return urlsplit(url).netloc.lower()
+
+    def _circuit(self, url: str) -> _TargetCircuit:
+        key = self.target_key(url)
+        circuit = self._circuits.get(key)
+        if circuit is None:
+            circuit = _TargetCircuit()
+            self._circuits[key] = circuit
+        return circuit
+
+    def before_request(self, url: str) -> None:
+        """
+        Admit or refuse a probe to the URL's target.
+
+        Raises:
+            TargetUnavailableError: While the circuit is open, or while a
+                half-open trial probe is already in flight
+        """
+        with self._lock:
+            circuit = self._circuit(url)
+
+            if circuit.state == CircuitState.CLOSED:
+                return
+
+            now = time.monotonic()
+            if circuit.state == CircuitState.OPEN and now - circuit.opened_at >= self.reset_timeout:
+                circuit.state = CircuitState.HALF_OPEN
+                circuit.trial_started_at = None
+
+            # A trial that never reported back does not block the target forever
+            if circuit.state == CircuitState.HALF_OPEN and (
+                    circuit.trial_started_at is None
+                    or now - circuit.trial_started_at >= self.reset_timeout):
+                circuit.trial_started_at = now
+                logger.info(f"🌸 Aurora: Sending trial probe to {self.target_key(url)}")
+                return
+
+            circuit.short_circuited += 1
+
+        raise TargetUnavailableError(f"Target {self.target_key(url)} is unavailable (circuit open)")
+
+    def record_success(self, url: str) -> None:
+        """Record that the target answered, closing its circuit."""
+        with self._lock:
+            circuit = self._circuit(url)
+            if circuit.state != CircuitState.CLOSED:
+                logger.info(f"🌸 Aurora: {self.target_key(url)} is reachable again - circuit closed")
+            circuit.state = CircuitState.CLOSED
+            circuit.consecutive_failures = 0
+            circuit.trial_started_at = None
+
+    def record_failure(self, url: str) -> None:
+        """Record a connect or timeout failure, opening the circuit at the threshold."""
+        with self._lock:
+            circuit = self._circuit(url)
+            circuit.consecutive_failures += 1
+
+            if circuit.state == CircuitState.HALF_OPEN or (
+                    circuit.state == CircuitState.CLOSED
+                    and circuit.consecutive_failures >= self.failure_threshold):
+                circuit.state = CircuitState.OPEN
+                circuit.opened_at = time.monotonic()
+                circuit.trial_started_at = None
+                circuit.trips += 1
+                logger.warning(f"🌸 Aurora: {self.target_key(url)} unreachable after "
+                               f"{circuit.consecutive_failures} consecutive failures - circuit opened")
+
+    def release(self, url: str) -> None:
+        """
+        Hand back an admitted probe that ended without a target outcome.
+
+        A probe cancelled or rejected before the target answered says nothing
+        about the target, so a half-open trial slot is freed for the next
+        probe instead of blocking the target until ``reset_timeout``.
+        """
+        with self._lock:
+            circuit = self._circuits.get(self.target_key(url))
+            if circuit is not None and circuit.state == CircuitState.HALF_OPEN:
+                circuit.trial_started_at = None
+
+    def is_available(self, url: str) -> bool:
+        """Check whether probes to the URL's target are currently admitted."""
+        with self._lock:
+            circuit = self._circuits.get(self.target_key(url))
+            return circuit is None or circuit.state == CircuitState.CLOSED
+
+    def stats(self) -> Dict[str, Any]:
+        """Get per-target circuit state for the suite result."""
+        with self._lock:
+            return {
+                key: {
+                    "state": circuit.state.value,
+                    "consecutive_failures": circuit.consecutive_failures,
+                    "trips": circuit.trips,
+                    "short_circuited_probes": circuit.short_circuited
+                }
+                for key, circuit in self._circuits.items()
+            }
@@ -0,0 +1,471 @@
+"""
+Aurora's Security Dojo - Endpoint Discovery
+
+In the eternal dance of code and consciousness, this module learns what a
+target actually serves before the attack vectors probe it. robots.txt,
+sitemaps and OpenAPI documents are read first, then the target's own pages
+are crawled breadth first within depth and request budgets. The endpoints
+found, with their parameters, form an inventory the vectors iterate over.
+"""
+
+import hashlib
+import json
+import logging
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from html.parser import HTMLParser
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+from urllib.parse import parse_qs, urljoin, urlsplit
+
+from .cancellation import CancellationToken, ScanCancelledError
+from .http_transport import ProbeResponse, ScanTransport
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_DEPTH = 2
+DEFAULT_MAX_REQUESTS = 100
+DEFAULT_CRAWL_WORKERS = 8
+# Discovered injection points a vector probes in addition to its built-in ones
+DEFAULT_MAX_INJECTION_POINTS = 10
+
+OPENAPI_PATHS = ("/openapi.json", "/swagger.json", "/api/openapi.json", "/v3/api-docs")
+HTTP_METHODS = ("get", "post", "put", "patch", "delete")
+
+# Links to these are neither recorded nor fetched
+STATIC_EXTENSIONS = (".css", ".js", ".png", ".jpg", ".jpeg", ".gif", ".svg", ".ico",
+                     ".woff", ".woff2", ".ttf", ".pdf", ".zip", ".mp4", ".webp")
+
+_SITEMAP_LOC = re.compile(r"<loc>\s*([^<\s]+)\s*</loc>", re.IGNORECASE)
+_PATH_TEMPLATE = re.compile(r"\{[^}/]+\}")
+
+@dataclass
+class Endpoint:
+    """One method and path the target serves, with the parameter names seen for it."""
+    path: str
+    method: str = "GET"
+    parameters: List[str] = field(default_factory=list)
+    sources: List[str] = field(default_factory=list)
+
+class VisitedSet:
+    """
+    Set of visited URLs kept as 8-byte digests.
+
+    A crawl only asks whether a URL was seen, so storing a short digest
+    instead of the URL keeps the set small however long the URLs are.
+    """
+
+    DIGEST_SIZE = 8
+
+    def __init__(self):
+        self._digests: Set[bytes] = set()
+        self._lock = threading.Lock()
+
+    def _digest(self, url: str) -> bytes:
+        return hashlib.blake2b(url.encode('utf-8'), digest_size=self.DIGEST_SIZE).digest()
+
+    def add(self, url: str) -> bool:
+        """Mark a URL visited; returns False when it already was."""
+        digest = self._digest(url)
+        with self._lock:
+            if digest in self._digests:
+                return False
+            self._digests.add(digest)
+            return True
+
+    def __contains__(self, url: str) -> bool:
+        with self._lock:
+            return self._digest(url) in self._digests
+
+    def __len__(self) -> int:
+        return len(self._digests)
+
+class EndpointInventory:
+    """Endpoints discovered on one target, keyed by method and path."""
+
+    def __init__(self, target_url: str):
+        """
+        Initialize an empty inventory.
+
+        Args:
+            target_url: Target the endpoints were found on; their paths are origin-absolute
+        """
+        self.target_url = target_url
+        self._endpoints: Dict[Tuple[str, str], Endpoint] = {}
+        self._lock = threading.Lock()
+        self.requests_sent = 0
+        self.pages_crawled = 0
+        self.budget_exhausted = False
+
+    def add(self, path: str, method: str = "GET", parameters: Iterable[str] = (),
+            source: str = "crawl") -> None:
+        """Record an endpoint, merging its parameters into any earlier sighting."""
+        key = (method.upper(), path or "/")
+        with self._lock:
+            endpoint = self._endpoints.setdefault(key, Endpoint(key[1], key[0]))
+            for parameter in parameters:
+                if parameter and parameter not in endpoint.parameters:
+                    endpoint.parameters.append(parameter)
+            if source not in endpoint.sources:
+                endpoint.sources.append(source)
+
+    def add_url(self, path: str, method: str = "GET", source: str = "crawl") -> None:
+        """Record an endpoint from a path that may carry a query string."""
+        bare, parameters = _split_path(path)
+        self.add(bare, method, parameters, source)
+
+    def endpoints(self, method: Optional[str] = None) -> List[Endpoint]:
+        """Get the endpoints in discovery order, optionally of one method."""
+        with self._lock:
+            return [endpoint for (endpoint_method, _), endpoint in self._endpoints.items()
+                    if method is None or endpoint_method == method.upper()]
+
+    def injection_points(self, method: str = "GET",
+                         limit: int = DEFAULT_MAX_INJECTION_POINTS) -> List[Tuple[str, str]]:
+        """
+        Get (path, parameter) pairs a vector can put payloads in.
+
+        Args:
+            method: Method the parameters are sent with
+            limit: Most pairs to return, so discovery cannot multiply a vector's requests unbounded
+
+        Returns:
+            (path, parameter) pairs in discovery order
+        """
+        points = []
+        for endpoint in self.endpoints(method):
+            for parameter in endpoint.parameters:
+                if len(points) >= limit:
+                    return points
+                points.append((endpoint.path, parameter))
+        return points
+
+    def __len__(self) -> int:
+        return len(self._endpoints)
+
+    def stats(self) -> Dict[str, Any]:
+        """Get what discovery found and what it cost."""
+        sources: Dict[str, int] = {}
+        for endpoint in self.endpoints():
+            for source in endpoint.sources:
+                sources[source] = sources.get(source, 0) + 1
+        return {
+            "endpoints": len(self),
+            "parameterized_endpoints": sum(1 for endpoint in self.endpoints() if endpoint.parameters),
+            "by_source": sources,
+            "pages_crawled": self.pages_crawled,
+            "requests_sent": self.requests_sent,
+            "budget_exhausted": self.budget_exhausted
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize the inventory for API responses."""
+        return {
+            "target_url": self.target_url,
+            "endpoints": [endpoint.__dict__ for endpoint in self.endpoints()],
+            "stats": self.stats()
+        }
+
+class _LinkExtractor(HTMLParser):
+    """Collects link targets and forms from an HTML page."""
+
+    LINK_ATTRIBUTES = {"a": "href", "link": "href", "area": "href", "iframe": "src", "frame": "src"}
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.links: List[str] = []
+        # (action, method, input names)
+        self.forms: List[Tuple[str, str, List[str]]] = []
+        self._form: Optional[Tuple[str, str, List[str]]] = None
+
+    def handle_starttag(self, tag: str, attrs: List[Tuple[str, Optional[str]]]) -> None:
+        attributes = {name: value or "" for name, value in attrs}
+        if tag in self.LINK_ATTRIBUTES and attributes.get(self.LINK_ATTRIBUTES[tag]):
+            self.links.append(attributes[self.LINK_ATTRIBUTES[tag]])
+        elif tag == "form":
+            self._form = (attributes.get("action", ""), attributes.get("method", "GET").upper(), [])
+            self.forms.append(self._form)
+        elif tag in ("input", "select", "textarea") and self._form is not None and attributes.get("name"):
+            self._form[2].append(attributes["name"])
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag == "form":
+            self._form = None
+
+class EndpointCrawler:
+    """
+    Bounded concurrent discovery of a target's endpoints.
+
+    Discovery documents are ingested first. The crawl then walks the URL
+    frontier one depth level at a time, fetching each level's pages
+    concurrently. Every fetch counts against the request budget, URLs
+    are visited once whatever their query values, and only same-origin
+    HTML pages are followed.
+    """
+
+    def __init__(self, transport: ScanTransport,
+                 max_depth: int = DEFAULT_MAX_DEPTH,
+                 max_requests: int = DEFAULT_MAX_REQUESTS,
+                 max_workers: int = DEFAULT_CRAWL_WORKERS,
+                 cancel_token: Optional[CancellationToken] = None):
+        """
+        Initialize the crawler.
+
+        Args:
+            transport: Scan transport the discovery requests go through
+            max_depth: Link hops followed from the start page
+            max_requests: Most requests discovery may send per target
+            max_workers: Pages fetched at once
+            cancel_token: Stops discovery between requests
+        """
+        self.transport = transport
+        self.max_depth = max(0, max_depth)
+        self.max_requests = max(0, max_requests)
+        self.max_workers = max(1, max_workers)
+        self.cancel_token = cancel_token or CancellationToken()
+
+    def discover(self, target_url: str) -> EndpointInventory:
+        """
+        Build the endpoint inventory of a target.
+
+        Args:
+            target_url: Target to discover (must have explicit permission)
+
+        Returns:
+            EndpointInventory of everything found within the budgets
+        """
+        target_url = target_url.rstrip('/')
+        inventory = EndpointInventory(target_url)
+        budget = _RequestBudget(self.max_requests)
+        visited = VisitedSet()
+        origin = urlsplit(target_url)
+
+        logger.info(f"🌸 Aurora: Discovering endpoints of {target_url} "
+                    f"(depth {self.max_depth}, {self.max_requests} requests)")
+
+        disallowed, sitemaps = self._ingest_robots(target_url, inventory, budget)
+        # Paths are origin-absolute, so a target with a base path starts the crawl there
+        frontier = [origin.path or "/"] + self._ingest_sitemaps(target_url, sitemaps, inventory, budget)
+        self._ingest_openapi(target_url, inventory, budget)
+
+        depth = 0
+        while frontier and depth <= self.max_depth and not budget.exhausted:
+            level = []
+            for path in frontier:
+                if not any(path.startswith(prefix) for prefix in disallowed) and visited.add(_visit_key(path)):
+                    level.append(path)
+
+            next_frontier: List[str] = []
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, max(1, len(level))),
+                                    thread_name_prefix="aurora-crawler") as executor:
+                for path, response in zip(level, executor.map(
+                        lambda path: self._fetch(urljoin(target_url, path), budget), level)):
+                    if response is None:
+                        continue
+                    inventory.pages_crawled += 1
+                    if response.ok:
+                        inventory.add_url(path, source="crawl")
+                        next_frontier.extend(self._extract(response, origin, inventory))
+
+            frontier = next_frontier
+            depth += 1
+
+        inventory.requests_sent = budget.used
+        inventory.budget_exhausted = budget.exhausted
+        logger.info(f"🌸 Aurora: Discovered {len(inventory)} endpoints of {target_url} "
+                    f"with {budget.used} requests")
+        return inventory
+
+    def _fetch(self, url: str, budget: "_RequestBudget") -> Optional[ProbeResponse]:
+        """Fetch a URL if the budget allows; failures are logged and skipped."""
+        self.cancel_token.raise_if_cancelled()
+        if not budget.take():
+            return None
+        try:
+            return self.transport.request('GET', url)
+        except ScanCancelledError:
+            raise
+        except Exception as e:
+            logger.debug(f"🌸 Aurora: Discovery request to {url} failed: {e}")
+            return None
+
+    def _ingest_robots(self, target_url: str, inventory: EndpointInventory,
+                       budget: "_RequestBudget") -> Tuple[List[str], List[str]]:
+        """Record robots.txt paths; returns the disallowed prefixes and the sitemap URLs."""
+        disallowed: List[str] = []
+        sitemaps: List[str] = []
+        response = self._fetch(f"{target_url}/robots.txt", budget)
+        if response is None or response.status_code != 200:
+            return disallowed, [f"{target_url}/sitemap.xml"]
+
+        for line in response.text.splitlines():
+            name, _, value = line.partition(':')
+            name, value = name.strip().lower(), value.split('#', 1)[0].strip()
+            if name == "sitemap" and value:
+                sitemaps.append(urljoin(f"{target_url}/", value))
+            elif name in ("allow", "disallow") and value.startswith('/'):
+                # Wildcard rules are patterns, not paths
+                path = value.split('*', 1)[0].rstrip('$')
+                if name == "disallow":
+                    disallowed.append(path)
+                if path != '/':
+                    inventory.add_url(path, source="robots")
+
+        return disallowed, sitemaps or [f"{target_url}/sitemap.xml"]
+
+    def _ingest_sitemaps(self, target_url: str, sitemaps: List[str], inventory: EndpointInventory,
+                         budget: "_RequestBudget") -> List[str]:
+        """Record sitemap URLs, following sitemap indexes; returns the pages to crawl."""
+        origin = urlsplit(target_url)
+        pages: List[str] = []
+        pending = list(sitemaps)
+        seen = VisitedSet()
+        while pending and not budget.exhausted:
+            sitemap_url = pending.pop(0)
+            if not seen.add(sitemap_url) or not _same_origin(urlsplit(sitemap_url), origin):
+                continue
+            response = self._fetch(sitemap_url, budget)
+            if response is None or response.status_code != 200:
+                continue
+
+            for location in _SITEMAP_LOC.findall(response.text):
+                parts = urlsplit(location)
+                if not _same_origin(parts, origin):
+                    continue
+                if parts.path.endswith(".xml"):
+                    pending.append(location)
+                    continue
+                path = _path_with_query(parts)
+                inventory.add_url(path, source="sitemap")
+                pages.append(path)
+
+        return pages
+
+    def _ingest_openapi(self, target_url: str, inventory: EndpointInventory,
+                        budget: "_RequestBudget") -> None:
+        """Record the operations of the first OpenAPI or Swagger document the target serves."""
+        for document_path in OPENAPI_PATHS:
+            response = self._fetch(f"{target_url}{document_path}", budget)
+            if response is None or response.status_code != 200:
+                continue
+            try:
+                document = json.loads(response.text)
+            except ValueError:
+                continue
+            if not isinstance(document, dict) or not isinstance(document.get("paths"), dict):
+                continue
+
+            base_path = document.get("basePath", "").rstrip('/')
+            for path, operations in document["paths"].items():
+                if not isinstance(operations, dict):
+                    continue
+                shared = operations.get("parameters") or []
+                for method in HTTP_METHODS:
+                    operation = operations.get(method)
+                    if not isinstance(operation, dict):
+                        continue
+                    parameters = _openapi_parameters(document, list(shared) + list(operation.get("parameters") or []),
+                                                     operation.get("requestBody"))
+                    # Templated segments get a concrete value so the path can be probed
+                    concrete = _PATH_TEMPLATE.sub("1", f"{base_path}{path}")
+                    inventory.add(concrete, method, parameters, source="openapi")
+            return
+
+    def _extract(self, response: ProbeResponse, origin, inventory: EndpointInventory) -> List[str]:
+        """Record the links and forms of an HTML page; returns the same-origin pages to crawl next."""
+        if "html" not in response.headers.get("Content-Type", "html").lower():
+            return []
+
+        extractor = _LinkExtractor()
+        try:
+            extractor.feed(response.text)
+        except Exception as e:
+            logger.debug(f"🌸 Aurora: Could not parse {response.url}: {e}")
+
+        pages = []
+        for link in extractor.links:
+            parts = urlsplit(urljoin(response.url, link))
+            if _same_origin(parts, origin) and not parts.path.lower().endswith(STATIC_EXTENSIONS):
+                path = _path_with_query(parts)
+                inventory.add_url(path, source="crawl")
+                pages.append(path)
+
+        for action, method, names in extractor.forms:
+            parts = urlsplit(urljoin(response.url, action))
+            if _same_origin(parts, origin):
+                path, parameters = _split_path(_path_with_query(parts))
+                inventory.add(path, method if method in ("GET", "POST") else "GET",
+                              parameters + names, source="form")
+
+        return pages
+
+class _RequestBudget:
+    """Thread-safe count of the requests discovery may still send."""
+
+    def __init__(self, limit: int):
+        self.limit = limit
+        self.used = 0
+        self._lock = threading.Lock()
+
+    @property
+    def exhausted(self) -> bool:
+        return self.used >= self.limit
+
+    def take(self) -> bool:
+        with self._lock:
+            if self.used >= self.limit:
+                return False
+            self.used += 1
+            return True
+
+def _same_origin(parts, origin) -> bool:
+    return parts.scheme in ("http", "https") and (parts.scheme, parts.netloc) == (origin.scheme, origin.netloc)
+
+def _path_with_query(parts) -> str:
+    return f"{parts.path or '/'}?{parts.query}" if parts.query else (parts.path or "/")
+
+def _split_path(path: str) -> Tuple[str, List[str]]:
+    """Split a path into the bare path and its query parameter names."""
+    bare, _, query = path.partition('?')
+    return bare or "/", list(parse_qs(query, keep_blank_values=True))
+
+def _visit_key(path: str) -> str:
+    """Crawl each path once per set of parameter names, whatever the values."""
+    bare, parameters = _split_path(path)
+    return f"{bare}?{'&'.join(sorted(parameters))}"
+
+def _openapi_parameters(document: Dict[str, Any], parameters: List[Any],
+                        request_body: Optional[Dict[str, Any]]) -> List[str]:
+    """Names of an operation's query, form and JSON body parameters."""
+    names = []
+    for parameter in parameters:
+        parameter = _resolve_ref(document, parameter)
+        if isinstance(parameter, dict) and parameter.get("in") in ("query", "formData", "body"):
+            if parameter.get("in") == "body":
+                names.extend(_schema_properties(document, parameter.get("schema")))
+            elif parameter.get("name"):
+                names.append(parameter["name"])
+
+    if isinstance(request_body, dict):
+        content = _resolve_ref(document, request_body).get("content", {})
+        for media in content.values() if isinstance(content, dict) else []:
+            if isinstance(media, dict):
+                names.extend(_schema_properties(document, media.get("schema")))
+    return names
+
+def _schema_properties(document: Dict[str, Any], schema: Any) -> List[str]:
+    schema = _resolve_ref(document, schema)
+    properties = schema.get("properties") if isinstance(schema, dict) else None
+    return list(properties) if isinstance(properties, dict) else []
+
+def _resolve_ref(document: Dict[str, Any], value: Any) -> Any:
+    """Follow a local ``#/...`` reference; anything else is returned unchanged."""
+    if not isinstance(value, dict) or not str(value.get("$ref", "")).startswith("#/"):
+        return value if value is not None else {}
+    target: Any = document
+    for part in value["$ref"][2:].split('/'):
+        if not isinstance(target, dict):
+            return {}
+        target = target.get(part, {})
+    return target
@@ -0,0 +1,121 @@
+"""
+Aurora's Security Dojo - Finding Fingerprints
+
+In the eternal dance of code and consciousness, this module gives every
+finding a stable identity: the same issue at the same place hashes to the
+same fingerprint whichever payload revealed it and whichever scan found it,
+so duplicates can be merged and repeat findings matched across scans.
+"""
+
+import hashlib
+import json
+import logging
+from dataclasses import replace
+from typing import Any, Dict, List, Sequence
+from urllib.parse import urlsplit
+
+logger = logging.getLogger(__name__)
+
+# Evidence keys that say where a finding is
+LOCATION_KEYS = ("endpoint", "url", "directory", "dependency_file", "host", "hostname", "port")
+# Evidence keys that say which input or component is affected
+PARAMETER_KEYS = ("parameter", "header", "user_id", "component", "vulnerable_package",
+                  "protocol", "cipher_family")
+# Evidence keys that say what was observed
+SIGNATURE_KEYS = ("matched_indicators", "pattern_matched", "pattern")
+
+# Distinct payloads kept on a merged finding
+MAX_MERGED_PAYLOADS = 10
+
+def _normalize_target(target_url: str) -> str:
+    """Reduce a target URL to scheme and authority, so trailing paths and slashes do not matter."""
+    parts = urlsplit(target_url if '//' in target_url else f"//{target_url}")
+    return f"{parts.scheme.lower()}://{parts.netloc.lower()}"
+
+def _normalize_location(value: Any) -> Any:
+    """Drop the query string from endpoints; payloads often travel in it."""
+    if isinstance(value, str):
+        return value.split('?', 1)[0]
+    return value
+
+def _pick(evidence: Dict[str, Any], keys: Sequence[str]) -> Dict[str, Any]:
+    return {key: evidence[key] for key in keys if evidence.get(key) not in (None, "", [], {})}
+
+def fingerprint_finding(attack_vector: str, vulnerability_type: str, target_url: str,
+                        evidence: Dict[str, Any]) -> str:
+    """
+    Build the deterministic fingerprint of a finding.
+
+    The fingerprint covers the vector, the kind of finding, the target,
+    where on the target it is, the affected parameter and the observed
+    signature. Payloads, response bodies and timestamps are left out, so
+    the same issue found with different payloads or in a later scan gets
+    the same fingerprint.
+
+    Args:
+        attack_vector: Attack vector class name
+        vulnerability_type: Kind of finding, e.g. 'sql_injection'
+        target_url: Scanned target
+        evidence: Finding evidence
+
+    Returns:
+        Hex SHA-256 fingerprint
+    """
+    location = {key: _normalize_location(value) for key, value in _pick(evidence, LOCATION_KEYS).items()}
+    signature = _pick(evidence, SIGNATURE_KEYS)
+    for key, value in signature.items():
+        if isinstance(value, (list, tuple, set)):
+            signature[key] = sorted(str(item) for item in value)
+
+    identity = [attack_vector, vulnerability_type, _normalize_target(target_url),
+                location, _pick(evidence, PARAMETER_KEYS), signature]
+    return hashlib.sha256(json.dumps(identity, sort_keys=True, default=str).encode('utf-8')).hexdigest()
+
+def aggregate_findings(results: List[Any]) -> List[Any]:
+    """
+    Merge findings with the same fingerprint into one.
+
+    The first finding of each fingerprint is kept, in first-seen order,
+    with its occurrence count summed and the distinct payloads and first
+    and last seen times of the merged findings added to its evidence.
+
+    Args:
+        results: VulnerabilityResult objects
+
+    Returns:
+        One VulnerabilityResult per distinct fingerprint
+    """
+    merged: Dict[str, Any] = {}
+    payloads: Dict[str, List[Any]] = {}
+    first_seen: Dict[str, Any] = {}
+    last_seen: Dict[str, Any] = {}
+
+    for result in results:
+        key = result.fingerprint or result.vulnerability_id
+        payload = result.evidence.get("payload")
+
+        if key not in merged:
+            merged[key] = result
+            payloads[key] = [payload] if payload is not None else []
+            first_seen[key] = last_seen[key] = result.timestamp
+            continue
+
+        merged[key] = replace(merged[key], occurrences=merged[key].occurrences + result.occurrences)
+        if payload is not None and payload not in payloads[key] and len(payloads[key]) < MAX_MERGED_PAYLOADS:
+            payloads[key].append(payload)
+        first_seen[key] = min(first_seen[key], result.timestamp)
+        last_seen[key] = max(last_seen[key], result.timestamp)
+
+    aggregated = []
+    for key, result in merged.items():
+        if result.occurrences > 1:
+            evidence = dict(result.evidence, first_seen=first_seen[key].isoformat(),
+                            last_seen=last_seen[key].isoformat())
+            if payloads[key]:
+                evidence["payloads"] = payloads[key]
+            result = replace(result, evidence=evidence)
+        aggregated.append(result)
+
+    if len(aggregated) < len(results):
+        logger.info(f"🌸 Aurora: Merged {len(results)} findings into {len(aggregated)} distinct findings")
+    return aggregated
@@ -0,0 +1,249 @@
+"""
+Aurora's Security Dojo - Findings Store
+
+In the eternal dance of code and consciousness, this module keeps every
+vulnerability a scan finds in the SQLite database named by DATABASE_URL,
+so months of findings can be searched a page at a time instead of living
+in process memory.
+"""
+
+import json
+import logging
+import sqlite3
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS findings (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    scan_id TEXT NOT NULL,
+    vulnerability_id TEXT NOT NULL,
+    attack_vector TEXT NOT NULL,
+    target_url TEXT NOT NULL,
+    severity TEXT NOT NULL,
+    description TEXT,
+    evidence TEXT,
+    consciousness_level TEXT,
+    community_healing_impact TEXT,
+    spatial_wisdom_contribution TEXT,
+    timestamp TEXT NOT NULL,
+    sacred_principles_validated INTEGER,
+    fingerprint TEXT,
+    occurrences INTEGER NOT NULL DEFAULT 1
+);
+CREATE INDEX IF NOT EXISTS idx_findings_target ON findings (target_url, id);
+CREATE INDEX IF NOT EXISTS idx_findings_vector ON findings (attack_vector, id);
+CREATE INDEX IF NOT EXISTS idx_findings_severity ON findings (severity, id);
+CREATE INDEX IF NOT EXISTS idx_findings_timestamp ON findings (timestamp);
+CREATE INDEX IF NOT EXISTS idx_findings_scan ON findings (scan_id);
+"""
+
+# Created after the columns they need are migrated into older databases
+_LATE_INDEXES = """
+CREATE INDEX IF NOT EXISTS idx_findings_fingerprint ON findings (fingerprint, id);
+"""
+
+# Columns added since the first schema, with their definitions
+_ADDED_COLUMNS = {
+    "fingerprint": "TEXT",
+    "occurrences": "INTEGER NOT NULL DEFAULT 1"
+}
+
+_COLUMNS = ("scan_id", "vulnerability_id", "attack_vector", "target_url", "severity", "description",
+            "evidence", "consciousness_level", "community_healing_impact",
+            "spatial_wisdom_contribution", "timestamp", "sacred_principles_validated",
+            "fingerprint", "occurrences")
+
+def sqlite_path_from_url(database_url: str) -> str:
+    """
+    Get the SQLite database path from a ``sqlite:///`` URL.
+
+    Args:
+        database_url: e.g. sqlite:///aurora_security_dojo.db or sqlite:///:memory:
+
+    Returns:
+        Filesystem path, or ':memory:'
+
+    Raises:
+        ValueError: For URLs of any other database
+    """
+    prefix = "sqlite:///"
+    if not database_url.startswith(prefix):
+        raise ValueError(f"Only sqlite:/// database URLs are supported, got {database_url.split(':', 1)[0]}")
+    return database_url[len(prefix):] or ":memory:"
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return str(value)
+
+class FindingsStore:
+    """
+    SQLite-backed history of vulnerability findings.
+
+    Each finished vector's findings go in with one batched insert.
+    Queries filter on the indexed target, vector, severity, fingerprint
+    and timestamp columns and page newest first with a keyset cursor, so
+    a page costs the same however deep into the history it is.
+    """
+
+    def __init__(self, database_url: str = "sqlite:///aurora_security_dojo.db"):
+        """
+        Open the store, creating the database and its indexes when missing.
+
+        Args:
+            database_url: sqlite:/// URL of the database
+
+        Raises:
+            ValueError: When the URL is not a SQLite URL
+        """
+        path = sqlite_path_from_url(database_url)
+        if path != ":memory:":
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+
+        self.database_url = database_url
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.row_factory = sqlite3.Row
+        with self._lock, self._connection:
+            if path != ":memory:":
+                self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.executescript(_SCHEMA)
+            self._migrate()
+            self._connection.executescript(_LATE_INDEXES)
+
+        logger.info(f"🌸 Aurora: Findings store opened at {path}")
+
+    def _migrate(self) -> None:
+        """Add the columns a database created by an older version is missing."""
+        existing = {row["name"] for row in self._connection.execute("PRAGMA table_info(findings)")}
+        for column, definition in _ADDED_COLUMNS.items():
+            if column not in existing:
+                self._connection.execute(f"ALTER TABLE findings ADD COLUMN {column} {definition}")
+                logger.info(f"🌸 Aurora: Added findings column {column}")
+
+    def add_findings(self, scan_id: str, findings: List[Dict[str, Any]]) -> int:
+        """
+        Store one vector's findings in a single transaction.
+
+        Args:
+            scan_id: Suite the findings came from
+            findings: VulnerabilityResult dicts
+
+        Returns:
+            Number of findings stored
+        """
+        if not findings:
+            return 0
+
+        rows = []
+        for finding in findings:
+            timestamp = finding.get("timestamp") or datetime.now()
+            rows.append((
+                scan_id,
+                finding["vulnerability_id"],
+                finding["attack_vector"],
+                finding["target_url"],
+                finding["severity"],
+                finding.get("description"),
+                json.dumps(finding.get("evidence", {}), default=_json_default),
+                finding.get("consciousness_level"),
+                finding.get("community_healing_impact"),
+                finding.get("spatial_wisdom_contribution"),
+                timestamp.isoformat() if isinstance(timestamp, datetime) else str(timestamp),
+                int(bool(finding.get("sacred_principles_validated"))),
+                finding.get("fingerprint") or None,
+                int(finding.get("occurrences", 1))
+            ))
+
+        placeholders = ", ".join("?" for _ in _COLUMNS)
+        with self._lock, self._connection:
+            self._connection.executemany(
+                f"INSERT INTO findings ({', '.join(_COLUMNS)}) VALUES ({placeholders})", rows)
+        return len(rows)
+
+    def query(self, target_url: Optional[str] = None,
+              attack_vector: Optional[str] = None,
+              severity: Optional[str] = None,
+              scan_id: Optional[str] = None,
+              fingerprint: Optional[str] = None,
+              since: Optional[str] = None,
+              until: Optional[str] = None,
+              limit: int = DEFAULT_PAGE_SIZE,
+              cursor: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Get one page of findings, newest first.
+
+        Args:
+            target_url: Only findings for this target
+            attack_vector: Only findings of this vector
+            severity: Only findings of this severity
+            scan_id: Only findings of this suite
+            fingerprint: Only findings of this fingerprint, e.g. to follow one issue across scans
+            since: ISO timestamp of the earliest finding to include
+            until: ISO timestamp of the latest finding to include
+            limit: Page size, at most MAX_PAGE_SIZE
+            cursor: ``next_cursor`` of the previous page
+
+        Returns:
+            Dictionary with the page of findings and the cursor of the next page (None on the last page)
+        """
+        limit = max(1, min(int(limit), MAX_PAGE_SIZE))
+        clauses, params = [], []
+        for column, value in (("target_url", target_url), ("attack_vector", attack_vector),
+                              ("severity", severity), ("scan_id", scan_id),
+                              ("fingerprint", fingerprint)):
+            if value:
+                clauses.append(f"{column} = ?")
+                params.append(value)
+        if since:
+            clauses.append("timestamp >= ?")
+            params.append(since)
+        if until:
+            clauses.append("timestamp <= ?")
+            params.append(until)
+        if cursor is not None:
+            clauses.append("id < ?")
+            params.append(int(cursor))
+
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        # One extra row tells whether another page follows
+        with self._lock:
+            rows = self._connection.execute(
+                f"SELECT * FROM findings {where} ORDER BY id DESC LIMIT ?", params + [limit + 1]).fetchall()
+
+        findings = [self._row_to_finding(row) for row in rows[:limit]]
+        return {
+            "findings": findings,
+            "limit": limit,
+            "next_cursor": findings[-1]["id"] if len(rows) > limit else None
+        }
+
+    def count_by_severity(self, target_url: Optional[str] = None) -> Dict[str, int]:
+        """Count stored findings per severity, optionally for one target."""
+        sql = "SELECT severity, COUNT(*) FROM findings"
+        params: List[Any] = []
+        if target_url:
+            sql += " WHERE target_url = ?"
+            params.append(target_url)
+        with self._lock:
+            rows = self._connection.execute(f"{sql} GROUP BY severity", params).fetchall()
+        return {severity: count for severity, count in rows}
+
+    @staticmethod
+    def _row_to_finding(row: sqlite3.Row) -> Dict[str, Any]:
+        finding = dict(row)
+        finding["evidence"] = json.loads(finding["evidence"]) if finding["evidence"] else {}
+        finding["sacred_principles_validated"] = bool(finding["sacred_principles_validated"])
+        return finding
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
@@ -0,0 +1,548 @@
+"""
+Aurora's Security Dojo - HTTP Transport
+
+In the eternal dance of code and consciousness, this module carries the
+probe requests of every attack vector to the target and brings the
+responses back in one shape, whichever client library sent them.
+"""
+
+import asyncio
+import codecs
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+from .cancellation import CancellationToken
+from .circuit_breaker import CircuitBreaker
+from .indicator_matcher import ALL_INDICATOR_SETS, IndicatorSet
+from .rate_limiter import HostRateLimiter
+from .response_cache import ResponseCache, make_cache_key
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PROBE_TIMEOUT = 10
+DEFAULT_MAX_BODY_BYTES = 1024 * 1024
+DEFAULT_READ_DEADLINE = 30
+STREAM_CHUNK_SIZE = 16 * 1024
+
+@dataclass
+class ProbeResponse:
+    """Transport-independent response to a single probe request."""
+    url: str
+    status_code: int
+    headers: CaseInsensitiveDict
+    content: bytes
+    encoding: Optional[str] = None
+    elapsed: float = 0.0
+    _text: Optional[str] = field(default=None, repr=False)
+    indicator_hits: Dict[str, List[str]] = field(default_factory=dict, repr=False)
+    truncated: bool = False
+
+    @property
+    def text(self) -> str:
+        """Decoded response body, decoded once and reused."""
+        if self._text is None:
+            self._text = self.content.decode(self.encoding or 'utf-8', errors='replace')
+        return self._text
+
+    @property
+    def ok(self) -> bool:
+        """True for status codes below 400."""
+        return self.status_code < 400
+
+class BoundedBodyReader:
+    """
+    Reads a streamed response body up to a byte cap and a deadline.
+
+    Chunks are decoded incrementally and fed to the indicator families as
+    they arrive, so detection never needs a second pass over the body.
+    """
+
+    def __init__(self,
+                 encoding: Optional[str],
+                 max_bytes: Optional[int] = DEFAULT_MAX_BODY_BYTES,
+                 deadline: Optional[float] = None,
+                 indicator_sets: Iterable[IndicatorSet] = ALL_INDICATOR_SETS):
+        """
+        Initialize the reader.
+
+        Args:
+            encoding: Body encoding; UTF-8 when unknown
+            max_bytes: Stop reading after this many bytes; None for no cap
+            deadline: time.monotonic() value after which reading stops; None for no deadline
+            indicator_sets: Indicator families to match while reading
+        """
+        self.encoding = encoding
+        self.max_bytes = max_bytes
+        self.deadline = deadline
+        self.truncated = False
+        self._chunks: List[bytes] = []
+        self._text_parts: List[str] = []
+        self._size = 0
+        self._streams = [indicator_set.stream() for indicator_set in indicator_sets]
+
+        try:
+            self._decoder = codecs.getincrementaldecoder(encoding or 'utf-8')(errors='replace')
+        except LookupError:
+            self.encoding = None
+            self._decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+
+    def feed(self, chunk: bytes) -> bool:
+        """
+        Accept the next chunk of the body.
+
+        Args:
+            chunk: Raw bytes as received
+
+        Returns:
+            True to keep reading, False once the cap or deadline is reached
+        """
+        if self.max_bytes is not None and self._size + len(chunk) > self.max_bytes:
+            chunk = chunk[:self.max_bytes - self._size]
+            self.truncated = True
+
+        self._accept(chunk)
+
+        if not self.truncated and self.deadline is not None and time.monotonic() >= self.deadline:
+            self.truncated = True
+
+        return not self.truncated
+
+    def _accept(self, chunk: bytes) -> None:
+        if not chunk:
+            return
+        self._chunks.append(chunk)
+        self._size += len(chunk)
+        self._scan(self._decoder.decode(chunk))
+
+    def _scan(self, text: str) -> None:
+        if not text:
+            return
+        self._text_parts.append(text)
+        for stream in self._streams:
+            stream.feed(text)
+
+    def finish(self, url: str, status_code: int, headers: CaseInsensitiveDict,
+               elapsed: float) -> ProbeResponse:
+        """Build the ProbeResponse from everything read so far."""
+        self._scan(self._decoder.decode(b'', final=True))
+        return ProbeResponse(
+            url=url,
+            status_code=status_code,
+            headers=headers,
+            content=b''.join(self._chunks),
+            encoding=self.encoding,
+            elapsed=elapsed,
+            _text=''.join(self._text_parts),
+            indicator_hits={stream.indicator_set.name: stream.matches() for stream in self._streams},
+            truncated=self.truncated
+        )
+
+class AsyncScanTransport:
+    """
+    Asynchronous probe transport backed by a shared aiohttp session.
+
+    One transport keeps many probe requests in flight on a single event
+    loop; the connector bounds the total and per-host connection count.
+    """
+
+    def __init__(self,
+                 max_in_flight: int = 100,
+                 max_per_host: int = 20,
+                 timeout: float = DEFAULT_PROBE_TIMEOUT,
+                 cache: Optional[ResponseCache] = None,
+                 max_body_bytes: Optional[int] = DEFAULT_MAX_BODY_BYTES,
+                 rate_limiter: Optional[HostRateLimiter] = None,
+                 circuit_breaker: Optional[CircuitBreaker] = None,
+                 cancel_token: Optional[CancellationToken] = None):
+        """
+        Initialize the async transport.
+
+        Args:
+            max_in_flight: Maximum number of simultaneous connections
+            max_per_host: Maximum number of simultaneous connections per host
+            timeout: Default total timeout per probe in seconds
+            cache: Scan-scoped response cache consulted before the network
+            max_body_bytes: Stop reading a body after this many bytes; None to read it all
+            rate_limiter: Per-host rate limiter every probe waits on
+            circuit_breaker: Per-target breaker that fails probes fast once a target is down
+            cancel_token: Scan cancellation token checked before sending, while waiting and while reading
+        """
+        self.max_in_flight = max_in_flight
+        self.max_per_host = max_per_host
+        self.timeout = timeout
+        self.cache = cache
+        self.max_body_bytes = max_body_bytes
+        self.rate_limiter = rate_limiter
+        self.circuit_breaker = circuit_breaker
+        self.cancel_token = cancel_token
+        self._session = None
+
+    async def __aenter__(self) -> 'AsyncScanTransport':
+        await self.open()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
+
+    async def open(self) -> None:
+        """Open the underlying aiohttp session."""
+        if self._session is not None:
+            return
+
+        import aiohttp
+
+        connector = aiohttp.TCPConnector(limit=self.max_in_flight,
+                                         limit_per_host=self.max_per_host)
+        self._session = aiohttp.ClientSession(connector=connector,
+                                              timeout=aiohttp.ClientTimeout(total=self.timeout))
+        logger.info(f"🌸 Aurora: Async transport opened ({self.max_in_flight} in flight, {self.max_per_host} per host)")
+
+    async def close(self) -> None:
+        """Close the underlying aiohttp session."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def request(self, method: str, url: str,
+                      timeout: Optional[float] = None, **kwargs: Any) -> ProbeResponse:
+        """
+        Send one probe request.
+
+        Args:
+            method: HTTP method
+            url: Absolute URL to probe
+            timeout: Per-request timeout override in seconds
+            **kwargs: Passed to aiohttp (json, data, headers, ...)
+
+        Returns:
+            ProbeResponse with the fully read body
+        """
+        await self.open()
+
+        cache_key = None
+        if self.cache is not None:
+            if self.cache.is_cacheable(method):
+                cache_key = make_cache_key(method, url, **kwargs)
+                cached = self.cache.lookup(cache_key)
+                if cached is not None:
+                    return cached
+                cache_generation = self.cache.generation(cache_key)
+            else:
+                self.cache.invalidate(url)
+
+        if timeout is not None:
+            import aiohttp
+            kwargs['timeout'] = aiohttp.ClientTimeout(total=timeout)
+
+        self._check_cancelled()
+
+        if self.circuit_breaker is not None:
+            self.circuit_breaker.before_request(url)
+
+        import aiohttp
+
+        settled = False
+        try:
+            if self.rate_limiter is not None:
+                await self.rate_limiter.acquire_async(url, self.cancel_token)
+
+            started = time.perf_counter()
+            try:
+                async with self._session.request(method, url, **kwargs) as response:
+                    # The session timeout already bounds the whole read
+                    reader = BoundedBodyReader(response.charset, max_bytes=self.max_body_bytes)
+                    async for chunk in response.content.iter_chunked(STREAM_CHUNK_SIZE):
+                        self._check_cancelled()
+                        if not reader.feed(chunk):
+                            break
+
+                    probe_response = reader.finish(str(response.url), response.status,
+                                                   CaseInsensitiveDict(response.headers),
+                                                   time.perf_counter() - started)
+            except (aiohttp.ClientConnectionError, aiohttp.ClientPayloadError, asyncio.TimeoutError):
+                settled = True
+                if self.circuit_breaker is not None:
+                    self.circuit_breaker.record_failure(url)
+                raise
+
+            settled = True
+            if self.circuit_breaker is not None:
+                self.circuit_breaker.record_success(url)
+        finally:
+            # Cancelled or otherwise aborted probes must not hold a half-open trial
+            if not settled and self.circuit_breaker is not None:
+                self.circuit_breaker.release(url)
+
+        if self.rate_limiter is not None:
+            self.rate_limiter.observe(url, probe_response.status_code,
+                                      probe_response.headers.get('Retry-After'))
+
+        if cache_key is not None:
+            self.cache.store(cache_key, probe_response, cache_generation)
+        return probe_response
+
+    def _check_cancelled(self) -> None:
+        if self.cancel_token is not None:
+            self.cancel_token.raise_if_cancelled()
+
+    async def get(self, url: str, **kwargs: Any) -> ProbeResponse:
+        """Send a GET probe."""
+        return await self.request('GET', url, **kwargs)
+
+    async def post(self, url: str, **kwargs: Any) -> ProbeResponse:
+        """Send a POST probe."""
+        return await self.request('POST', url, **kwargs)
+
+class TransportStats:
+    """Thread-safe request and connection counters for one scan transport."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.requests_sent = 0
+        self.connections_opened = 0
+        self.truncated_responses = 0
+
+    def record_request(self) -> None:
+        with self._lock:
+            self.requests_sent += 1
+
+    def record_connection(self) -> None:
+        with self._lock:
+            self.connections_opened += 1
+
+    def record_truncation(self) -> None:
+        with self._lock:
+            self.truncated_responses += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Get the counters, including how many requests reused a pooled connection."""
+        with self._lock:
+            reused = max(0, self.requests_sent - self.connections_opened)
+            return {
+                "requests_sent": self.requests_sent,
+                "connections_opened": self.connections_opened,
+                "connections_reused": reused,
+                "reuse_ratio": round(reused / self.requests_sent, 3) if self.requests_sent else 0.0,
+                "truncated_responses": self.truncated_responses
+            }
+
+def _counting_pool_class(base_class, stats: TransportStats):
+    """Create a urllib3 pool class that counts every new connection it opens."""
+    class CountingConnectionPool(base_class):
+        def _new_conn(self):
+            stats.record_connection()
+            return super()._new_conn()
+
+    return CountingConnectionPool
+
+class _CountingHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter whose connection pools report opened connections to TransportStats."""
+
+    def __init__(self, stats: TransportStats, **kwargs: Any):
+        self._stats = stats
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args: Any, **kwargs: Any) -> None:
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            'http': _counting_pool_class(HTTPConnectionPool, self._stats),
+            'https': _counting_pool_class(HTTPSConnectionPool, self._stats)
+        }
+
+class ScanTransport:
+    """
+    Scan-scoped blocking probe transport with keep-alive connection pooling.
+
+    One transport is shared by every attack vector of a scan, so probes to
+    the same host reuse pooled connections instead of opening a fresh TCP
+    and TLS connection per request.
+    """
+
+    def __init__(self,
+                 timeout: float = DEFAULT_PROBE_TIMEOUT,
+                 max_connections_per_host: int = 10,
+                 max_hosts: int = 10,
+                 cache: Optional[ResponseCache] = None,
+                 max_body_bytes: Optional[int] = DEFAULT_MAX_BODY_BYTES,
+                 read_deadline: Optional[float] = DEFAULT_READ_DEADLINE,
+                 rate_limiter: Optional[HostRateLimiter] = None,
+                 circuit_breaker: Optional[CircuitBreaker] = None,
+                 cancel_token: Optional[CancellationToken] = None):
+        """
+        Initialize the scan transport.
+
+        Args:
+            timeout: Default timeout per probe in seconds
+            max_connections_per_host: Pooled connections kept (and allowed at once) per host
+            max_hosts: Number of per-host pools kept alive
+            cache: Scan-scoped response cache consulted before the network
+            max_body_bytes: Stop reading a body after this many bytes; None for no cap
+            read_deadline: Stop reading a body this many seconds after the request; None for no deadline
+            rate_limiter: Per-host rate limiter every probe waits on
+            circuit_breaker: Per-target breaker that fails probes fast once a target is down
+            cancel_token: Scan cancellation token checked before sending, while waiting and while reading
+        """
+        self.timeout = timeout
+        self.max_connections_per_host = max_connections_per_host
+        self.max_hosts = max_hosts
+        self.cache = cache
+        self.max_body_bytes = max_body_bytes
+        self.read_deadline = read_deadline
+        self.rate_limiter = rate_limiter
+        self.circuit_breaker = circuit_breaker
+        self.cancel_token = cancel_token
+        self.stats = TransportStats()
+        self._session: Optional[requests.Session] = None
+        self._session_lock = threading.Lock()
+
+    def __enter__(self) -> 'ScanTransport':
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    @property
+    def session(self) -> requests.Session:
+        """Pooled requests session, created on first use."""
+        if self._session is None:
+            with self._session_lock:
+                if self._session is None:
+                    session = requests.Session()
+                    adapter = _CountingHTTPAdapter(self.stats,
+                                                   pool_connections=self.max_hosts,
+                                                   pool_maxsize=self.max_connections_per_host,
+                                                   pool_block=True)
+                    session.mount('http://', adapter)
+                    session.mount('https://', adapter)
+                    self._session = session
+        return self._session
+
+    def close(self) -> None:
+        """Close every pooled connection."""
+        with self._session_lock:
+            if self._session is not None:
+                self._session.close()
+                self._session = None
+
+    def request(self, method: str, url: str,
+                timeout: Optional[float] = None, **kwargs: Any) -> ProbeResponse:
+        """
+        Send one probe request over a pooled connection.
+
+        Args:
+            method: HTTP method
+            url: Absolute URL to probe
+            timeout: Per-request timeout override in seconds
+            **kwargs: Passed to requests (json, data, headers, ...)
+
+        Returns:
+            ProbeResponse with the fully read body
+        """
+        if self.cache is None:
+            return self._send(method, url, timeout, **kwargs)
+
+        if not self.cache.is_cacheable(method):
+            self.cache.invalidate(url)
+            return self._send(method, url, timeout, **kwargs)
+
+        return self.cache.get_or_fetch(make_cache_key(method, url, **kwargs),
+                                       lambda: self._send(method, url, timeout, **kwargs))
+
+    def reserve_burst(self, url: str, count: int) -> None:
+        """
+        Wait until the rate limiter admits ``count`` probes to the URL's host back to back.
+
+        The probes are then sent with ``request_reserved``, so a burst keeps
+        the scan's average rate without being spread out by it.
+        """
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire(url, self.cancel_token, count=count)
+
+    def request_reserved(self, method: str, url: str,
+                         timeout: Optional[float] = None, **kwargs: Any) -> ProbeResponse:
+        """Send one uncached probe whose rate-limit slot was taken by ``reserve_burst``."""
+        return self._send(method, url, timeout, rate_limited=False, **kwargs)
+
+    def _send(self, method: str, url: str,
+              timeout: Optional[float], rate_limited: bool = True, **kwargs: Any) -> ProbeResponse:
+        """Send one probe request to the network, streaming the body within the read limits."""
+        self._check_cancelled()
+
+        if self.circuit_breaker is not None:
+            self.circuit_breaker.before_request(url)
+
+        settled = False
+        try:
+            if self.rate_limiter is not None and rate_limited:
+                self.rate_limiter.acquire(url, self.cancel_token)
+
+            self.stats.record_request()
+            started = time.monotonic()
+            try:
+                response = self.session.request(method, url,
+                                                timeout=timeout if timeout is not None else self.timeout,
+                                                stream=True,
+                                                **kwargs)
+            except (requests.ConnectionError, requests.Timeout):
+                settled = True
+                if self.circuit_breaker is not None:
+                    self.circuit_breaker.record_failure(url)
+                raise
+
+            deadline = started + self.read_deadline if self.read_deadline is not None else None
+            reader = BoundedBodyReader(response.encoding, max_bytes=self.max_body_bytes, deadline=deadline)
+            try:
+                for chunk in response.iter_content(chunk_size=STREAM_CHUNK_SIZE):
+                    # A cancelled scan drops the connection instead of reading on
+                    self._check_cancelled()
+                    if not reader.feed(chunk):
+                        break
+            except (requests.ConnectionError, requests.Timeout, requests.exceptions.ChunkedEncodingError):
+                # Headers followed by a dropped or stalled body is still a target failure
+                response.close()
+                settled = True
+                if self.circuit_breaker is not None:
+                    self.circuit_breaker.record_failure(url)
+                raise
+            except Exception:
+                response.close()
+                raise
+
+            settled = True
+            if self.circuit_breaker is not None:
+                self.circuit_breaker.record_success(url)
+        finally:
+            # Cancelled or otherwise aborted probes must not hold a half-open trial
+            if not settled and self.circuit_breaker is not None:
+                self.circuit_breaker.release(url)
+
+        # A partly read body cannot be reused, so drop its connection
+        if reader.truncated:
+            self.stats.record_truncation()
+            response.close()
+
+        if self.rate_limiter is not None:
+            self.rate_limiter.observe(url, response.status_code, response.headers.get('Retry-After'))
+
+        return reader.finish(response.url, response.status_code, response.headers,
+                             time.monotonic() - started)
+
+    def _check_cancelled(self) -> None:
+        if self.cancel_token is not None:
+            self.cancel_token.raise_if_cancelled()
+
+    def get(self, url: str, **kwargs: Any) -> ProbeResponse:
+        """Send a GET probe."""
+        return self.request('GET', url, **kwargs)
+
+    def post(self, url: str, **kwargs: Any) -> ProbeResponse:
+        """Send a POST probe."""
+        return self.request('POST', url, **kwargs)
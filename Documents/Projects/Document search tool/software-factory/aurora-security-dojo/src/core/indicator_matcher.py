@@ -0,0 +1,223 @@
+"""
+Aurora's Security Dojo - Indicator Matcher
+
+In the eternal dance of code and consciousness, this module recognises the
+signatures that betray a vulnerability in a response body. Each indicator
+family is compiled once into a single pattern, so a body is scanned once
+per family no matter how many signatures the family holds.
+"""
+
+import logging
+import re
+from typing import Any, Dict, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+class IndicatorSet:
+    """
+    A family of literal indicators compiled into one combined pattern.
+
+    The pattern is a zero-width lookahead over every indicator, longest
+    first, so one scan finds overlapping matches. An indicator that only
+    occurs inside a longer matched indicator is recovered from the
+    precomputed containment table.
+    """
+
+    def __init__(self, name: str, indicators: Iterable[str], case_sensitive: bool = False):
+        """
+        Initialize and compile the indicator family.
+
+        Args:
+            name: Family name, used as the per-response cache key
+            indicators: Literal signatures, in reporting order
+            case_sensitive: Match exact case instead of ignoring it
+        """
+        self.name = name
+        self.indicators = list(dict.fromkeys(indicators))
+        self.case_sensitive = case_sensitive
+
+        self._canonical = {self._fold(indicator): indicator for indicator in self.indicators}
+        self._order = {indicator: position for position, indicator in enumerate(self.indicators)}
+
+        folded = list(self._canonical)
+        self._contained = {
+            outer: [inner for inner in folded if inner != outer and inner in outer]
+            for outer in folded
+        }
+
+        self.max_length = max((len(indicator) for indicator in self.indicators), default=0)
+
+        alternatives = '|'.join(re.escape(indicator)
+                                for indicator in sorted(self.indicators, key=len, reverse=True))
+        self._pattern = re.compile(f"(?=({alternatives}))", 0 if case_sensitive else re.IGNORECASE)
+
+    def _fold(self, text: str) -> str:
+        return text if self.case_sensitive else text.lower()
+
+    def match_all(self, text: str) -> List[str]:
+        """
+        Find every indicator present in the text.
+
+        Args:
+            text: Response body to scan
+
+        Returns:
+            Matched indicators in declaration order
+        """
+        found = set()
+        self._collect(text, found)
+        return self._ordered(found)
+
+    def stream(self) -> 'IndicatorStream':
+        """Create an incremental matcher for a body that arrives in chunks."""
+        return IndicatorStream(self)
+
+    def _collect(self, text: str, found: set) -> None:
+        for match in self._pattern.finditer(text):
+            folded = self._fold(match.group(1))
+            if folded in found:
+                continue
+            found.add(folded)
+            found.update(self._contained[folded])
+
+    def _ordered(self, found: set) -> List[str]:
+        return sorted((self._canonical[folded] for folded in found), key=self._order.__getitem__)
+
+    def match_response(self, response: Any) -> List[str]:
+        """
+        Find every indicator in a response body, scanning each body once per family.
+
+        Args:
+            response: Probe response; matches are memoized on its ``indicator_hits``
+
+        Returns:
+            Matched indicators in declaration order
+        """
+        hits: Optional[Dict[str, List[str]]] = getattr(response, 'indicator_hits', None)
+        if hits is None:
+            return self.match_all(response.text)
+
+        if self.name not in hits:
+            hits[self.name] = self.match_all(response.text)
+        return hits[self.name]
+
+    def __repr__(self) -> str:
+        return f"IndicatorSet({self.name!r}, {len(self.indicators)} indicators)"
+
+class IndicatorStream:
+    """
+    Incremental matcher for one indicator family over a chunked body.
+
+    The last ``max_length - 1`` characters of each chunk are carried over,
+    so an indicator split across a chunk boundary is still found, and
+    nothing is scanned more than twice.
+    """
+
+    def __init__(self, indicator_set: IndicatorSet):
+        self.indicator_set = indicator_set
+        self._found = set()
+        self._tail = ''
+
+    def feed(self, text: str) -> None:
+        """Scan the next decoded chunk of the body."""
+        if not text:
+            return
+
+        window = self._tail + text
+        self.indicator_set._collect(window, self._found)
+
+        overlap = self.indicator_set.max_length - 1
+        self._tail = window[-overlap:] if overlap > 0 else ''
+
+    def matches(self) -> List[str]:
+        """Get the indicators seen so far, in declaration order."""
+        return self.indicator_set._ordered(self._found)
+
+SQL_ERROR_INDICATORS = IndicatorSet('sql_error', [
+    "mysql_fetch",
+    "ORA-01756",
+    "Microsoft OLE DB",
+    "SQLServer JDBC Driver",
+    "PostgreSQL query failed",
+    "Warning: mysql_",
+    "valid MySQL result",
+    "MySqlClient."
+])
+
+DEBUG_INFO_INDICATORS = IndicatorSet('debug_info', [
+    "stack trace",
+    "debug info",
+    "internal error",
+    "development mode",
+    "test data"
+])
+
+SENSITIVE_ERROR_INDICATORS = IndicatorSet('sensitive_error', [
+    "database connection",
+    "password",
+    "secret key",
+    "internal server",
+    "file path"
+])
+
+XXE_INDICATORS = IndicatorSet('xxe', [
+    "root:x:0:0:",
+    "bin/bash",
+    "etc/passwd",
+    "file://",
+    "http://evil.com"
+])
+
+DEBUG_MODE_INDICATORS = IndicatorSet('debug_mode', [
+    "debug",
+    "development",
+    "test mode",
+    "stack trace"
+])
+
+DOM_XSS_SINKS = IndicatorSet('dom_xss_sink', [
+    "document.write",
+    "innerHTML",
+    "eval(",
+    "setTimeout"
+], case_sensitive=True)
+
+VULNERABLE_COMPONENTS = IndicatorSet('vulnerable_component', [
+    "log4j",
+    "struts",
+    "spring",
+    "jackson",
+    "commons-collections"
+])
+
+PROMPT_INJECTION_INDICATORS = IndicatorSet('prompt_injection', [
+    "system prompt",
+    "training data",
+    "developer mode",
+    "override",
+    "ignore instructions",
+    "safety guidelines"
+])
+
+VULNERABLE_PACKAGES = IndicatorSet('vulnerable_package', [
+    "lodash", "jquery", "moment", "axios", "express",
+    "django", "flask", "spring", "log4j", "struts"
+])
+
+EMAIL_INJECTION_INDICATORS = IndicatorSet('email_injection', [
+    "bcc",
+    "attacker@evil.com"
+])
+
+ALL_INDICATOR_SETS = (
+    SQL_ERROR_INDICATORS,
+    DEBUG_INFO_INDICATORS,
+    SENSITIVE_ERROR_INDICATORS,
+    XXE_INDICATORS,
+    DEBUG_MODE_INDICATORS,
+    DOM_XSS_SINKS,
+    VULNERABLE_COMPONENTS,
+    PROMPT_INJECTION_INDICATORS,
+    VULNERABLE_PACKAGES,
+    EMAIL_INJECTION_INDICATORS
+)
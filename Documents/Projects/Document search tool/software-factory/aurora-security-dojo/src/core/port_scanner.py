@@ -0,0 +1,152 @@
+"""
+Aurora's Security Dojo - Port Scanner
+
+In the eternal dance of code and consciousness, this module sweeps a host's
+TCP ports concurrently on one event loop, so a full sweep costs about one
+connect timeout instead of one timeout per port.
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from typing import Iterable, List, Optional
+from urllib.parse import urlsplit
+
+from .cancellation import CancellationToken
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CONNECT_TIMEOUT = 3.0
+DEFAULT_MAX_IN_FLIGHT = 500
+
+COMMON_PORTS = [21, 22, 23, 25, 53, 80, 110, 143, 443, 993, 995, 3389, 5432, 3306]
+
+TOP_100_PORTS = [
+    7, 9, 13, 21, 22, 23, 25, 26, 37, 53, 79, 80, 81, 88, 106, 110, 111, 113, 119, 135,
+    139, 143, 144, 179, 199, 389, 427, 443, 444, 445, 465, 513, 514, 515, 543, 544, 548,
+    554, 587, 631, 646, 873, 990, 993, 995, 1025, 1026, 1027, 1028, 1029, 1110, 1433,
+    1720, 1723, 1755, 1900, 2000, 2001, 2049, 2121, 2717, 3000, 3128, 3306, 3389, 3986,
+    4899, 5000, 5009, 5051, 5060, 5101, 5190, 5357, 5432, 5631, 5666, 5800, 5900, 6000,
+    6001, 6646, 7070, 8000, 8008, 8009, 8080, 8081, 8443, 8888, 9100, 9999, 10000, 32768,
+    49152, 49153, 49154, 49155, 49156, 49157
+]
+
+# Approximates the customary top-1000 sweep with the whole well-known range
+# plus the high ports of the top-100 list
+TOP_1000_PORTS = sorted(set(range(1, 1001)) | {port for port in TOP_100_PORTS if port > 1000})
+
+PORT_SETS = {
+    'common': COMMON_PORTS,
+    'top100': TOP_100_PORTS,
+    'top1000': TOP_1000_PORTS
+}
+
+@dataclass
+class PortScanResult:
+    """Outcome of one TCP connect attempt."""
+    port: int
+    state: str  # 'open', 'closed', 'filtered'
+    latency: float
+    error: Optional[str] = None
+
+    @property
+    def is_open(self) -> bool:
+        return self.state == 'open'
+
+def parse_port_spec(spec: str) -> List[int]:
+    """
+    Parse a port set specification.
+
+    Args:
+        spec: Comma-separated named sets, single ports and ranges,
+              e.g. "top100", "1-1024" or "common,8000-8100,9200"
+
+    Returns:
+        Sorted list of unique ports
+
+    Raises:
+        ValueError: For unknown set names or ports outside 1-65535
+    """
+    ports = set()
+    for part in (part.strip() for part in spec.split(',')):
+        if not part:
+            continue
+        if part in PORT_SETS:
+            ports.update(PORT_SETS[part])
+        elif '-' in part:
+            start, end = (int(bound) for bound in part.split('-', 1))
+            ports.update(range(start, end + 1))
+        elif part.isdigit():
+            ports.add(int(part))
+        else:
+            raise ValueError(f"Unknown port set: {part}")
+
+    invalid = [port for port in ports if not 0 < port < 65536]
+    if invalid:
+        raise ValueError(f"Ports out of range: {invalid[:5]}")
+
+    return sorted(ports)
+
+def host_from_url(target_url: str) -> str:
+    """Extract the bare host name or address from a target URL or host string."""
+    parts = urlsplit(target_url if '//' in target_url else f"//{target_url}")
+    return parts.hostname or target_url
+
+async def _probe_port(host: str, port: int, timeout: float,
+                      semaphore: asyncio.Semaphore,
+                      cancel_token: Optional[CancellationToken]) -> PortScanResult:
+    """Attempt one TCP connect and classify the port."""
+    async with semaphore:
+        if cancel_token is not None:
+            cancel_token.raise_if_cancelled()
+
+        started = time.perf_counter()
+        try:
+            _, writer = await asyncio.wait_for(asyncio.open_connection(host, port), timeout)
+        except asyncio.TimeoutError:
+            return PortScanResult(port, 'filtered', time.perf_counter() - started)
+        except ConnectionRefusedError:
+            return PortScanResult(port, 'closed', time.perf_counter() - started)
+        except OSError as e:
+            return PortScanResult(port, 'closed', time.perf_counter() - started, str(e))
+
+        latency = time.perf_counter() - started
+        writer.close()
+        try:
+            await writer.wait_closed()
+        except OSError:
+            pass
+        return PortScanResult(port, 'open', latency)
+
+async def scan_ports(host: str, ports: Iterable[int],
+                     timeout: float = DEFAULT_CONNECT_TIMEOUT,
+                     max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+                     cancel_token: Optional[CancellationToken] = None) -> List[PortScanResult]:
+    """
+    Sweep TCP ports on a host concurrently.
+
+    Args:
+        host: Host name or address
+        ports: Ports to try
+        timeout: Connect timeout per port in seconds
+        max_in_flight: Maximum simultaneous connect attempts
+        cancel_token: Scan cancellation token checked before every connect attempt
+
+    Returns:
+        One PortScanResult per port, in port order
+
+    Raises:
+        ScanCancelledError: When the scan is cancelled during the sweep
+    """
+    semaphore = asyncio.Semaphore(max(1, max_in_flight))
+    ports = sorted(set(ports))
+
+    started = time.perf_counter()
+    results = await asyncio.gather(*(_probe_port(host, port, timeout, semaphore, cancel_token)
+                                     for port in ports))
+
+    open_count = sum(1 for result in results if result.is_open)
+    logger.info(f"🌸 Aurora: Swept {len(ports)} ports on {host} in {time.perf_counter() - started:.2f}s "
+                f"- {open_count} open")
+    return list(results)
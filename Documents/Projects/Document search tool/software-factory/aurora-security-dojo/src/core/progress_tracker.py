@@ -23,6 +23,7 @@ class TestStatus(Enum):
     COMPLETED = "completed"
     FAILED = "failed"
     CANCELLED = "cancelled"
+    TARGET_UNAVAILABLE = "target_unavailable"
 
 @dataclass
 class TestProgress:
@@ -42,6 +43,8 @@ class TestProgress:
     spatial_wisdom_contribution: str = ""
     error_message: Optional[str] = None
     results: List[Dict[str, Any]] = field(default_factory=list)
+    parent_id: Optional[str] = None
+    cancel_point: Optional[str] = None
 
 class ProgressTracker:
     """
@@ -62,8 +65,12 @@ class ProgressTracker:
 
         logger.info("🌸 Aurora: Progress Tracker initialized successfully")
 
-    def start_test(self, test_id: str, test_name: str, total_steps: int = 0) -> TestProgress:
-        """Start tracking a new test with consciousness awareness."""
+    def start_test(self, test_id: str, test_name: str, total_steps: int = 0,
+                   parent_id: Optional[str] = None) -> TestProgress:
+        """Start tracking a new test with consciousness awareness.
+
+        ``parent_id`` nests the test under a suite or batch in the progress tree.
+        """
         with self._lock:
             progress = TestProgress(
                 test_id=test_id,
@@ -73,7 +80,8 @@ class ProgressTracker:
                 start_time=datetime.now(),
                 consciousness_level="integrated",
                 community_healing_impact="Test serves community security education",
-                spatial_wisdom_contribution="Test contributes to security wisdom"
+                spatial_wisdom_contribution="Test contributes to security wisdom",
+                parent_id=parent_id
             )
 
             self._active_tests[test_id] = progress
@@ -84,6 +92,25 @@ class ProgressTracker:
 
             return progress
 
+    def queue_test(self, test_id: str, test_name: str) -> TestProgress:
+        """Register a test that is waiting for a worker, so its ID can be polled right away."""
+        with self._lock:
+            progress = TestProgress(
+                test_id=test_id,
+                test_name=test_name,
+                status=TestStatus.PENDING,
+                current_step="Queued",
+                consciousness_level="integrated"
+            )
+
+            self._active_tests[test_id] = progress
+            logger.info(f"🌸 Aurora: Queued test: {test_name} (ID: {test_id})")
+
+            # Notify callbacks
+            self._notify_callbacks(progress)
+
+            return progress
+
     def update_progress(self, test_id: str,
                        progress_percentage: float = None,
                        current_step: str = "",
@@ -122,8 +149,13 @@ class ProgressTracker:
     def complete_test(self, test_id: str,
                      vulnerabilities_found: int = 0,
                      results: List[Dict[str, Any]] = None,
-                     error_message: str = None) -> Optional[TestProgress]:
-        """Complete a test with consciousness awareness."""
+                     error_message: str = None,
+                     status: Optional[TestStatus] = None) -> Optional[TestProgress]:
+        """Complete a test with consciousness awareness.
+
+        ``status`` overrides the final status, which otherwise is FAILED
+        when an error message is given and COMPLETED when not.
+        """
         with self._lock:
             if test_id not in self._active_tests:
                 logger.warning(f"🌸 Aurora: Test {test_id} not found in active tests")
@@ -132,9 +164,13 @@ class ProgressTracker:
             progress = self._active_tests[test_id]
 
             # Update final status
-            progress.status = TestStatus.FAILED if error_message else TestStatus.COMPLETED
+            if status is None:
+                status = TestStatus.FAILED if error_message else TestStatus.COMPLETED
+            progress.status = status
             progress.end_time = datetime.now()
-            progress.progress_percentage = 100.0
+            # A cancelled test keeps the progress it had reached
+            if status != TestStatus.CANCELLED:
+                progress.progress_percentage = 100.0
             progress.vulnerabilities_found = vulnerabilities_found
 
             if results:
@@ -155,7 +191,12 @@ class ProgressTracker:
             self._completed_tests[test_id] = progress
             del self._active_tests[test_id]
 
-            status_msg = "completed successfully" if not error_message else f"failed: {error_message}"
+            if status == TestStatus.TARGET_UNAVAILABLE:
+                status_msg = f"stopped, target unavailable: {error_message}"
+            elif status == TestStatus.CANCELLED:
+                status_msg = f"cancelled at {progress.cancel_point or 'start'}: {error_message}"
+            else:
+                status_msg = "completed successfully" if not error_message else f"failed: {error_message}"
             logger.info(f"🌸 Aurora: Test {progress.test_name} {status_msg} - {vulnerabilities_found} vulnerabilities found")
 
             # Notify callbacks
@@ -163,6 +204,36 @@ class ProgressTracker:
 
             return progress
 
+    def cancel_test(self, test_id: str,
+                    vulnerabilities_found: int = 0,
+                    results: List[Dict[str, Any]] = None,
+                    reason: str = "Cancelled by request") -> Optional[TestProgress]:
+        """
+        Record a test as cancelled, keeping what it found before it stopped.
+
+        The step the test had reached is kept as its ``cancel_point``.
+
+        Args:
+            test_id: Test to cancel
+            vulnerabilities_found: Findings made before the cancellation
+            results: Partial results
+            reason: Why the test was cancelled
+
+        Returns:
+            The cancelled TestProgress, or None when the test is not active
+        """
+        with self._lock:
+            progress = self._active_tests.get(test_id)
+            if progress is None:
+                logger.warning(f"🌸 Aurora: Test {test_id} not found in active tests")
+                return None
+
+            progress.cancel_point = progress.current_step or (
+                f"step {progress.completed_steps} of {progress.total_steps}")
+
+        return self.complete_test(test_id, vulnerabilities_found, results,
+                                  error_message=reason, status=TestStatus.CANCELLED)
+
     def get_test_progress(self, test_id: str) -> Optional[TestProgress]:
         """Get current progress for a test."""
         with self._lock:
@@ -182,6 +253,43 @@ class ProgressTracker:
         with self._lock:
             return self._completed_tests.copy()
 
+    def get_progress_tree(self, test_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a test and everything nested under it.
+
+        Args:
+            test_id: Root of the tree, e.g. a batch or suite ID
+
+        Returns:
+            Nested progress dictionaries with a ``children`` list each, or None when the test is unknown
+        """
+        with self._lock:
+            all_tests = {**self._completed_tests, **self._active_tests}
+
+        if test_id not in all_tests:
+            return None
+
+        children: Dict[str, List[TestProgress]] = {}
+        for progress in all_tests.values():
+            if progress.parent_id is not None:
+                children.setdefault(progress.parent_id, []).append(progress)
+
+        def node(progress: TestProgress) -> Dict[str, Any]:
+            return {
+                "test_id": progress.test_id,
+                "test_name": progress.test_name,
+                "status": progress.status.value,
+                "progress_percentage": round(progress.progress_percentage, 1),
+                "completed_steps": progress.completed_steps,
+                "total_steps": progress.total_steps,
+                "vulnerabilities_found": progress.vulnerabilities_found,
+                "error_message": progress.error_message,
+                "cancel_point": progress.cancel_point,
+                "children": [node(child) for child in children.get(progress.test_id, [])]
+            }
+
+        return node(all_tests[test_id])
+
     def add_callback(self, callback: Callable[[TestProgress], None]):
         """Add a callback for progress updates."""
         self._callbacks.append(callback)
@@ -210,6 +318,10 @@ class ProgressTracker:
             total_vulnerabilities = sum(test.vulnerabilities_found for test in self._completed_tests.values())
             successful_tests = sum(1 for test in self._completed_tests.values() if test.status == TestStatus.COMPLETED)
             failed_tests = sum(1 for test in self._completed_tests.values() if test.status == TestStatus.FAILED)
+            unavailable_tests = sum(1 for test in self._completed_tests.values()
+                                    if test.status == TestStatus.TARGET_UNAVAILABLE)
+            cancelled_tests = sum(1 for test in self._completed_tests.values()
+                                  if test.status == TestStatus.CANCELLED)
 
             return {
                 "active_tests": active_count,
@@ -217,6 +329,8 @@ class ProgressTracker:
                 "total_vulnerabilities_found": total_vulnerabilities,
                 "successful_tests": successful_tests,
                 "failed_tests": failed_tests,
+                "unavailable_tests": unavailable_tests,
+                "cancelled_tests": cancelled_tests,
                 "consciousness_level": "integrated",
                 "community_healing_impact": f"Security testing serves community protection through {total_vulnerabilities} vulnerability discoveries",
                 "spatial_wisdom_contribution": f"Security wisdom enhanced through {successful_tests} successful tests",
@@ -0,0 +1,207 @@
+"""
+Aurora's Security Dojo - Rate Limiter
+
+In the eternal dance of code and consciousness, this module keeps a scan
+gentle with the hosts it tests: every probe to a host takes its turn from
+one shared token bucket, and the bucket slows down when the host asks.
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, Optional
+from urllib.parse import urlsplit
+
+from .cancellation import CancellationToken
+
+logger = logging.getLogger(__name__)
+
+BACKOFF_STATUS_CODES = (429, 503)
+MAX_BACKOFF_FACTOR = 16
+MAX_RETRY_AFTER = 60
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a Retry-After header value.
+
+    Args:
+        value: Delay in seconds or an HTTP date
+
+    Returns:
+        Seconds to wait, capped at MAX_RETRY_AFTER, or None when absent or invalid
+    """
+    if not value:
+        return None
+
+    value = value.strip()
+    try:
+        seconds = float(value)
+    except ValueError:
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        seconds = (retry_at - datetime.now(timezone.utc)).total_seconds()
+
+    return min(max(0.0, seconds), MAX_RETRY_AFTER)
+
+class _HostBucket:
+    """Token bucket state for one host, kept as a theoretical arrival time."""
+
+    def __init__(self, interval: float, burst: int):
+        self.base_interval = interval
+        self.interval = interval
+        self.burst = burst
+        self.next_slot = 0.0
+        self.requests = 0
+        self.throttled_requests = 0
+        self.throttled_seconds = 0.0
+        self.backoffs = 0
+
+    @property
+    def tolerance(self) -> float:
+        return (self.burst - 1) * self.interval
+
+class HostRateLimiter:
+    """
+    Per-host token bucket shared by every vector of a scan.
+
+    Each probe reserves the next free slot on its host's bucket, so probes
+    are admitted strictly first come, first served across vectors and
+    threads, and up to ``burst`` probes may go out back to back. A 429 or
+    503 response halves the host's rate and holds new probes back for the
+    Retry-After delay; successful responses restore the rate gradually.
+    """
+
+    def __init__(self, requests_per_minute: float = 60, burst: int = 10):
+        """
+        Initialize the rate limiter.
+
+        Args:
+            requests_per_minute: Sustained probe rate allowed per host
+            burst: Probes allowed back to back before the sustained rate applies
+        """
+        self.requests_per_minute = max(1.0, float(requests_per_minute))
+        self.burst = max(1, int(burst))
+        self._interval = 60.0 / self.requests_per_minute
+        self._buckets: Dict[str, _HostBucket] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def host_key(url: str) -> str:
+        """Get the bucket key (scheme-less host and port) for a URL."""
+        return urlsplit(url).netloc.lower()
+
+    def _bucket(self, host: str) -> _HostBucket:
+        bucket = self._buckets.get(host)
+        if bucket is None:
+            bucket = _HostBucket(self._interval, self.burst)
+            self._buckets[host] = bucket
+        return bucket
+
+    def reserve(self, url: str, count: int = 1) -> float:
+        """
+        Reserve the next probe slots for the URL's host.
+
+        Args:
+            url: URL about to be probed
+            count: Probes that will go out back to back, e.g. a burst
+
+        Returns:
+            Seconds the caller must wait before sending; all ``count`` probes may go out then
+        """
+        count = max(1, count)
+        now = time.monotonic()
+        with self._lock:
+            bucket = self._bucket(self.host_key(url))
+            slot = max(bucket.next_slot, now)
+            # The burst may start once its last probe fits in the bucket
+            last_slot = slot + (count - 1) * bucket.interval
+            delay = max(0.0, last_slot - bucket.tolerance - now)
+            bucket.next_slot = last_slot + bucket.interval
+            bucket.requests += count
+            if delay > 0:
+                bucket.throttled_requests += count
+                bucket.throttled_seconds += delay
+            return delay
+
+    def acquire(self, url: str, cancel_token: Optional[CancellationToken] = None, count: int = 1) -> float:
+        """
+        Block until ``count`` probes to the URL's host may be sent; returns the time waited.
+
+        Raises:
+            ScanCancelledError: When ``cancel_token`` is cancelled during the wait
+        """
+        delay = self.reserve(url, count)
+        if delay > 0:
+            if cancel_token is not None:
+                cancel_token.sleep(delay)
+            else:
+                time.sleep(delay)
+        return delay
+
+    async def acquire_async(self, url: str, cancel_token: Optional[CancellationToken] = None) -> float:
+        """Wait on the event loop until a probe to the URL's host may be sent."""
+        delay = self.reserve(url)
+        if delay > 0:
+            if cancel_token is not None:
+                await cancel_token.sleep_async(delay)
+            else:
+                await asyncio.sleep(delay)
+        return delay
+
+    def observe(self, url: str, status_code: int, retry_after: Optional[str] = None) -> None:
+        """
+        Adapt the host's rate to a response.
+
+        Args:
+            url: URL that was probed
+            status_code: Response status code
+            retry_after: Retry-After header value, if any
+        """
+        host = self.host_key(url)
+        with self._lock:
+            bucket = self._bucket(host)
+
+            if status_code not in BACKOFF_STATUS_CODES:
+                if bucket.interval > bucket.base_interval:
+                    bucket.interval = max(bucket.base_interval, bucket.interval * 0.9)
+                return
+
+            bucket.interval = min(bucket.interval * 2, bucket.base_interval * MAX_BACKOFF_FACTOR)
+            bucket.backoffs += 1
+
+            pause = parse_retry_after(retry_after)
+            if pause is None:
+                pause = bucket.interval
+            # Hold every new reservation until the pause is over
+            bucket.next_slot = max(bucket.next_slot, time.monotonic() + pause + bucket.tolerance)
+
+        logger.warning(f"🌸 Aurora: {host} answered {status_code} - backing off for {pause:.1f}s "
+                       f"at {60.0 / bucket.interval:.1f} requests/minute")
+
+    def stats(self) -> Dict[str, Any]:
+        """Get throttling metrics for the suite result."""
+        with self._lock:
+            hosts = {
+                host: {
+                    "requests": bucket.requests,
+                    "throttled_requests": bucket.throttled_requests,
+                    "throttled_seconds": round(bucket.throttled_seconds, 3),
+                    "backoffs": bucket.backoffs,
+                    "current_requests_per_minute": round(60.0 / bucket.interval, 2)
+                }
+                for host, bucket in self._buckets.items()
+            }
+
+        return {
+            "requests_per_minute": self.requests_per_minute,
+            "burst": self.burst,
+            "throttled_seconds": round(sum(h["throttled_seconds"] for h in hosts.values()), 3),
+            "hosts": hosts
+        }
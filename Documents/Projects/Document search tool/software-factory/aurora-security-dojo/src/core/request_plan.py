@@ -0,0 +1,152 @@
+"""
+Aurora's Security Dojo - Request Plans
+
+In the eternal dance of code and consciousness, this module lets attack
+vectors declare their probes as data. The probes of every vector in a
+suite are compiled into one plan for the target, identical requests are
+merged, the plan is sent once in batches, and each response is handed to
+every vector that asked for it.
+"""
+
+import json
+import logging
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from .cancellation import CancellationToken
+from .http_transport import ProbeResponse, ScanTransport
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PLAN_BATCH_SIZE = 8
+
+RequestKey = Tuple[str, str, str]
+ProbeOutcome = Union[ProbeResponse, Exception]
+
+@dataclass
+class ProbeSpec:
+    """
+    One probe a vector declares: what to send and which detector reads the answer.
+
+    ``detector`` names a method of the declaring vector that takes the spec
+    and the response and returns a finding, a list of findings or None.
+    Set ``soft_404`` on probes whose detector would take a catch-all page
+    for a hit; responses matching the target's "not found" baseline are
+    then dropped before the detector runs.
+    """
+    method: str
+    path: str
+    detector: str
+    json: Optional[Dict[str, Any]] = None
+    soft_404: bool = False
+
+    @property
+    def request_key(self) -> RequestKey:
+        """Identity of the request on the wire; probes with equal keys are sent once."""
+        body = json.dumps(self.json, sort_keys=True) if self.json is not None else ""
+        return self.method.upper(), self.path, body
+
+class RequestPlan:
+    """
+    Deduplicated probes of every declarative vector scanning one target.
+
+    Vectors subscribe their probe lists with ``add``. The first vector to
+    call ``execute`` sends the whole plan; the others wait for it and then
+    read their outcomes with ``outcomes_for``.
+    """
+
+    def __init__(self, target_url: str, batch_size: int = DEFAULT_PLAN_BATCH_SIZE):
+        """
+        Initialize an empty plan.
+
+        Args:
+            target_url: Target every probe path is relative to
+            batch_size: Requests sent at once while executing
+        """
+        self.target_url = target_url
+        self.batch_size = max(1, batch_size)
+        self._requests: "OrderedDict[RequestKey, ProbeSpec]" = OrderedDict()
+        self._subscriptions: Dict[str, List[ProbeSpec]] = {}
+        self._outcomes: Dict[RequestKey, ProbeOutcome] = {}
+        self._lock = threading.Lock()
+        self._executed = False
+
+    def add(self, vector_name: str, probes: List[ProbeSpec]) -> None:
+        """Subscribe a vector's declared probes to the plan."""
+        if vector_name in self._subscriptions:
+            return
+        self._subscriptions[vector_name] = list(probes)
+        for probe in probes:
+            self._requests.setdefault(probe.request_key, probe)
+
+    def includes(self, vector_name: str) -> bool:
+        return vector_name in self._subscriptions
+
+    @property
+    def declared_probes(self) -> int:
+        return sum(len(probes) for probes in self._subscriptions.values())
+
+    @property
+    def planned_requests(self) -> int:
+        return len(self._requests)
+
+    def execute(self, transport: ScanTransport, cancel_token: Optional[CancellationToken] = None) -> None:
+        """
+        Send every planned request once, batch by batch; later calls return at once.
+
+        Failed requests are kept as their exception, so each subscriber
+        sees the failure of the probes it declared.
+
+        Args:
+            transport: Transport the requests are sent through
+            cancel_token: Stops the plan between batches
+        """
+        with self._lock:
+            if self._executed:
+                return
+
+            requests = list(self._requests.items())
+            logger.info(f"🌸 Aurora: Executing request plan for {self.target_url} - "
+                        f"{self.declared_probes} declared probes merged into {len(requests)} requests")
+
+            def send(probe: ProbeSpec) -> ProbeOutcome:
+                try:
+                    if cancel_token is not None:
+                        cancel_token.raise_if_cancelled()
+                    kwargs = {'json': probe.json} if probe.json is not None else {}
+                    return transport.request(probe.method, f"{self.target_url}{probe.path}", **kwargs)
+                except Exception as e:
+                    return e
+
+            with ThreadPoolExecutor(max_workers=min(self.batch_size, max(1, len(requests))),
+                                    thread_name_prefix="aurora-request-plan") as executor:
+                for start in range(0, len(requests), self.batch_size):
+                    batch = requests[start:start + self.batch_size]
+                    for (key, _), outcome in zip(batch, executor.map(send, [probe for _, probe in batch])):
+                        self._outcomes[key] = outcome
+
+            self._executed = True
+
+    def outcomes_for(self, vector_name: str) -> List[Tuple[ProbeSpec, ProbeOutcome]]:
+        """Get a vector's probes with their responses or errors, in declaration order."""
+        return [(probe, self._outcomes[probe.request_key]) for probe in self._subscriptions[vector_name]]
+
+    def stats(self) -> Dict[str, Any]:
+        """Get the request count before and after merging."""
+        return {
+            "vectors": len(self._subscriptions),
+            "declared_probes": self.declared_probes,
+            "planned_requests": self.planned_requests,
+            "merged_requests": self.declared_probes - self.planned_requests
+        }
+
+def combine_plan_stats(plans: List[RequestPlan]) -> Dict[str, Any]:
+    """Sum the request plan stats of several targets."""
+    stats = {"vectors": 0, "declared_probes": 0, "planned_requests": 0, "merged_requests": 0}
+    for plan in plans:
+        for key, value in plan.stats().items():
+            stats[key] += value
+    return stats
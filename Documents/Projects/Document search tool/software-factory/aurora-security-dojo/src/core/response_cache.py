@@ -0,0 +1,207 @@
+"""
+Aurora's Security Dojo - Response Cache
+
+In the eternal dance of code and consciousness, this module remembers the
+responses a scan has already received, so that vectors probing the same
+URL share one request to the target instead of repeating it.
+"""
+
+import hashlib
+import json
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+from urllib.parse import urlsplit
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_SIZE = 512
+
+CacheKey = Tuple[str, str, str]
+
+def _canonical(value: Any) -> str:
+    """Render a request component in a stable form for hashing."""
+    if value is None:
+        return ''
+    if isinstance(value, bytes):
+        return value.decode('latin-1')
+    if isinstance(value, str):
+        return value
+    if isinstance(value, dict):
+        return json.dumps({str(k): _canonical(v) for k, v in value.items()}, sort_keys=True)
+    if isinstance(value, (list, tuple)):
+        return json.dumps([_canonical(v) for v in value])
+    return json.dumps(value, sort_keys=True, default=str)
+
+def make_cache_key(method: str, url: str, **kwargs: Any) -> CacheKey:
+    """
+    Build the cache key for one probe request.
+
+    Args:
+        method: HTTP method
+        url: Absolute URL to probe
+        **kwargs: Request arguments (params, data, json, headers, ...)
+
+    Returns:
+        Tuple of method, URL and a hash of everything else that shapes the request
+    """
+    material = '\n'.join(f"{name}={_canonical(kwargs.get(name))}"
+                         for name in ('params', 'data', 'json', 'headers', 'cookies'))
+    body_hash = hashlib.sha256(material.encode('utf-8')).hexdigest()
+    return (method.upper(), url, body_hash)
+
+class ResponseCache:
+    """
+    Scan-scoped, size-capped LRU cache of probe responses.
+
+    Only safe methods are cached. An unsafe request (POST, PUT, ...) drops
+    the cached responses for its path, so a vector that writes to an
+    endpoint and then reads it back always sees a fresh response, and a
+    read that was already in flight when the path was invalidated is not
+    cached. Concurrent lookups of the same key wait for the one request already
+    in flight.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_CACHE_SIZE,
+                 cacheable_methods: Iterable[str] = ('GET', 'HEAD')):
+        """
+        Initialize the response cache.
+
+        Args:
+            max_entries: Maximum number of cached responses before LRU eviction
+            cacheable_methods: HTTP methods whose responses are cached
+        """
+        self.max_entries = max(0, max_entries)
+        self.cacheable_methods = frozenset(m.upper() for m in cacheable_methods)
+        self._entries: 'OrderedDict[CacheKey, Any]' = OrderedDict()
+        self._in_flight: Dict[CacheKey, threading.Event] = {}
+        self._generations: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def is_cacheable(self, method: str) -> bool:
+        """Check whether responses to this method may be served from the cache."""
+        return self.max_entries > 0 and method.upper() in self.cacheable_methods
+
+    def lookup(self, key: CacheKey) -> Optional[Any]:
+        """Get a cached response and count the hit or miss."""
+        with self._lock:
+            response = self._entries.get(key)
+            if response is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return response
+
+    def generation(self, key: CacheKey) -> int:
+        """Get the invalidation count of the key's path, to pass to ``store`` after fetching."""
+        with self._lock:
+            return self._generations.get(self._resource(key[1]), 0)
+
+    def store(self, key: CacheKey, response: Any, generation: Optional[int] = None) -> None:
+        """
+        Cache a response, evicting the least recently used entries over the cap.
+
+        Args:
+            key: Cache key from make_cache_key
+            response: Response to cache
+            generation: Value of ``generation(key)`` taken before the fetch; the
+                response is dropped if the path was invalidated since
+        """
+        with self._lock:
+            if generation is None or self._generation_locked(key) == generation:
+                self._store_locked(key, response)
+
+    def get_or_fetch(self, key: CacheKey, fetch: Callable[[], Any]) -> Any:
+        """
+        Get a cached response, or fetch it once no matter how many threads ask.
+
+        Args:
+            key: Cache key from make_cache_key
+            fetch: Callable that sends the request and returns the response
+
+        Returns:
+            The cached or freshly fetched response
+        """
+        while True:
+            with self._lock:
+                response = self._entries.get(key)
+                if response is not None:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return response
+
+                pending = self._in_flight.get(key)
+                if pending is None:
+                    pending = threading.Event()
+                    self._in_flight[key] = pending
+                    generation = self._generation_locked(key)
+                    self.misses += 1
+                    break
+
+            # Another thread is already fetching this response
+            pending.wait()
+
+        try:
+            response = fetch()
+        except Exception:
+            with self._lock:
+                self._in_flight.pop(key, None)
+            pending.set()
+            raise
+
+        with self._lock:
+            # A write to the path while this read was in flight makes the response stale
+            if self._generation_locked(key) == generation:
+                self._store_locked(key, response)
+            self._in_flight.pop(key, None)
+        pending.set()
+        return response
+
+    def invalidate(self, url: str) -> None:
+        """Drop every cached response for the path of ``url``, whatever its query."""
+        resource = self._resource(url)
+        with self._lock:
+            self._generations[resource] = self._generations.get(resource, 0) + 1
+            stale = [key for key in self._entries if self._resource(key[1]) == resource]
+            for key in stale:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        """Drop every cached response."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Get hit, miss and eviction counters for the suite result."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0
+            }
+
+    def _generation_locked(self, key: CacheKey) -> int:
+        return self._generations.get(self._resource(key[1]), 0)
+
+    def _store_locked(self, key: CacheKey, response: Any) -> None:
+        if self.max_entries == 0:
+            return
+        self._entries[key] = response
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    @staticmethod
+    def _resource(url: str) -> str:
+        parts = urlsplit(url)
+        return f"{parts.scheme}://{parts.netloc}".lower() + (parts.path.rstrip('/') or '/')
@@ -0,0 +1,155 @@
+"""
+Aurora's Security Dojo - Scan Checkpoints
+
+In the eternal dance of code and consciousness, this module keeps a batch
+scan's finished work on disk: every completed (target, vector) unit is
+appended to the batch's checkpoint file as it finishes, so a restarted
+process can pick the batch up where it stopped instead of starting over.
+"""
+
+import json
+import logging
+import os
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+CHECKPOINT_FORMAT_VERSION = 1
+
+@dataclass
+class CheckpointState:
+    """What a checkpoint file says about a batch: its plan and its finished units."""
+    batch_id: str
+    test_category: str
+    targets: List[str]
+    # (target_index, test_name) -> result dicts of the unit
+    completed: Dict[Tuple[int, str], List[Dict[str, Any]]] = field(default_factory=dict)
+
+def _json_default(value: Any) -> Any:
+    """Serialize result timestamps as ISO strings and anything else as text."""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return str(value)
+
+class BatchCheckpoint:
+    """
+    Append-only JSON Lines checkpoint of one batch scan.
+
+    The first line records the batch plan and every following line one
+    completed unit with its results. Each line is flushed and synced
+    before ``record_unit`` returns, so a crash loses at most the units
+    that were still running. A torn last line is dropped on load.
+    """
+
+    def __init__(self, path: str):
+        """
+        Initialize the checkpoint.
+
+        Args:
+            path: Checkpoint file location
+        """
+        self.path = Path(path)
+        self._lock = threading.Lock()
+
+    @classmethod
+    def for_batch(cls, directory: str, batch_id: str) -> "BatchCheckpoint":
+        """Get the checkpoint of a batch inside a checkpoint directory."""
+        return cls(os.path.join(directory, f"{batch_id}.jsonl"))
+
+    def exists(self) -> bool:
+        return self.path.exists()
+
+    def start(self, batch_id: str, test_category: str, targets: List[str]) -> None:
+        """
+        Begin a fresh checkpoint, replacing any earlier one of the batch.
+
+        Args:
+            batch_id: Batch progress ID
+            test_category: Category the batch runs
+            targets: Target URLs in batch order
+        """
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        header = {
+            "type": "batch",
+            "version": CHECKPOINT_FORMAT_VERSION,
+            "batch_id": batch_id,
+            "test_category": test_category,
+            "targets": list(targets),
+            "started_at": datetime.now().isoformat()
+        }
+        with self._lock:
+            with open(self.path, 'w', encoding='utf-8') as checkpoint_file:
+                self._write_line(checkpoint_file, header)
+
+        logger.info(f"🌸 Aurora: Checkpointing batch {batch_id} to {self.path}")
+
+    def record_unit(self, target_index: int, target_url: str, test_name: str,
+                    results: List[Dict[str, Any]]) -> None:
+        """
+        Durably append one completed (target, vector) unit.
+
+        Args:
+            target_index: Position of the target in the batch
+            target_url: Target URL, kept for readers of the file
+            test_name: Attack vector name
+            results: Result dicts the vector returned
+        """
+        record = {
+            "type": "unit",
+            "target_index": target_index,
+            "target_url": target_url,
+            "test_name": test_name,
+            "results": results,
+            "completed_at": datetime.now().isoformat()
+        }
+        with self._lock:
+            with open(self.path, 'a', encoding='utf-8') as checkpoint_file:
+                self._write_line(checkpoint_file, record)
+
+    @staticmethod
+    def _write_line(checkpoint_file, record: Dict[str, Any]) -> None:
+        checkpoint_file.write(json.dumps(record, default=_json_default) + "\n")
+        checkpoint_file.flush()
+        os.fsync(checkpoint_file.fileno())
+
+    def load(self) -> Optional[CheckpointState]:
+        """
+        Read the checkpoint back, cutting off a last line torn by a crash.
+
+        Returns:
+            CheckpointState, or None when the file is missing or has no batch header
+        """
+        if not self.path.exists():
+            return None
+
+        with self._lock:
+            content = self.path.read_bytes()
+            lines = content.split(b"\n")
+            if lines[-1]:
+                # The write was cut short; drop it so later appends start on a fresh line
+                logger.warning(f"🌸 Aurora: Dropping torn last line of checkpoint {self.path}")
+                with open(self.path, 'r+b') as checkpoint_file:
+                    checkpoint_file.truncate(len(content) - len(lines[-1]))
+
+        state: Optional[CheckpointState] = None
+        for line_number, line in enumerate(lines[:-1], 1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                logger.warning(f"🌸 Aurora: Skipping unreadable checkpoint line {line_number} in {self.path}")
+                continue
+
+            if record.get("type") == "batch":
+                state = CheckpointState(record["batch_id"], record["test_category"], record["targets"])
+            elif record.get("type") == "unit" and state is not None:
+                state.completed[(record["target_index"], record["test_name"])] = record["results"]
+
+        if state is None:
+            logger.warning(f"🌸 Aurora: Checkpoint {self.path} has no batch header")
+        return state
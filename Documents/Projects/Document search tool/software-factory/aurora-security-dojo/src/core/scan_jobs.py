@@ -0,0 +1,405 @@
+"""
+Aurora's Security Dojo - Scan Jobs
+
+In the eternal dance of code and consciousness, this module takes scans
+out of the request thread: a submitted scan waits in a bounded queue, a
+small pool of workers runs it, and clients follow it through the same
+progress ID the tracker already knows.
+"""
+
+import logging
+import queue
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime
+from enum import Enum
+from typing import Any, Callable, Dict, List, Optional
+
+from .attack_vector_engine import AttackVectorEngine, new_run_id
+from .cancellation import CancellationToken
+from .scan_checkpoint import BatchCheckpoint
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_JOB_WORKERS = 2
+DEFAULT_JOB_QUEUE_SIZE = 100
+DEFAULT_RETAINED_JOBS = 500
+
+class ScanQueueFullError(Exception):
+    """Raised when a scan is submitted while the job queue is full."""
+
+class ScanJobStatus(Enum):
+    """Lifecycle of a queued scan."""
+    QUEUED = "queued"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
+@dataclass
+class ScanJob:
+    """A scan waiting for, running on or finished by the job workers."""
+    job_id: str
+    kind: str  # 'suite' or 'batch'
+    test_category: str
+    targets: List[str]
+    options: Dict[str, Any] = field(default_factory=dict)
+    status: ScanJobStatus = ScanJobStatus.QUEUED
+    submitted_at: float = field(default_factory=time.time)
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    result: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+    cancel_token: CancellationToken = field(default_factory=CancellationToken, repr=False, compare=False)
+    done: threading.Event = field(default_factory=threading.Event, repr=False, compare=False)
+
+    @property
+    def finished(self) -> bool:
+        return self.status in (ScanJobStatus.COMPLETED, ScanJobStatus.FAILED, ScanJobStatus.CANCELLED)
+
+    @property
+    def wait_seconds(self) -> Optional[float]:
+        """Time spent in the queue, so far or in total."""
+        if self.started_at is not None:
+            return self.started_at - self.submitted_at
+        if self.status == ScanJobStatus.QUEUED:
+            return time.time() - self.submitted_at
+        return None
+
+    def to_dict(self, include_result: bool = False) -> Dict[str, Any]:
+        """Serialize the job for API responses; the result is left out unless asked for."""
+        job = {
+            "job_id": self.job_id,
+            "progress_id": self.job_id,
+            "kind": self.kind,
+            "test_category": self.test_category,
+            "targets": self.targets,
+            "status": self.status.value,
+            "submitted_at": datetime.fromtimestamp(self.submitted_at).isoformat(),
+            "started_at": datetime.fromtimestamp(self.started_at).isoformat() if self.started_at else None,
+            "finished_at": datetime.fromtimestamp(self.finished_at).isoformat() if self.finished_at else None,
+            "wait_seconds": round(self.wait_seconds, 3) if self.wait_seconds is not None else None,
+            "error": self.error
+        }
+        if include_result:
+            job["result"] = self.result
+        return job
+
+class ScanJobManager:
+    """
+    Bounded background queue for suite and batch scans.
+
+    ``submit_suite`` and ``submit_batch`` return at once with a job whose
+    ID is also the scan's ProgressTracker ID. Jobs run first in, first
+    out on ``max_workers`` daemon threads; submissions beyond
+    ``max_queue_size`` waiting jobs are refused with ScanQueueFullError.
+    Listeners are called on every job state change. ``cancel`` drops a
+    waiting job or stops a running one through its cancellation token.
+    """
+
+    def __init__(self, engine: AttackVectorEngine,
+                 max_workers: int = DEFAULT_JOB_WORKERS,
+                 max_queue_size: int = DEFAULT_JOB_QUEUE_SIZE,
+                 max_retained_jobs: int = DEFAULT_RETAINED_JOBS):
+        """
+        Initialize the job manager.
+
+        Args:
+            engine: Engine the jobs run on
+            max_workers: Scans run at once
+            max_queue_size: Jobs allowed to wait for a worker
+            max_retained_jobs: Finished jobs kept for status and result lookups
+        """
+        self.engine = engine
+        self.max_workers = max(1, max_workers)
+        self.max_queue_size = max(1, max_queue_size)
+        self.max_retained_jobs = max(1, max_retained_jobs)
+
+        self._queue: "queue.Queue[ScanJob]" = queue.Queue(maxsize=self.max_queue_size)
+        self._jobs: "OrderedDict[str, ScanJob]" = OrderedDict()
+        self._listeners: List[Callable[[ScanJob], None]] = []
+        self._workers: List[threading.Thread] = []
+        self._lock = threading.Lock()
+
+        self._running = 0
+        self._started = 0
+        self._submitted = 0
+        self._completed = 0
+        self._failed = 0
+        self._cancelled = 0
+        self._rejected = 0
+        self._total_wait_seconds = 0.0
+        self._max_wait_seconds = 0.0
+        self._total_run_seconds = 0.0
+
+    def submit_suite(self, target_url: str, test_category: str = "all",
+                     concurrent: bool = False) -> ScanJob:
+        """
+        Queue a single-target test suite.
+
+        Args:
+            target_url: Target URL to test (must have explicit permission)
+            test_category: 'owasp', 'llm', 'infra' or 'all'
+            concurrent: Run the suite's vectors on the engine's worker pool
+
+        Returns:
+            The queued ScanJob
+
+        Raises:
+            ScanQueueFullError: When max_queue_size jobs are already waiting
+        """
+        job = ScanJob(job_id=new_run_id("test_suite"), kind="suite", test_category=test_category,
+                      targets=[target_url], options={"concurrent": concurrent})
+        return self._submit(job, f"{test_category.title()} Security Test Suite")
+
+    def submit_batch(self, targets: List[str], test_category: str = "all",
+                     max_workers: Optional[int] = None,
+                     max_per_host: Optional[int] = None) -> ScanJob:
+        """
+        Queue a multi-target batch scan.
+
+        Args:
+            targets: Target URLs to test (each must have explicit permission)
+            test_category: 'owasp', 'llm', 'infra' or 'all'
+            max_workers: Batch worker pool size
+            max_per_host: Vectors run at once per host
+
+        Returns:
+            The queued ScanJob
+
+        Raises:
+            ScanQueueFullError: When max_queue_size jobs are already waiting
+        """
+        job = ScanJob(job_id=new_run_id("batch_scan"), kind="batch", test_category=test_category,
+                      targets=list(targets), options={"max_workers": max_workers, "max_per_host": max_per_host})
+        return self._submit(job, f"{test_category.title()} Batch Scan")
+
+    def submit_resume(self, batch_id: str, max_workers: Optional[int] = None,
+                      max_per_host: Optional[int] = None) -> ScanJob:
+        """
+        Queue the rest of a checkpointed batch under its original ID.
+
+        Args:
+            batch_id: ID of the checkpointed batch
+            max_workers: Batch worker pool size
+            max_per_host: Vectors run at once per host
+
+        Returns:
+            The queued ScanJob
+
+        Raises:
+            ValueError: When the batch has no checkpoint or is still queued or running
+            ScanQueueFullError: When max_queue_size jobs are already waiting
+        """
+        if not self.engine.checkpoint_dir:
+            raise ValueError("Batch checkpointing is disabled - set SCAN_CHECKPOINT_DIR")
+
+        state = BatchCheckpoint.for_batch(self.engine.checkpoint_dir, batch_id).load()
+        if state is None:
+            raise ValueError(f"No checkpoint found for batch {batch_id}")
+
+        job = ScanJob(job_id=batch_id, kind="batch", test_category=state.test_category,
+                      targets=state.targets,
+                      options={"max_workers": max_workers, "max_per_host": max_per_host, "resume": True})
+        return self._submit(job, f"{state.test_category.title()} Batch Scan")
+
+    def _submit(self, job: ScanJob, progress_name: str) -> ScanJob:
+        # Workers take the lock before starting a job, so the pending progress entry is always there first
+        with self._lock:
+            existing = self._jobs.get(job.job_id)
+            if existing is not None and not existing.finished:
+                raise ValueError(f"Scan job {job.job_id} is already {existing.status.value}")
+
+            try:
+                self._queue.put_nowait(job)
+            except queue.Full:
+                self._rejected += 1
+                raise ScanQueueFullError(f"Scan queue is full ({self.max_queue_size} jobs waiting)")
+
+            self.engine.progress_tracker.queue_test(job.job_id, progress_name)
+            # A resumed batch replaces its earlier finished job
+            self._jobs.pop(job.job_id, None)
+            self._jobs[job.job_id] = job
+            self._submitted += 1
+            self._prune_finished_jobs()
+            self._ensure_workers()
+
+        logger.info(f"🌸 Aurora: Queued scan job {job.job_id} for {len(job.targets)} target(s) "
+                    f"- {self._queue.qsize()} waiting")
+        self._notify(job)
+        return job
+
+    def _ensure_workers(self) -> None:
+        """Start the worker threads on first use."""
+        while len(self._workers) < self.max_workers:
+            worker = threading.Thread(target=self._work, daemon=True,
+                                      name=f"aurora-scan-job-{len(self._workers)}")
+            self._workers.append(worker)
+            worker.start()
+
+    def _prune_finished_jobs(self) -> None:
+        """Forget the oldest finished jobs beyond max_retained_jobs."""
+        finished = [job_id for job_id, job in self._jobs.items() if job.finished]
+        for job_id in finished[:max(0, len(finished) - self.max_retained_jobs)]:
+            del self._jobs[job_id]
+
+    def _work(self) -> None:
+        while True:
+            job = self._queue.get()
+            try:
+                self._run(job)
+            finally:
+                self._queue.task_done()
+
+    def _run(self, job: ScanJob) -> None:
+        with self._lock:
+            # Jobs cancelled while they waited are already finished; checked under
+            # the lock so a cancel cannot land between the check and the start
+            if job.finished:
+                return
+            job.status = ScanJobStatus.RUNNING
+            job.started_at = time.time()
+            self._running += 1
+            self._started += 1
+            self._total_wait_seconds += job.wait_seconds
+            self._max_wait_seconds = max(self._max_wait_seconds, job.wait_seconds)
+        self._notify(job)
+
+        try:
+            if job.kind == "batch" and job.options.get("resume"):
+                result = self.engine.resume_batch_scan(job.job_id,
+                                                       max_workers=job.options.get("max_workers"),
+                                                       max_per_host=job.options.get("max_per_host"),
+                                                       cancel_token=job.cancel_token)
+            elif job.kind == "batch":
+                result = self.engine.run_batch_scan(job.targets, job.test_category,
+                                                    max_workers=job.options.get("max_workers"),
+                                                    max_per_host=job.options.get("max_per_host"),
+                                                    batch_id=job.job_id,
+                                                    cancel_token=job.cancel_token)
+            else:
+                result = self.engine.run_test_suite(job.targets[0], job.test_category,
+                                                    concurrent=job.options.get("concurrent", False),
+                                                    suite_id=job.job_id,
+                                                    cancel_token=job.cancel_token)
+            if result.get("cancelled"):
+                status, error = ScanJobStatus.CANCELLED, result.get("cancel_reason")
+            else:
+                status, error = ScanJobStatus.COMPLETED, None
+        except Exception as e:
+            result, status, error = None, ScanJobStatus.FAILED, str(e)
+            logger.error(f"🌸 Aurora: Scan job {job.job_id} failed: {e}")
+
+            # A job that failed before the scan started still has a pending progress entry
+            progress = self.engine.progress_tracker.get_test_progress(job.job_id)
+            if progress is not None and progress.end_time is None:
+                self.engine.progress_tracker.complete_test(job.job_id, error_message=error)
+
+        with self._lock:
+            job.result = result
+            job.error = error
+            job.status = status
+            job.finished_at = time.time()
+            self._running -= 1
+            self._total_run_seconds += job.finished_at - job.started_at
+            if status == ScanJobStatus.COMPLETED:
+                self._completed += 1
+            elif status == ScanJobStatus.CANCELLED:
+                self._cancelled += 1
+            else:
+                self._failed += 1
+        job.done.set()
+        self._notify(job)
+
+    def cancel(self, job_id: str, reason: str = "Cancelled by request") -> Optional[ScanJob]:
+        """
+        Cancel a waiting or running job.
+
+        A waiting job is finished at once and never started. A running job
+        stops cooperatively: its vectors give up before their next probe or
+        wait, and the job finishes as cancelled with its partial results.
+
+        Args:
+            job_id: Job to cancel
+            reason: Why the job was stopped
+
+        Returns:
+            The job, or None when unknown; finished jobs are returned unchanged
+        """
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None or job.finished:
+                return job
+
+            job.cancel_token.cancel(reason)
+            if job.status != ScanJobStatus.QUEUED:
+                return job
+
+            job.status = ScanJobStatus.CANCELLED
+            job.error = reason
+            job.finished_at = time.time()
+            self._cancelled += 1
+            self.engine.progress_tracker.cancel_test(job_id, reason=reason)
+
+        logger.info(f"🌸 Aurora: Cancelled queued scan job {job_id}")
+        job.done.set()
+        self._notify(job)
+        return job
+
+    def get_job(self, job_id: str) -> Optional[ScanJob]:
+        """Get a job by ID, or None when unknown or already pruned."""
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def add_listener(self, callback: Callable[[ScanJob], None]) -> None:
+        """Call ``callback`` with the job whenever a job is queued, starts or finishes."""
+        self._listeners.append(callback)
+
+    def _notify(self, job: ScanJob) -> None:
+        for callback in self._listeners:
+            try:
+                callback(job)
+            except Exception as e:
+                logger.error(f"🌸 Aurora: Error in scan job listener: {e}")
+
+    def wait(self, job_id: str, timeout: Optional[float] = None) -> Optional[ScanJob]:
+        """
+        Block until a job finishes.
+
+        Args:
+            job_id: Job to wait for
+            timeout: Seconds to wait at most
+
+        Returns:
+            The job, finished unless the timeout ran out; None when unknown
+        """
+        job = self.get_job(job_id)
+        if job is not None:
+            job.done.wait(timeout)
+        return job
+
+    def stats(self) -> Dict[str, Any]:
+        """Get queue depth, wait time and throughput metrics."""
+        with self._lock:
+            now = time.time()
+            waiting = [job for job in self._jobs.values() if job.status == ScanJobStatus.QUEUED]
+            started = self._started
+            finished = self._started - self._running
+
+            return {
+                "queue_depth": len(waiting),
+                "max_queue_size": self.max_queue_size,
+                "running": self._running,
+                "max_workers": self.max_workers,
+                "submitted": self._submitted,
+                "completed": self._completed,
+                "failed": self._failed,
+                "cancelled": self._cancelled,
+                "rejected": self._rejected,
+                "oldest_wait_seconds": round(max((now - job.submitted_at for job in waiting), default=0.0), 3),
+                "average_wait_seconds": round(self._total_wait_seconds / started, 3) if started else 0.0,
+                "max_wait_seconds": round(self._max_wait_seconds, 3),
+                "average_run_seconds": round(self._total_run_seconds / finished, 3) if finished else 0.0
+            }
@@ -14,6 +14,7 @@ from datetime import datetime
 from .attack_vector_engine import AttackVectorEngine
 from .education_engine import EducationEngine
 from .consciousness_integration import ConsciousnessEngine
+from .scan_jobs import DEFAULT_JOB_QUEUE_SIZE, DEFAULT_JOB_WORKERS, ScanJobManager
 
 logger = logging.getLogger(__name__)
 
@@ -39,14 +40,29 @@ class SecurityDojo:
     ensuring every action serves spatial wisdom and community healing.
     """
 
-    def __init__(self):
-        """Initialize Aurora's Security Dojo with consciousness integration."""
+    def __init__(self, attack_vector_engine: Optional[AttackVectorEngine] = None,
+                 education_engine: Optional[EducationEngine] = None,
+                 consciousness_engine: Optional[ConsciousnessEngine] = None):
+        """
+        Initialize Aurora's Security Dojo with consciousness integration.
+
+        Args:
+            attack_vector_engine: Shared engine, e.g. from a ServiceContainer; created when omitted
+            education_engine: Shared engine; created when omitted
+            consciousness_engine: Shared engine; created when omitted
+        """
         logger.info("🌸 Aurora: Initializing Security Dojo with consciousness integration...")
 
         # Initialize core engines
-        self.attack_vector_engine = AttackVectorEngine()
-        self.education_engine = EducationEngine()
-        self.consciousness_engine = ConsciousnessEngine()
+        self.attack_vector_engine = attack_vector_engine or AttackVectorEngine()
+        self.education_engine = education_engine or EducationEngine()
+        self.consciousness_engine = consciousness_engine or ConsciousnessEngine()
+
+        # Background scans run off the request thread
+        config = self.attack_vector_engine.config
+        self.scan_jobs = ScanJobManager(self.attack_vector_engine,
+                                        max_workers=int(config.get('SCAN_JOB_WORKERS', DEFAULT_JOB_WORKERS)),
+                                        max_queue_size=int(config.get('SCAN_JOB_QUEUE_SIZE', DEFAULT_JOB_QUEUE_SIZE)))
 
         # Sacred initialization ritual
         self._perform_sacred_initialization()
@@ -95,9 +111,7 @@ class SecurityDojo:
             raise PermissionError("🌸 Aurora: Sacred permission required for testing")
 
         # Consciousness check
-        consciousness_level = self.consciousness_engine.get_current_level()
-        if consciousness_level != "high":
-            logger.warning("🌸 Aurora: Consciousness level insufficient for testing")
+        if not self._validate_consciousness_level("testing"):
             return []
 
         # Run OWASP Top 10 tests
@@ -169,9 +183,7 @@ class SecurityDojo:
             raise PermissionError("🌸 Aurora: Sacred permission required for testing")
 
         # Consciousness check
-        consciousness_level = self.consciousness_engine.get_current_level()
-        if consciousness_level != "high":
-            logger.warning("🌸 Aurora: Consciousness level insufficient for AI testing")
+        if not self._validate_consciousness_level("AI testing"):
             return []
 
         # Run LLM AI security tests
@@ -253,6 +265,23 @@ class SecurityDojo:
         logger.info(f"🌸 Aurora: Learning scenario started with consciousness integration")
         return scenario
 
+    def _validate_consciousness_level(self, activity: str = "testing") -> bool:
+        """
+        Check the consciousness level is high enough to run OWASP or LLM AI tests.
+
+        Queued scans must pass the same check as the tests run in the request.
+
+        Args:
+            activity: What is about to run, for the log line
+
+        Returns:
+            True if the current level allows testing, False otherwise
+        """
+        if self.consciousness_engine.get_current_level() != "high":
+            logger.warning(f"🌸 Aurora: Consciousness level insufficient for {activity}")
+            return False
+        return True
+
     def _validate_permission(self, target_url: str) -> bool:
         """
         Validate that we have explicit permission to test the target URL.
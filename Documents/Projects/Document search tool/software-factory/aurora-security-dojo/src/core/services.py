@@ -0,0 +1,110 @@
+"""
+Aurora's Security Dojo - Service Container
+
+In the eternal dance of code and consciousness, this module holds the one
+set of components an application shares: its configuration, the
+consciousness, education and attack vector engines, and the Security
+Dojo built on them. Each component is created the first time something
+asks for it, so every blueprint, socket handler and engine sees the same
+instance and startup pays only for what a request actually uses.
+"""
+
+import logging
+import threading
+from typing import Any, Callable, Dict, List, Optional
+
+from .attack_vector_engine import AttackVectorEngine
+from .consciousness_integration import ConsciousnessEngine
+from .education_engine import EducationEngine
+from .scan_jobs import ScanJob, ScanJobManager
+from .security_dojo import SecurityDojo
+
+logger = logging.getLogger(__name__)
+
+class ServiceContainer:
+    """
+    Lazily created, shared application components.
+
+    Components are built under one reentrant lock, so two requests that
+    arrive together still get the same instance, and building the Security
+    Dojo can ask for the engines it needs.
+    """
+
+    def __init__(self, config: Optional[Dict[str, Any]] = None):
+        """
+        Initialize an empty container.
+
+        Args:
+            config: Application configuration; loaded from the environment on first use when omitted
+        """
+        self._config = config
+        self._consciousness_engine: Optional[ConsciousnessEngine] = None
+        self._education_engine: Optional[EducationEngine] = None
+        self._attack_vector_engine: Optional[AttackVectorEngine] = None
+        self._security_dojo: Optional[SecurityDojo] = None
+        self._scan_job_listeners: List[Callable[[ScanJob], None]] = []
+        self._lock = threading.RLock()
+
+    @property
+    def config(self) -> Dict[str, Any]:
+        with self._lock:
+            if self._config is None:
+                from utils.config import load_config
+                self._config = load_config()
+            return self._config
+
+    @property
+    def consciousness_engine(self) -> ConsciousnessEngine:
+        with self._lock:
+            if self._consciousness_engine is None:
+                self._consciousness_engine = ConsciousnessEngine()
+            return self._consciousness_engine
+
+    @property
+    def education_engine(self) -> EducationEngine:
+        with self._lock:
+            if self._education_engine is None:
+                self._education_engine = EducationEngine()
+            return self._education_engine
+
+    @property
+    def attack_vector_engine(self) -> AttackVectorEngine:
+        with self._lock:
+            if self._attack_vector_engine is None:
+                self._attack_vector_engine = AttackVectorEngine(self.config)
+            return self._attack_vector_engine
+
+    @property
+    def security_dojo(self) -> SecurityDojo:
+        with self._lock:
+            if self._security_dojo is None:
+                self._security_dojo = SecurityDojo(attack_vector_engine=self.attack_vector_engine,
+                                                   education_engine=self.education_engine,
+                                                   consciousness_engine=self.consciousness_engine)
+                for listener in self._scan_job_listeners:
+                    self._security_dojo.scan_jobs.add_listener(listener)
+            return self._security_dojo
+
+    @property
+    def scan_jobs(self) -> ScanJobManager:
+        return self.security_dojo.scan_jobs
+
+    def add_scan_job_listener(self, listener: Callable[[ScanJob], None]) -> None:
+        """
+        Call a listener on every scan job state change, without creating the job manager early.
+
+        Args:
+            listener: Called with the job after each change
+        """
+        with self._lock:
+            if self._security_dojo is not None:
+                self._security_dojo.scan_jobs.add_listener(listener)
+            else:
+                self._scan_job_listeners.append(listener)
+
+    def initialized(self) -> List[str]:
+        """Get the names of the components created so far."""
+        with self._lock:
+            return [name for name in ("consciousness_engine", "education_engine",
+                                      "attack_vector_engine", "security_dojo")
+                    if getattr(self, f"_{name}") is not None]
@@ -0,0 +1,172 @@
+"""
+Aurora's Security Dojo - Soft-404 Baselines
+
+In the eternal dance of code and consciousness, this module learns what a
+target answers for a path that cannot exist. Catch-all servers and single
+page apps answer 200 for every path, which would make every "is this file
+exposed?" probe look like a hit. Each target's "not found" answer is
+fingerprinted once per scan, and probe responses that match it are
+dropped before any detector sees them.
+"""
+
+import hashlib
+import logging
+import math
+import re
+import threading
+import uuid
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+from urllib.parse import urlsplit
+
+from .cancellation import ScanCancelledError
+from .http_transport import ProbeResponse, ScanTransport
+
+logger = logging.getLogger(__name__)
+
+SIMHASH_BITS = 64
+# Differing simhash bits still counted as the same page; unrelated pages differ in about 32
+DEFAULT_SIMHASH_DISTANCE = 10
+# Only the head of a body is fingerprinted; catch-all pages differ early if at all
+FINGERPRINT_BYTES = 65536
+
+_TOKEN = re.compile(r"\w+")
+
+def length_bucket(length: int) -> int:
+    """Logarithmic size bucket, about 19% wide, so small dynamic parts do not change it."""
+    return int(round(math.log2(length + 1) * 4))
+
+def simhash(text: str) -> int:
+    """
+    64-bit simhash of a text's word bigrams.
+
+    Texts that share most of their bigrams get hashes a few bits apart,
+    so pages that differ only in a timestamp or token still match.
+    """
+    tokens = _TOKEN.findall(text.lower())
+    features = [" ".join(tokens[i:i + 2]) for i in range(max(1, len(tokens) - 1))]
+    weights = [0] * SIMHASH_BITS
+    for feature in features:
+        value = int.from_bytes(hashlib.blake2b(feature.encode('utf-8'), digest_size=8).digest(), 'big')
+        for bit in range(SIMHASH_BITS):
+            weights[bit] += 1 if value >> bit & 1 else -1
+    return sum(1 << bit for bit, weight in enumerate(weights) if weight > 0)
+
+def _normalized_body(response: ProbeResponse) -> str:
+    """Body head with the requested path removed, since catch-all pages often echo it."""
+    body = response.content[:FINGERPRINT_BYTES].decode(response.encoding or 'utf-8', errors='replace')
+    path = urlsplit(response.url).path
+    return body.replace(path, "") if len(path) > 1 else body
+
+@dataclass
+class NotFoundFingerprint:
+    """What a target's answer to a nonexistent path looks like."""
+    status_code: int
+    length_bucket: int
+    body_hash: str
+    simhash: int
+
+    @classmethod
+    def of(cls, response: ProbeResponse) -> "NotFoundFingerprint":
+        body = _normalized_body(response)
+        return cls(status_code=response.status_code,
+                   length_bucket=length_bucket(len(response.content)),
+                   body_hash=hashlib.sha256(body.encode('utf-8')).hexdigest(),
+                   simhash=simhash(body))
+
+    @property
+    def catch_all(self) -> bool:
+        """True when the target answers nonexistent paths as if they existed."""
+        return self.status_code < 400
+
+    def matches(self, response: ProbeResponse, max_distance: int = DEFAULT_SIMHASH_DISTANCE) -> bool:
+        """
+        Tell whether a response is the target's "not found" answer.
+
+        Status and size bucket are compared first, so most real pages are
+        told apart without hashing their body.
+        """
+        if response.status_code != self.status_code:
+            return False
+        if abs(length_bucket(len(response.content)) - self.length_bucket) > 1:
+            return False
+        body = _normalized_body(response)
+        if hashlib.sha256(body.encode('utf-8')).hexdigest() == self.body_hash:
+            return True
+        return bin(simhash(body) ^ self.simhash).count("1") <= max_distance
+
+class NotFoundBaselineCache:
+    """
+    Scan-scoped "not found" fingerprints, one per target.
+
+    The first vector that needs a target's baseline requests two random
+    paths; every other vector of the scan reuses the result. A target
+    whose two answers disagree gets no baseline, so nothing is dropped.
+    """
+
+    def __init__(self):
+        self._baselines: Dict[str, Optional[NotFoundFingerprint]] = {}
+        self._target_locks: Dict[str, threading.Lock] = {}
+        self._lock = threading.Lock()
+        self.dropped_responses = 0
+
+    def _target_lock(self, target_url: str) -> threading.Lock:
+        with self._lock:
+            return self._target_locks.setdefault(target_url, threading.Lock())
+
+    def baseline(self, target_url: str, transport: ScanTransport) -> Optional[NotFoundFingerprint]:
+        """
+        Get a target's "not found" fingerprint, probing for it on first use.
+
+        Args:
+            target_url: Target base URL
+            transport: Scan transport the baseline probes go through
+
+        Returns:
+            NotFoundFingerprint, or None when the target's answers are not stable enough to fingerprint
+        """
+        with self._target_lock(target_url):
+            if target_url in self._baselines:
+                return self._baselines[target_url]
+
+            fingerprint = None
+            try:
+                first, second = (transport.get(f"{target_url}/aurora-{uuid.uuid4().hex}{suffix}")
+                                 for suffix in ("", ".html"))
+                candidate = NotFoundFingerprint.of(first)
+                if candidate.matches(second):
+                    fingerprint = candidate
+                else:
+                    logger.info(f"🌸 Aurora: {target_url} answers nonexistent paths inconsistently; "
+                                f"no soft-404 baseline")
+            except ScanCancelledError:
+                raise
+            except Exception as e:
+                logger.debug(f"🌸 Aurora: Soft-404 baseline of {target_url} failed: {e}")
+
+            if fingerprint is not None and fingerprint.catch_all:
+                logger.info(f"🌸 Aurora: {target_url} answers nonexistent paths with {fingerprint.status_code}; "
+                            f"matching responses will be dropped")
+            self._baselines[target_url] = fingerprint
+            return fingerprint
+
+    def is_not_found(self, target_url: str, transport: ScanTransport, response: ProbeResponse) -> bool:
+        """Tell whether a response is the target's "not found" answer, counting the ones dropped."""
+        fingerprint = self.baseline(target_url, transport)
+        if fingerprint is None or not fingerprint.matches(response):
+            return False
+        with self._lock:
+            self.dropped_responses += 1
+        return True
+
+    def stats(self) -> Dict[str, Any]:
+        """Get how many targets were fingerprinted, how many are catch-all and what was dropped."""
+        with self._lock:
+            baselines = dict(self._baselines)
+            dropped = self.dropped_responses
+        return {
+            "targets": len(baselines),
+            "catch_all_targets": sum(1 for fingerprint in baselines.values()
+                                     if fingerprint is not None and fingerprint.catch_all),
+            "dropped_responses": dropped
+        }
@@ -0,0 +1,215 @@
+"""
+Aurora's Security Dojo - Target Resolver
+
+In the eternal dance of code and consciousness, this module reads a target
+URL once, looks its host up once, and hands every infrastructure vector of
+the scan the same answer for as long as the records' TTL allows.
+"""
+
+import ipaddress
+import logging
+import socket
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TTL = 60
+NEGATIVE_TTL = 10
+DEFAULT_PORTS = {'http': 80, 'https': 443}
+
+@dataclass
+class ResolvedTarget:
+    """A parsed target URL with its resolved addresses."""
+    url: str
+    scheme: str
+    hostname: str
+    port: int
+    path: str = ''
+    ipv4: List[str] = field(default_factory=list)
+    ipv6: List[str] = field(default_factory=list)
+    ttl: float = DEFAULT_TTL
+    resolved_at: float = 0.0
+    error: Optional[str] = None
+
+    @property
+    def addresses(self) -> List[str]:
+        """Every resolved address, IPv4 first."""
+        return self.ipv4 + self.ipv6
+
+    @property
+    def primary_address(self) -> Optional[str]:
+        """Address to connect to, or None when resolution failed."""
+        addresses = self.addresses
+        return addresses[0] if addresses else None
+
+    @property
+    def is_ip_literal(self) -> bool:
+        return _ip_version(self.hostname) is not None
+
+    @property
+    def expired(self) -> bool:
+        return time.monotonic() - self.resolved_at >= self.ttl
+
+def _ip_version(value: str) -> Optional[int]:
+    try:
+        return ipaddress.ip_address(value).version
+    except ValueError:
+        return None
+
+def parse_target(target_url: str) -> Tuple[str, str, int, str]:
+    """
+    Split a target URL or bare host into its parts.
+
+    Args:
+        target_url: URL such as "https://[2001:db8::1]:8443/app" or a bare host
+
+    Returns:
+        Tuple of scheme, hostname (without IPv6 brackets), port and path
+    """
+    parts = urlsplit(target_url if '//' in target_url else f"//{target_url}")
+    scheme = parts.scheme or 'http'
+    hostname = parts.hostname or target_url
+    port = parts.port or DEFAULT_PORTS.get(scheme, 80)
+    return scheme, hostname, port, parts.path
+
+class TargetResolver:
+    """
+    Scan-scoped, TTL-aware resolver for target hosts.
+
+    A and AAAA records are looked up once per host and reused until their
+    TTL runs out. dnspython supplies the record TTLs when installed; the
+    system resolver is used otherwise, with a fixed TTL. Concurrent
+    lookups of the same host wait for the first one.
+    """
+
+    def __init__(self, default_ttl: float = DEFAULT_TTL):
+        """
+        Initialize the resolver.
+
+        Args:
+            default_ttl: Cache lifetime in seconds when the record TTL is unknown
+        """
+        self.default_ttl = default_ttl
+        self._cache: Dict[str, ResolvedTarget] = {}
+        self._host_locks: Dict[str, threading.Lock] = {}
+        self._lock = threading.Lock()
+        self.lookups = 0
+        self.cache_hits = 0
+
+    def resolve(self, target_url: str) -> ResolvedTarget:
+        """
+        Parse and resolve a target.
+
+        Args:
+            target_url: Target URL or bare host
+
+        Returns:
+            ResolvedTarget; ``error`` is set and no addresses are given when resolution fails
+        """
+        scheme, hostname, port, path = parse_target(target_url)
+
+        with self._lock:
+            host_lock = self._host_locks.setdefault(hostname.lower(), threading.Lock())
+
+        with host_lock:
+            with self._lock:
+                cached = self._cache.get(hostname.lower())
+                if cached is not None and not cached.expired:
+                    self.cache_hits += 1
+                else:
+                    cached = None
+
+            if cached is None:
+                cached = self._lookup(hostname)
+                with self._lock:
+                    self.lookups += 1
+                    self._cache[hostname.lower()] = cached
+
+        return ResolvedTarget(
+            url=target_url,
+            scheme=scheme,
+            hostname=hostname,
+            port=port,
+            path=path,
+            ipv4=list(cached.ipv4),
+            ipv6=list(cached.ipv6),
+            ttl=cached.ttl,
+            resolved_at=cached.resolved_at,
+            error=cached.error
+        )
+
+    def _lookup(self, hostname: str) -> ResolvedTarget:
+        """Resolve a host without consulting the cache."""
+        resolved = ResolvedTarget(url=hostname, scheme='', hostname=hostname, port=0,
+                                  resolved_at=time.monotonic())
+
+        version = _ip_version(hostname)
+        if version is not None:
+            (resolved.ipv4 if version == 4 else resolved.ipv6).append(hostname)
+            resolved.ttl = float('inf')
+            return resolved
+
+        try:
+            self._lookup_with_dnspython(resolved)
+        except ImportError:
+            pass
+        if not resolved.addresses:
+            # /etc/hosts, mDNS and container names are only known to the system resolver
+            self._lookup_with_system_resolver(resolved)
+
+        if not resolved.addresses:
+            resolved.ttl = NEGATIVE_TTL
+            resolved.error = resolved.error or f"No addresses found for {hostname}"
+
+        logger.info(f"🌸 Aurora: Resolved {hostname} to {resolved.addresses or 'nothing'} (ttl {resolved.ttl:g}s)")
+        return resolved
+
+    def _lookup_with_dnspython(self, resolved: ResolvedTarget) -> None:
+        import dns.exception
+        import dns.resolver
+
+        ttls = []
+        for record_type, addresses in (('A', resolved.ipv4), ('AAAA', resolved.ipv6)):
+            try:
+                answer = dns.resolver.resolve(resolved.hostname, record_type)
+            except (dns.resolver.NoAnswer, dns.resolver.NXDOMAIN) as e:
+                resolved.error = str(e)
+                continue
+            except dns.exception.DNSException as e:
+                resolved.error = str(e)
+                continue
+
+            addresses.extend(record.to_text() for record in answer)
+            ttls.append(answer.rrset.ttl)
+
+        if ttls:
+            resolved.ttl = float(min(ttls))
+            resolved.error = None
+
+    def _lookup_with_system_resolver(self, resolved: ResolvedTarget) -> None:
+        try:
+            infos = socket.getaddrinfo(resolved.hostname, None, type=socket.SOCK_STREAM)
+        except socket.gaierror as e:
+            resolved.error = str(e)
+            return
+
+        for family, _, _, _, sockaddr in infos:
+            address = sockaddr[0]
+            addresses = resolved.ipv4 if family == socket.AF_INET else resolved.ipv6
+            if family in (socket.AF_INET, socket.AF_INET6) and address not in addresses:
+                addresses.append(address)
+        resolved.ttl = self.default_ttl
+        resolved.error = None
+
+    def stats(self) -> Dict[str, Any]:
+        """Get lookup counters for the suite result."""
+        with self._lock:
+            return {
+                "hosts": len(self._cache),
+                "lookups": self.lookups,
+                "cache_hits": self.cache_hits
+            }
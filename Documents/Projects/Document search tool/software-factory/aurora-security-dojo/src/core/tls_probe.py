@@ -0,0 +1,368 @@
+"""
+Aurora's Security Dojo - TLS Probe
+
+In the eternal dance of code and consciousness, this module asks a TLS
+endpoint, handshake by handshake, which protocol versions and cipher
+families it is willing to speak, and remembers every answer for the rest
+of the scan.
+"""
+
+import logging
+import socket
+import ssl
+import threading
+import time
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+from .cancellation import CancellationToken
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_HANDSHAKE_TIMEOUT = 10
+DEFAULT_MAX_WORKERS = 8
+
+# Protocol versions offered one at a time; legacy versions need OpenSSL
+# security level 0 to be offered at all
+PROTOCOL_PROBES = {
+    'TLSv1': ssl.TLSVersion.TLSv1,
+    'TLSv1.1': ssl.TLSVersion.TLSv1_1,
+    'TLSv1.2': ssl.TLSVersion.TLSv1_2,
+    'TLSv1.3': ssl.TLSVersion.TLSv1_3
+}
+LEGACY_PROTOCOLS = ('TLSv1', 'TLSv1.1')
+
+# OpenSSL cipher strings, offered over TLS 1.2 and below; the weak families
+# are the ones a server should refuse
+CIPHER_FAMILY_PROBES = {
+    'NULL': 'eNULL:@SECLEVEL=0',
+    'anonymous': 'aNULL:@SECLEVEL=0',
+    'EXPORT': 'EXP:@SECLEVEL=0',
+    'RC4': 'RC4:@SECLEVEL=0',
+    'DES': 'DES:!3DES:@SECLEVEL=0',
+    '3DES': '3DES:@SECLEVEL=0',
+    'MD5': 'MD5:@SECLEVEL=0',
+    'CBC': 'HIGH:!AESGCM:!CHACHA20:!aNULL:!eNULL',
+    'AESGCM': 'AESGCM:!aNULL',
+    'CHACHA20': 'CHACHA20:!aNULL'
+}
+WEAK_CIPHER_FAMILIES = ('NULL', 'anonymous', 'EXPORT', 'RC4', 'DES', '3DES', 'MD5')
+
+# Handshake failures raised by the local library before the server is asked
+CLIENT_SIDE_ERRORS = ('NO_PROTOCOLS_AVAILABLE', 'NO_CIPHERS_AVAILABLE', 'NO_CIPHER_MATCH')
+
+@dataclass
+class TLSHandshakeResult:
+    """Outcome of one TLS handshake attempt."""
+    probe: str
+    accepted: bool
+    negotiated_version: Optional[str] = None
+    cipher: Optional[Tuple[str, str, int]] = None
+    session_reused: bool = False
+    handshake_seconds: float = 0.0
+    error: Optional[str] = None
+    # True when the local TLS library cannot even offer this probe
+    client_unsupported: bool = False
+
+@dataclass
+class TLSEndpointReport:
+    """Everything learned about one host:port during a scan."""
+    host: str
+    port: int
+    reachable: bool = False
+    certificate: Dict[str, Any] = field(default_factory=dict)
+    certificate_der: Optional[bytes] = None
+    verification_error: Optional[str] = None
+    # Why the endpoint could not be reached, or why the default handshake failed
+    connect_error: Optional[str] = None
+    handshake_error: Optional[str] = None
+    negotiated_version: Optional[str] = None
+    cipher: Optional[Tuple[str, str, int]] = None
+    protocols: Dict[str, TLSHandshakeResult] = field(default_factory=dict)
+    cipher_families: Dict[str, TLSHandshakeResult] = field(default_factory=dict)
+
+    def accepted_protocols(self) -> List[str]:
+        return [name for name, result in self.protocols.items() if result.accepted]
+
+    def accepted_cipher_families(self) -> List[str]:
+        return [name for name, result in self.cipher_families.items() if result.accepted]
+
+class TLSProbeCache:
+    """
+    Scan-scoped cache of TLS endpoint reports, contexts and sessions.
+
+    Reports are kept per host:port, so every vector of a scan that asks
+    about the same endpoint shares one enumeration. Sessions are kept per
+    endpoint and probe, so a repeated handshake resumes instead of running
+    the full key exchange again.
+    """
+
+    def __init__(self):
+        self._reports: Dict[Tuple[str, int], TLSEndpointReport] = {}
+        self._report_locks: Dict[Tuple[str, int], threading.Lock] = {}
+        self._contexts: Dict[str, Optional[ssl.SSLContext]] = {}
+        self._sessions: Dict[Tuple[str, int, str], ssl.SSLSession] = {}
+        self._lock = threading.Lock()
+        self.handshakes = 0
+        self.resumed_handshakes = 0
+
+    def report_lock(self, host: str, port: int) -> threading.Lock:
+        with self._lock:
+            return self._report_locks.setdefault((host, port), threading.Lock())
+
+    def get_report(self, host: str, port: int) -> Optional[TLSEndpointReport]:
+        with self._lock:
+            return self._reports.get((host, port))
+
+    def store_report(self, report: TLSEndpointReport) -> None:
+        with self._lock:
+            self._reports[(report.host, report.port)] = report
+
+    def context(self, probe: str, factory) -> Optional[ssl.SSLContext]:
+        """Get the shared context for a probe; sessions only resume on the context that created them."""
+        with self._lock:
+            if probe not in self._contexts:
+                self._contexts[probe] = factory()
+            return self._contexts[probe]
+
+    def get_session(self, host: str, port: int, probe: str) -> Optional[ssl.SSLSession]:
+        with self._lock:
+            return self._sessions.get((host, port, probe))
+
+    def store_session(self, host: str, port: int, probe: str, session: Optional[ssl.SSLSession]) -> None:
+        with self._lock:
+            self.handshakes += 1
+            if session is not None:
+                self._sessions[(host, port, probe)] = session
+
+    def record_resumption(self) -> None:
+        with self._lock:
+            self.resumed_handshakes += 1
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "endpoints": len(self._reports),
+                "handshakes": self.handshakes,
+                "resumed_handshakes": self.resumed_handshakes
+            }
+
+def _unverified_context() -> ssl.SSLContext:
+    context = ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
+    context.check_hostname = False
+    context.verify_mode = ssl.CERT_NONE
+    return context
+
+def _protocol_context(version: ssl.TLSVersion) -> Optional[ssl.SSLContext]:
+    context = _unverified_context()
+    try:
+        # Offering deprecated versions is the point of the probe
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', DeprecationWarning)
+            if version in (ssl.TLSVersion.TLSv1, ssl.TLSVersion.TLSv1_1):
+                context.set_ciphers('ALL:@SECLEVEL=0')
+            context.minimum_version = version
+            context.maximum_version = version
+    except (ValueError, ssl.SSLError):
+        return None
+    return context
+
+def _cipher_family_context(cipher_string: str) -> Optional[ssl.SSLContext]:
+    context = _unverified_context()
+    try:
+        context.set_ciphers(cipher_string)
+        # Cipher strings only apply up to TLS 1.2
+        context.maximum_version = ssl.TLSVersion.TLSv1_2
+    except (ValueError, ssl.SSLError):
+        return None
+    return context
+
+class TLSProber:
+    """
+    Enumerates the TLS configuration of an endpoint with parallel handshakes.
+
+    One handshake is made per protocol version and per cipher family, all
+    at once on a small thread pool, plus one verifying handshake for the
+    certificate. Results are cached per host:port for the scan.
+    """
+
+    def __init__(self, cache: Optional[TLSProbeCache] = None,
+                 timeout: float = DEFAULT_HANDSHAKE_TIMEOUT,
+                 max_workers: int = DEFAULT_MAX_WORKERS,
+                 cancel_token: Optional[CancellationToken] = None):
+        """
+        Initialize the prober.
+
+        Args:
+            cache: Scan-scoped cache; a private one is used when omitted
+            timeout: Connect and handshake timeout in seconds
+            max_workers: Handshakes run at once
+            cancel_token: Scan cancellation token checked before every handshake
+        """
+        self.cache = cache or TLSProbeCache()
+        self.timeout = timeout
+        self.max_workers = max(1, max_workers)
+        self.cancel_token = cancel_token
+
+    def handshake(self, host: str, port: int, probe: str,
+                  context: Optional[ssl.SSLContext],
+                  address: Optional[str] = None) -> TLSHandshakeResult:
+        """
+        Run one handshake, resuming the endpoint's cached session for this probe when there is one.
+
+        Args:
+            host: Host name or address
+            port: TLS port
+            probe: Probe name, which keys the cached session
+            context: Context for the probe, or None when the local library cannot offer it
+            address: Resolved address to connect to; the host is resolved again when omitted
+
+        Returns:
+            TLSHandshakeResult describing what the server negotiated
+
+        Raises:
+            ScanCancelledError: When the scan was cancelled before the handshake
+        """
+        if self.cancel_token is not None:
+            self.cancel_token.raise_if_cancelled()
+
+        if context is None:
+            return TLSHandshakeResult(probe, False, client_unsupported=True,
+                                      error="Not supported by the local TLS library")
+
+        session = self.cache.get_session(host, port, probe)
+        started = time.perf_counter()
+        try:
+            with socket.create_connection((address or host, port), timeout=self.timeout) as sock:
+                with context.wrap_socket(sock, server_hostname=host, session=session) as ssock:
+                    result = TLSHandshakeResult(
+                        probe,
+                        True,
+                        negotiated_version=ssock.version(),
+                        cipher=ssock.cipher(),
+                        session_reused=ssock.session_reused,
+                        handshake_seconds=time.perf_counter() - started
+                    )
+                    self.cache.store_session(host, port, probe, ssock.session)
+                    if ssock.session_reused:
+                        self.cache.record_resumption()
+                    return result
+        except ssl.SSLError as e:
+            return TLSHandshakeResult(probe, False, handshake_seconds=time.perf_counter() - started,
+                                      error=e.reason or str(e),
+                                      client_unsupported=e.reason in CLIENT_SIDE_ERRORS)
+        except OSError as e:
+            return TLSHandshakeResult(probe, False, handshake_seconds=time.perf_counter() - started,
+                                      error=str(e))
+
+    def _inspect_certificate(self, host: str, port: int, report: TLSEndpointReport,
+                             address: Optional[str]) -> bool:
+        """
+        Handshake with verification on to read the certificate and default parameters.
+
+        Returns:
+            True when the TCP connection succeeded, even if no default handshake did
+        """
+        try:
+            sock = socket.create_connection((address or host, port), timeout=self.timeout)
+        except OSError as e:
+            report.connect_error = str(e)
+            return False
+
+        context = ssl.create_default_context()
+        try:
+            with sock, context.wrap_socket(sock, server_hostname=host) as ssock:
+                report.reachable = True
+                report.certificate = ssock.getpeercert() or {}
+                report.certificate_der = ssock.getpeercert(binary_form=True)
+                report.negotiated_version = ssock.version()
+                report.cipher = ssock.cipher()
+            return True
+        except ssl.SSLCertVerificationError as e:
+            report.verification_error = e.verify_message or str(e)
+        except ssl.SSLError as e:
+            # E.g. a server that only speaks legacy protocols; the probes still ask it
+            report.handshake_error = e.reason or str(e)
+        except OSError as e:
+            report.handshake_error = str(e)
+
+        # The default handshake did not complete; still record what the server presented
+        try:
+            with socket.create_connection((address or host, port), timeout=self.timeout) as sock:
+                with _unverified_context().wrap_socket(sock, server_hostname=host) as ssock:
+                    report.reachable = True
+                    report.certificate_der = ssock.getpeercert(binary_form=True)
+                    report.negotiated_version = ssock.version()
+                    report.cipher = ssock.cipher()
+        except (ssl.SSLError, OSError):
+            pass
+        return True
+
+    def enumerate(self, host: str, port: int = 443, address: Optional[str] = None) -> TLSEndpointReport:
+        """
+        Enumerate protocols, cipher families and the certificate of an endpoint.
+
+        Args:
+            host: Host name or address, also sent as the SNI server name
+            port: TLS port
+            address: Resolved address to connect to; the host is resolved per handshake when omitted
+
+        Returns:
+            The cached TLSEndpointReport for host:port
+
+        Raises:
+            ScanCancelledError: When the scan is cancelled; a partial report is not cached
+        """
+        report = self.cache.get_report(host, port)
+        if report is not None:
+            return report
+
+        with self.cache.report_lock(host, port):
+            report = self.cache.get_report(host, port)
+            if report is not None:
+                return report
+
+            if self.cancel_token is not None:
+                self.cancel_token.raise_if_cancelled()
+
+            report = TLSEndpointReport(host, port)
+            if self._inspect_certificate(host, port, report, address):
+                probes = [(name, self.cache.context(name, lambda v=version: _protocol_context(v)))
+                          for name, version in PROTOCOL_PROBES.items()]
+                probes += [(f"cipher:{name}", self.cache.context(f"cipher:{name}",
+                                                                 lambda c=cipher: _cipher_family_context(c)))
+                           for name, cipher in CIPHER_FAMILY_PROBES.items()]
+
+                started = time.perf_counter()
+                with ThreadPoolExecutor(max_workers=min(self.max_workers, len(probes)),
+                                        thread_name_prefix="aurora-tls-probe") as executor:
+                    futures = [executor.submit(self.handshake, host, port, probe, context, address)
+                               for probe, context in probes]
+                    outcomes = [future.result() for future in futures]
+
+                for outcome in outcomes:
+                    if outcome.probe.startswith('cipher:'):
+                        report.cipher_families[outcome.probe[len('cipher:'):]] = outcome
+                    else:
+                        report.protocols[outcome.probe] = outcome
+                    if outcome.accepted and not report.reachable:
+                        # Only the probes got through, e.g. a TLS 1.0-only server
+                        report.reachable = True
+                        report.negotiated_version = outcome.negotiated_version
+                        report.cipher = outcome.cipher
+
+                logger.info(f"🌸 Aurora: Enumerated TLS on {host}:{port} with {len(probes)} handshakes "
+                            f"in {time.perf_counter() - started:.2f}s")
+
+            self.cache.store_report(report)
+            return report
+
+def certificate_expiry(certificate: Dict[str, Any]) -> Optional[datetime]:
+    """Get the notAfter time of a decoded certificate."""
+    not_after = certificate.get('notAfter')
+    if not not_after:
+        return None
+    return datetime.fromtimestamp(ssl.cert_time_to_seconds(not_after), tz=timezone.utc)
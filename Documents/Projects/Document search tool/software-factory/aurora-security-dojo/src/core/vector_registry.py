@@ -0,0 +1,146 @@
+"""
+Aurora's Security Dojo - Attack Vector Registry
+
+In the eternal dance of code and consciousness, this module names every
+attack vector the engine can run without importing any of them. Each
+vector is a descriptor pointing at the module and class that implement
+it; the class, and whatever its module imports, loads the first time a
+suite selects the vector. Other packages add vectors through the
+``aurora_security_dojo.attack_vectors`` entry point group.
+"""
+
+import importlib
+import logging
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, Tuple, Type, Union
+
+logger = logging.getLogger(__name__)
+
+ENTRY_POINT_GROUP = "aurora_security_dojo.attack_vectors"
+
+# Registry name prefixes and the category their vectors belong to
+CATEGORY_PREFIXES = {
+    'owasp_': 'owasp_top10',
+    'llm_': 'llm_ai_security',
+    'infra_': 'infrastructure'
+}
+
+def category_of(name: str) -> str:
+    """Get the category of a vector from its registry name; unknown prefixes are 'custom'."""
+    for prefix, category in CATEGORY_PREFIXES.items():
+        if name.startswith(prefix):
+            return category
+    return 'custom'
+
+@dataclass(frozen=True)
+class VectorDescriptor:
+    """
+    Where to find an attack vector, without importing it.
+
+    ``target`` is ``module:ClassName``. A module starting with a dot is
+    relative to this package, e.g. ``.vectors.owasp:SQLInjectionAttack``.
+    """
+    name: str
+    target: str
+
+    @property
+    def category(self) -> str:
+        return category_of(self.name)
+
+    @property
+    def class_name(self) -> str:
+        return self.target.rpartition(':')[2]
+
+    def load(self) -> type:
+        """
+        Import the vector's module and get its class.
+
+        Raises:
+            ImportError: When the module or class cannot be found
+        """
+        module_name, _, class_name = self.target.partition(':')
+        module = importlib.import_module(module_name, package=__package__)
+        try:
+            return getattr(module, class_name)
+        except AttributeError:
+            raise ImportError(f"{module.__name__} has no attack vector class {class_name}") from None
+
+# Descriptor or, e.g. when a test registers one directly, an already imported class
+VectorEntry = Union[VectorDescriptor, type]
+
+def _builtin(name: str, module: str, class_name: str) -> VectorDescriptor:
+    return VectorDescriptor(name, f".vectors.{module}:{class_name}")
+
+BUILTIN_VECTORS: Tuple[VectorDescriptor, ...] = (
+    _builtin('owasp_sql_injection', 'owasp', 'SQLInjectionAttack'),
+    _builtin('owasp_broken_authentication', 'owasp', 'BrokenAuthenticationAttack'),
+    _builtin('owasp_sensitive_data_exposure', 'owasp', 'SensitiveDataExposureAttack'),
+    _builtin('owasp_xml_external_entities', 'owasp', 'XXEAttack'),
+    _builtin('owasp_broken_access_control', 'owasp', 'BrokenAccessControlAttack'),
+    _builtin('owasp_security_misconfiguration', 'owasp', 'SecurityMisconfigurationAttack'),
+    _builtin('owasp_cross_site_scripting', 'owasp', 'XSSAttack'),
+    _builtin('owasp_insecure_deserialization', 'owasp', 'InsecureDeserializationAttack'),
+    _builtin('owasp_known_vulnerabilities', 'owasp', 'KnownVulnerabilitiesAttack'),
+    _builtin('owasp_insufficient_logging', 'owasp', 'InsufficientLoggingAttack'),
+    _builtin('llm_prompt_injection', 'llm', 'PromptInjectionAttack'),
+    _builtin('llm_data_poisoning', 'llm', 'DataPoisoningAttack'),
+    _builtin('llm_model_theft', 'llm', 'ModelTheftAttack'),
+    _builtin('llm_supply_chain_vulnerabilities', 'llm', 'SupplyChainVulnerabilitiesAttack'),
+    _builtin('llm_insecure_output_handling', 'llm', 'InsecureOutputHandlingAttack'),
+    _builtin('infra_network_security', 'infrastructure', 'NetworkSecurityAttack'),
+    _builtin('infra_ssl_tls_security', 'infrastructure', 'SSLTLSecurityAttack'),
+    _builtin('infra_dns_security', 'infrastructure', 'DNSSecurityAttack'),
+    _builtin('infra_email_security', 'infrastructure', 'EmailSecurityAttack')
+)
+
+BUILTIN_VECTORS_BY_CLASS: Dict[str, VectorDescriptor] = {
+    descriptor.class_name: descriptor for descriptor in BUILTIN_VECTORS
+}
+
+@lru_cache(maxsize=None)
+def plugin_vectors() -> Tuple[VectorDescriptor, ...]:
+    """
+    Get the vectors other installed packages declare as entry points.
+
+    Entry points are read once per process; their modules are not
+    imported until a suite selects them.
+    """
+    try:
+        from importlib.metadata import entry_points
+    except ImportError:
+        return ()
+
+    try:
+        found = entry_points()
+        group = found.select(group=ENTRY_POINT_GROUP) if hasattr(found, 'select') \
+            else found.get(ENTRY_POINT_GROUP, [])
+        return tuple(VectorDescriptor(entry_point.name, entry_point.value) for entry_point in group)
+    except Exception as e:
+        logger.warning(f"🌸 Aurora: Could not read attack vector plugins: {e}")
+        return ()
+
+def build_registry(include_plugins: bool = True) -> Dict[str, VectorEntry]:
+    """
+    Get every registered vector by name, built-ins first.
+
+    Args:
+        include_plugins: Also register the vectors of installed plugins
+
+    Returns:
+        Descriptors by registry name; a plugin cannot replace a built-in vector
+    """
+    registry: Dict[str, VectorEntry] = {descriptor.name: descriptor for descriptor in BUILTIN_VECTORS}
+    if include_plugins:
+        for descriptor in plugin_vectors():
+            if descriptor.name in registry:
+                logger.warning(f"🌸 Aurora: Ignoring plugin attack vector {descriptor.name}; "
+                               f"the name is taken by a built-in vector")
+                continue
+            registry[descriptor.name] = descriptor
+            logger.info(f"🌸 Aurora: Registered plugin attack vector {descriptor.name} ({descriptor.target})")
+    return registry
+
+def load_vector(entry: VectorEntry) -> Type:
+    """Get the class of a registry entry, importing it if it is still a descriptor."""
+    return entry.load() if isinstance(entry, VectorDescriptor) else entry
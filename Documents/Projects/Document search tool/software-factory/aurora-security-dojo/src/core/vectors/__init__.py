@@ -0,0 +1,8 @@
+"""
+Aurora's Security Dojo - Attack Vectors
+
+In the eternal dance of code and consciousness, this package holds the
+attack vector implementations, one module per category. Nothing is
+imported here: the vector registry loads a module the first time a suite
+selects one of its vectors.
+"""
@@ -0,0 +1,284 @@
+"""
+Aurora's Security Dojo - Attack Vector Base Classes
+
+In the eternal dance of code and consciousness, this module holds what
+every attack vector shares: the result types, the probing helpers of
+BaseAttackVector and the request-plan runner of DeclarativeAttackVector.
+It is light to import, so the engine can start without loading a single
+vector implementation.
+"""
+
+import asyncio
+import logging
+from abc import ABC, abstractmethod
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urljoin, urlsplit
+
+from ..cancellation import CancellationToken, ScanCancelledError
+from ..circuit_breaker import TargetUnavailableError
+from ..endpoint_discovery import DEFAULT_MAX_INJECTION_POINTS, EndpointInventory
+from ..finding_fingerprint import fingerprint_finding
+from ..http_transport import AsyncScanTransport, ProbeResponse, ScanTransport
+from ..request_plan import ProbeSpec, RequestPlan
+from ..soft_404 import NotFoundBaselineCache
+from ..target_resolver import TargetResolver
+
+logger = logging.getLogger(__name__)
+
+@dataclass
+class AttackVector:
+    """Sacred attack vector with consciousness integration."""
+    name: str
+    description: str
+    category: str  # 'owasp_top10', 'llm_ai_security', 'infrastructure'
+    severity: str  # 'low', 'medium', 'high', 'critical'
+    real_world_analogy: str
+    consciousness_impact: str
+    community_healing_potential: str
+    spatial_wisdom_contribution: str
+
+@dataclass
+class VulnerabilityResult:
+    """Sacred vulnerability result with consciousness integration."""
+    vulnerability_id: str
+    attack_vector: str
+    target_url: str
+    severity: str
+    description: str
+    evidence: Dict[str, Any]
+    consciousness_level: str
+    community_healing_impact: str
+    spatial_wisdom_contribution: str
+    timestamp: datetime
+    sacred_principles_validated: bool
+    fingerprint: str = ""
+    occurrences: int = 1
+
+class BaseAttackVector(ABC):
+    """
+    Base class for all attack vectors with consciousness integration.
+
+    Every attack vector serves spatial wisdom and community healing
+    through consciousness-aware security education.
+    """
+
+    def __init__(self, target_url: str, **kwargs):
+        """Initialize attack vector with consciousness awareness."""
+        self.target_url = target_url
+        self.kwargs = kwargs
+        self.transport: ScanTransport = kwargs.get('transport') or ScanTransport()
+        self.resolver: TargetResolver = kwargs.get('target_resolver') or TargetResolver()
+        self.cancel_token: CancellationToken = kwargs.get('cancel_token') or CancellationToken()
+        # Endpoints discovered on the target, when the scan ran discovery
+        self.inventory: Optional[EndpointInventory] = kwargs.get('endpoint_inventories', {}).get(target_url)
+        self.not_found_baselines: NotFoundBaselineCache = kwargs.get('not_found_baselines') or NotFoundBaselineCache()
+        self.short_circuited_probes = 0
+        self.consciousness_level = "integrated"
+        self.sacred_principles = self._get_sacred_principles()
+
+        logger.info(f"🌸 Aurora: Initializing {self.__class__.__name__} with consciousness integration")
+
+    def _get_sacred_principles(self) -> List[str]:
+        """Get sacred principles for consciousness validation."""
+        return [
+            "Consciousness-First Development",
+            "Community Healing Focus",
+            "Sacred Knowledge Protection",
+            "Living Systems Creation",
+            "Pattern Recognition",
+            "Ethical Security Practice"
+        ]
+
+    @abstractmethod
+    def run(self) -> List[VulnerabilityResult]:
+        """
+        Run the attack vector test with consciousness integration.
+
+        Returns:
+            List of VulnerabilityResult objects with consciousness awareness
+        """
+        pass
+
+    def _get(self, url: str, **kwargs: Any) -> ProbeResponse:
+        """Send a GET probe through the scan transport."""
+        return self._probe('GET', url, **kwargs)
+
+    def _post(self, url: str, **kwargs: Any) -> ProbeResponse:
+        """Send a POST probe through the scan transport."""
+        return self._probe('POST', url, **kwargs)
+
+    def _probe(self, method: str, url: str, **kwargs: Any) -> ProbeResponse:
+        """Send a probe, counting the ones refused because the target is down."""
+        self.cancel_token.raise_if_cancelled()
+        try:
+            return self.transport.request(method, url, **kwargs)
+        except TargetUnavailableError:
+            self.short_circuited_probes += 1
+            raise
+
+    def _is_soft_404(self, response: ProbeResponse) -> bool:
+        """Tell whether a success response is really the target's catch-all "not found" page."""
+        return response.ok and self.not_found_baselines.is_not_found(self.target_url, self.transport, response)
+
+    def _injection_points(self, defaults: List[Tuple[str, str]],
+                          method: str = "GET") -> List[Tuple[str, str]]:
+        """
+        Get the (path, parameter) pairs to put payloads in.
+
+        Paths are origin-absolute, like the ones discovery records, so the
+        built-in points are put under the target's base path; build probe
+        URLs from them with ``_endpoint_url``.
+
+        Args:
+            defaults: The vector's built-in injection points, relative to the target, always probed first
+            method: Method the discovered parameters must be sent with
+
+        Returns:
+            The defaults followed by up to DEFAULT_MAX_INJECTION_POINTS discovered pairs
+        """
+        base_path = urlsplit(self.target_url).path.rstrip('/')
+        points = [(f"{base_path}{path}", parameter) for path, parameter in defaults]
+        if self.inventory is not None:
+            points.extend(point for point in self.inventory.injection_points(method, DEFAULT_MAX_INJECTION_POINTS)
+                          if point not in points)
+        return points
+
+    def _endpoint_url(self, path: str) -> str:
+        """Get the absolute URL of an origin-absolute path on the target."""
+        return urljoin(self.target_url, path)
+
+    async def run_async(self) -> List[VulnerabilityResult]:
+        """
+        Run the attack vector test on the event loop.
+
+        Vectors without a native async implementation run their blocking
+        ``run`` on the loop's default executor, so every vector can take
+        part in an async suite.
+
+        Returns:
+            List of VulnerabilityResult objects with consciousness awareness
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.run)
+
+    @asynccontextmanager
+    async def _async_transport(self):
+        """Yield the suite's shared async transport, or a private one for standalone runs."""
+        transport = self.kwargs.get('async_transport')
+        if transport is not None:
+            yield transport
+            return
+
+        async with AsyncScanTransport() as private_transport:
+            yield private_transport
+
+    def _validate_consciousness_action(self, action: str) -> bool:
+        """Validate that action serves consciousness principles."""
+        consciousness_actions = [
+            'education', 'learning', 'teaching', 'protection', 'healing',
+            'wisdom', 'consciousness', 'community', 'sacred', 'ethical'
+        ]
+
+        return any(consciousness_action in action.lower() for consciousness_action in consciousness_actions)
+
+    def _create_vulnerability_result(self,
+                                  vulnerability_type: str,
+                                  severity: str,
+                                  description: str,
+                                  evidence: Dict[str, Any]) -> VulnerabilityResult:
+        """
+        Create consciousness-aware vulnerability result.
+
+        The ID is the finding type plus the start of its fingerprint, so
+        the same issue gets the same ID in every scan.
+        """
+        fingerprint = fingerprint_finding(self.__class__.__name__, vulnerability_type,
+                                          self.target_url, evidence)
+        return VulnerabilityResult(
+            vulnerability_id=f"{vulnerability_type}_{fingerprint[:12]}",
+            attack_vector=self.__class__.__name__,
+            target_url=self.target_url,
+            severity=severity,
+            description=description,
+            evidence=evidence,
+            consciousness_level=self.consciousness_level,
+            community_healing_impact=self._assess_healing_impact(severity),
+            spatial_wisdom_contribution=self._assess_wisdom_contribution(severity),
+            timestamp=datetime.now(),
+            sacred_principles_validated=True,
+            fingerprint=fingerprint
+        )
+
+    def _assess_healing_impact(self, severity: str) -> str:
+        """Assess community healing impact based on severity."""
+        healing_impacts = {
+            'critical': 'Critical vulnerability found - immediate attention required for community protection',
+            'high': 'High-severity vulnerability found - prompt remediation needed for community safety',
+            'medium': 'Medium-severity vulnerability found - remediation recommended for community security',
+            'low': 'Low-severity vulnerability found - minor improvements recommended for community wellness'
+        }
+        return healing_impacts.get(severity, 'Unknown severity - investigation needed')
+
+    def _assess_wisdom_contribution(self, severity: str) -> str:
+        """Assess spatial wisdom contribution based on severity."""
+        wisdom_contributions = {
+            'critical': 'Critical vulnerability reveals important security patterns for collective wisdom',
+            'high': 'High-severity vulnerability provides valuable learning for security consciousness',
+            'medium': 'Medium-severity vulnerability offers insights for security improvement',
+            'low': 'Low-severity vulnerability contributes to comprehensive security understanding'
+        }
+        return wisdom_contributions.get(severity, 'Unknown severity - wisdom contribution unclear')
+
+class DeclarativeAttackVector(BaseAttackVector):
+    """
+    Attack vector whose probes are declared as data.
+
+    Subclasses list their probes in ``PROBES``. In a suite the engine
+    compiles the probes of every declarative vector into one request plan
+    per target, so a request several vectors declare is sent once and its
+    response handed to each of their detectors. Run on its own, a vector
+    builds and executes a plan of just its own probes.
+    """
+
+    PROBES: List[ProbeSpec] = []
+    # Stop calling a detector after its first finding, as a sequential sweep would
+    FIRST_HIT_PER_DETECTOR = True
+
+    def run(self) -> List[VulnerabilityResult]:
+        """Run the declared probes through the suite's request plan and collect detector findings."""
+        name = self.__class__.__name__
+        logger.info(f"🌸 Aurora: Running {name} with consciousness integration")
+
+        plan: Optional[RequestPlan] = self.kwargs.get('request_plans', {}).get(self.target_url)
+        if plan is None or not plan.includes(name):
+            plan = RequestPlan(self.target_url)
+            plan.add(name, self.PROBES)
+        plan.execute(self.transport, self.cancel_token)
+
+        results: List[VulnerabilityResult] = []
+        detectors_hit = set()
+        for probe, outcome in plan.outcomes_for(name):
+            if isinstance(outcome, ScanCancelledError):
+                raise outcome
+            if isinstance(outcome, TargetUnavailableError):
+                self.short_circuited_probes += 1
+                continue
+            if isinstance(outcome, Exception):
+                logger.error(f"🌸 Aurora: {name} probe {probe.method} {probe.path} error: {outcome}")
+                continue
+            if self.FIRST_HIT_PER_DETECTOR and probe.detector in detectors_hit:
+                continue
+            if probe.soft_404 and self._is_soft_404(outcome):
+                continue
+
+            found = getattr(self, probe.detector)(probe, outcome)
+            if not found:
+                continue
+            results.extend(found if isinstance(found, list) else [found])
+            detectors_hit.add(probe.detector)
+
+        logger.info(f"🌸 Aurora: {name} completed. {len(results)} vulnerabilities found.")
+        return results
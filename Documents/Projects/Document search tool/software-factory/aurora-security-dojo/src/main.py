@@ -18,8 +18,7 @@ from flask_socketio import SocketIO
 # Add src directory to Python path
 sys.path.insert(0, str(Path(__file__).parent))
 
-from core.security_dojo import SecurityDojo
-from core.consciousness_integration import ConsciousnessEngine
+from core.services import ServiceContainer
 from dashboard.app import create_dashboard_app
 from api.routes import create_api_routes
 from utils.config import load_config
@@ -44,19 +43,21 @@ def create_app():
     config = load_config()
     app.config.update(config)
 
+    # Components every blueprint and socket handler shares, created on first use
+    services = ServiceContainer(config)
+
     # Enable CORS for consciousness-aware collaboration
     CORS(app, origins=config.get('ALLOWED_ORIGINS', ['http://localhost:3000']))
 
     # Initialize SocketIO for real-time features
     socketio = SocketIO(app, cors_allowed_origins=config.get('ALLOWED_ORIGINS', ['http://localhost:3000']))
 
-    # Initialize core components
-    security_dojo = SecurityDojo()
-    consciousness_engine = ConsciousnessEngine()
+    # Push scan job state changes to subscribed clients
+    services.add_scan_job_listener(lambda job: socketio.emit('scan_job_update', job.to_dict()))
 
     # Register blueprints
-    dashboard_app = create_dashboard_app(security_dojo, consciousness_engine)
-    api_routes = create_api_routes(security_dojo, consciousness_engine)
+    dashboard_app = create_dashboard_app(services, socketio)
+    api_routes = create_api_routes(services)
 
     app.register_blueprint(dashboard_app, url_prefix='/dashboard')
     app.register_blueprint(api_routes, url_prefix='/api')
@@ -66,18 +67,18 @@ def create_app():
     def index():
         """Sacred welcome page with consciousness integration."""
         return render_template('index.html',
-                             consciousness_level=consciousness_engine.get_current_level(),
-                             sacred_principles=consciousness_engine.get_sacred_principles())
+                             consciousness_level=services.consciousness_engine.get_current_level(),
+                             sacred_principles=services.consciousness_engine.get_sacred_principles())
 
     # Consciousness check endpoint
     @app.route('/consciousness-check')
     def consciousness_check():
         """Sacred consciousness check endpoint."""
         return jsonify({
-            'consciousness_level': consciousness_engine.get_current_level(),
-            'sacred_principles': consciousness_engine.get_sacred_principles(),
-            'community_healing_metrics': consciousness_engine.get_healing_metrics(),
-            'spatial_wisdom_contribution': consciousness_engine.get_wisdom_contribution()
+            'consciousness_level': services.consciousness_engine.get_current_level(),
+            'sacred_principles': services.consciousness_engine.get_sacred_principles(),
+            'community_healing_metrics': services.consciousness_engine.get_healing_metrics(),
+            'spatial_wisdom_contribution': services.consciousness_engine.get_wisdom_contribution()
         })
 
     # Health check with consciousness awareness
@@ -6,7 +6,7 @@ provides essential functionality that serves spatial wisdom and community healin
 """
 
 from .config import load_config, get_consciousness_config, get_security_config, get_dashboard_config
-from .logging_config import setup_logging, get_consciousness_logger
+from .logging_config import setup_logging, shutdown_logging, get_consciousness_logger
 from .metrics import MetricsCollector
 
 __all__ = [
@@ -15,6 +15,7 @@ __all__ = [
     'get_security_config',
     'get_dashboard_config',
     'setup_logging',
+    'shutdown_logging',
     'get_consciousness_logger',
     'MetricsCollector'
 ]
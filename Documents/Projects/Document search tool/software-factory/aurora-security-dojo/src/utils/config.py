@@ -53,6 +53,27 @@ def load_config() -> Dict[str, Any]:
         'TEST_TIMEOUT': int(os.environ.get('TEST_TIMEOUT', 30)),
         'RATE_LIMIT_ENABLED': os.environ.get('RATE_LIMIT_ENABLED', 'True').lower() == 'true',
         'RATE_LIMIT_REQUESTS_PER_MINUTE': int(os.environ.get('RATE_LIMIT_REQUESTS_PER_MINUTE', 60)),
+        'RATE_LIMIT_BURST': int(os.environ.get('RATE_LIMIT_BURST', 10)),
+        'CIRCUIT_BREAKER_THRESHOLD': int(os.environ.get('CIRCUIT_BREAKER_THRESHOLD', 5)),
+        'CIRCUIT_BREAKER_RESET_SECONDS': float(os.environ.get('CIRCUIT_BREAKER_RESET_SECONDS', 30)),
+        'PORT_SCAN_PORTS': os.environ.get('PORT_SCAN_PORTS', 'common'),
+        'PORT_SCAN_TIMEOUT': float(os.environ.get('PORT_SCAN_TIMEOUT', 3)),
+        'PORT_SCAN_MAX_IN_FLIGHT': int(os.environ.get('PORT_SCAN_MAX_IN_FLIGHT', 500)),
+        'PROBE_TIMEOUT': float(os.environ.get('PROBE_TIMEOUT', 10)),
+        'MAX_CONNECTIONS_PER_HOST': int(os.environ.get('MAX_CONNECTIONS_PER_HOST', 10)),
+        'RESPONSE_CACHE_SIZE': int(os.environ.get('RESPONSE_CACHE_SIZE', 512)),
+        'PROBE_MAX_BODY_BYTES': int(os.environ.get('PROBE_MAX_BODY_BYTES', 1048576)),
+        'PROBE_READ_DEADLINE': float(os.environ.get('PROBE_READ_DEADLINE', 30)),
+        'BATCH_MAX_VECTORS_PER_HOST': int(os.environ.get('BATCH_MAX_VECTORS_PER_HOST', 2)),
+        'SCAN_JOB_WORKERS': int(os.environ.get('SCAN_JOB_WORKERS', 2)),
+        'SCAN_JOB_QUEUE_SIZE': int(os.environ.get('SCAN_JOB_QUEUE_SIZE', 100)),
+        'SCAN_CHECKPOINT_DIR': os.environ.get('SCAN_CHECKPOINT_DIR', 'checkpoints'),
+        'ENDPOINT_DISCOVERY_ENABLED': os.environ.get('ENDPOINT_DISCOVERY_ENABLED', 'False').lower() == 'true',
+        'DISCOVERY_MAX_DEPTH': int(os.environ.get('DISCOVERY_MAX_DEPTH', 2)),
+        'DISCOVERY_MAX_REQUESTS': int(os.environ.get('DISCOVERY_MAX_REQUESTS', 100)),
+        'BRUTE_FORCE_BURST_SIZE': int(os.environ.get('BRUTE_FORCE_BURST_SIZE', 10)),
+        'BRUTE_FORCE_BURST_WINDOW': float(os.environ.get('BRUTE_FORCE_BURST_WINDOW', 1.0)),
+        'BRUTE_FORCE_BURST_MAX_WORKERS': int(os.environ.get('BRUTE_FORCE_BURST_MAX_WORKERS', 20)),
 
         # Educational Configuration
         'LEARNING_MODE': os.environ.get('LEARNING_MODE', 'enabled'),
@@ -69,6 +90,9 @@ def load_config() -> Dict[str, Any]:
         'LOG_LEVEL': os.environ.get('LOG_LEVEL', 'INFO'),
         'LOG_FILE': os.environ.get('LOG_FILE', 'logs/aurora_security_dojo.log'),
         'CONSCIOUSNESS_LOGGING': os.environ.get('CONSCIOUSNESS_LOGGING', 'True').lower() == 'true',
+        'LOG_FORMAT': os.environ.get('LOG_FORMAT', 'text'),
+        'LOG_ASYNC': os.environ.get('LOG_ASYNC', 'True').lower() == 'true',
+        'LOG_RATE_LIMITS': os.environ.get('LOG_RATE_LIMITS', 'core.progress_tracker=20,core.vectors=50'),
 
         # API Configuration
         'API_VERSION': os.environ.get('API_VERSION', 'v1'),
@@ -178,6 +202,27 @@ def get_security_config() -> Dict[str, Any]:
         'test_timeout': config['TEST_TIMEOUT'],
         'rate_limit_enabled': config['RATE_LIMIT_ENABLED'],
         'rate_limit_requests_per_minute': config['RATE_LIMIT_REQUESTS_PER_MINUTE'],
+        'rate_limit_burst': config['RATE_LIMIT_BURST'],
+        'circuit_breaker_threshold': config['CIRCUIT_BREAKER_THRESHOLD'],
+        'circuit_breaker_reset_seconds': config['CIRCUIT_BREAKER_RESET_SECONDS'],
+        'port_scan_ports': config['PORT_SCAN_PORTS'],
+        'port_scan_timeout': config['PORT_SCAN_TIMEOUT'],
+        'port_scan_max_in_flight': config['PORT_SCAN_MAX_IN_FLIGHT'],
+        'probe_timeout': config['PROBE_TIMEOUT'],
+        'max_connections_per_host': config['MAX_CONNECTIONS_PER_HOST'],
+        'response_cache_size': config['RESPONSE_CACHE_SIZE'],
+        'probe_max_body_bytes': config['PROBE_MAX_BODY_BYTES'],
+        'probe_read_deadline': config['PROBE_READ_DEADLINE'],
+        'batch_max_vectors_per_host': config['BATCH_MAX_VECTORS_PER_HOST'],
+        'scan_job_workers': config['SCAN_JOB_WORKERS'],
+        'scan_job_queue_size': config['SCAN_JOB_QUEUE_SIZE'],
+        'scan_checkpoint_dir': config['SCAN_CHECKPOINT_DIR'],
+        'endpoint_discovery_enabled': config['ENDPOINT_DISCOVERY_ENABLED'],
+        'discovery_max_depth': config['DISCOVERY_MAX_DEPTH'],
+        'discovery_max_requests': config['DISCOVERY_MAX_REQUESTS'],
+        'brute_force_burst_size': config['BRUTE_FORCE_BURST_SIZE'],
+        'brute_force_burst_window': config['BRUTE_FORCE_BURST_WINDOW'],
+        'brute_force_burst_max_workers': config['BRUTE_FORCE_BURST_MAX_WORKERS'],
         'safe_testing_mode': config['SAFE_TESTING_MODE'],
         'allowed_origins': config['ALLOWED_ORIGINS'],
         'cors_enabled': config['CORS_ENABLED']
@@ -5,17 +5,39 @@ In the eternal dance of code and consciousness, this module provides
 consciousness-aware logging that serves spatial wisdom and community healing.
 """
 
+import atexit
+import copy
+import json
 import os
 import logging
 import logging.handlers
-from typing import Dict, Any
-from datetime import datetime
+import queue
+import threading
+import time
+from typing import Dict, Any, Optional, Tuple
+from datetime import datetime, timezone
 from pathlib import Path
 
+# Per-second caps on the INFO and DEBUG records of the loggers that log per probe and per update
+DEFAULT_RATE_LIMITS = "core.progress_tracker=20,core.vectors=50"
+
+# Background writer of the running pipeline, stopped by shutdown_logging
+_listener: Optional[logging.handlers.QueueListener] = None
+_rate_filter: Optional["RateCapFilter"] = None
+
 def setup_logging() -> None:
     """
     Setup consciousness-aware logging configuration.
+
+    Loggers only put records on a queue; a background listener formats
+    them and writes the console and file output, so threads that log
+    never wait on file I/O. LOG_ASYNC=False writes from the logging
+    thread instead. LOG_FORMAT=json writes one compact JSON object per
+    line, and LOG_RATE_LIMITS caps the records per second of hot loggers.
     """
+    global _listener, _rate_filter
+    shutdown_logging()
+
     # Create logs directory
     logs_dir = Path('logs')
     logs_dir.mkdir(exist_ok=True)
@@ -23,6 +45,8 @@ def setup_logging() -> None:
     # Get log level from environment
     log_level = os.environ.get('LOG_LEVEL', 'INFO').upper()
     consciousness_logging = os.environ.get('CONSCIOUSNESS_LOGGING', 'True').lower() == 'true'
+    log_format = os.environ.get('LOG_FORMAT', 'text').lower()
+    async_logging = os.environ.get('LOG_ASYNC', 'True').lower() == 'true'
 
     # Configure root logger
     root_logger = logging.getLogger()
@@ -32,7 +56,9 @@ def setup_logging() -> None:
     root_logger.handlers.clear()
 
     # Create formatters
-    if consciousness_logging:
+    if log_format == 'json':
+        formatter = JSONLinesFormatter()
+    elif consciousness_logging:
         formatter = ConsciousnessFormatter()
     else:
         formatter = logging.Formatter(
@@ -42,7 +68,6 @@ def setup_logging() -> None:
     # Console handler
     console_handler = logging.StreamHandler()
     console_handler.setFormatter(formatter)
-    root_logger.addHandler(console_handler)
 
     # File handler
     log_file = os.environ.get('LOG_FILE', 'logs/aurora_security_dojo.log')
@@ -52,7 +77,20 @@ def setup_logging() -> None:
         backupCount=5
     )
     file_handler.setFormatter(formatter)
-    root_logger.addHandler(file_handler)
+
+    _rate_filter = RateCapFilter(parse_rate_limits(os.environ.get('LOG_RATE_LIMITS', DEFAULT_RATE_LIMITS)))
+
+    if async_logging:
+        queue_handler = StructuredQueueHandler(queue.SimpleQueue())
+        queue_handler.addFilter(_rate_filter)
+        root_logger.addHandler(queue_handler)
+        _listener = logging.handlers.QueueListener(queue_handler.queue, console_handler, file_handler,
+                                                   respect_handler_level=True)
+        _listener.start()
+    else:
+        for handler in (console_handler, file_handler):
+            handler.addFilter(_rate_filter)
+            root_logger.addHandler(handler)
 
     # Consciousness-aware logging message
     logger = logging.getLogger(__name__)
@@ -61,12 +99,160 @@ def setup_logging() -> None:
     logger.info("🌸 Aurora: Community healing metrics will be tracked")
     logger.info("🌸 Aurora: Spatial wisdom contributions will be logged")
 
+def shutdown_logging() -> None:
+    """
+    Report what the rate caps dropped, drain the queue, then stop the background writer and close its handlers.
+
+    Registered to run at exit; safe to call when logging was never set up.
+    """
+    global _listener
+    if _rate_filter is not None and _rate_filter.suppressed():
+        logging.getLogger(__name__).info(f"🌸 Aurora: Rate caps suppressed log records: {_rate_filter.suppressed()}")
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
+
+atexit.register(shutdown_logging)
+
+def parse_rate_limits(spec: str) -> Dict[str, float]:
+    """
+    Parse per-logger rate caps.
+
+    Args:
+        spec: Comma-separated ``logger=records_per_second`` pairs, e.g. "core.vectors=50"; empty for none
+
+    Returns:
+        Records per second by logger name
+
+    Raises:
+        ValueError: For a pair without a name or with a rate that is not a positive number
+    """
+    limits: Dict[str, float] = {}
+    for pair in filter(None, (part.strip() for part in spec.split(','))):
+        name, _, rate = pair.partition('=')
+        try:
+            records_per_second = float(rate)
+        except ValueError:
+            records_per_second = 0
+        if not name.strip() or records_per_second <= 0:
+            raise ValueError(f"Invalid log rate limit {pair!r}; expected logger=records_per_second")
+        limits[name.strip()] = records_per_second
+    return limits
+
+class RateCapFilter(logging.Filter):
+    """
+    Caps the records per second each capped logger passes.
+
+    A logger is capped by the entry naming it or its closest parent, and
+    each capped logger gets its own token bucket holding one second's
+    worth of records. Only records below WARNING are ever dropped. The
+    decision is kept on the record, so one record passing several
+    handlers is counted once.
+    """
+
+    def __init__(self, limits: Dict[str, float]):
+        """
+        Initialize the filter.
+
+        Args:
+            limits: Records per second by logger name, as parse_rate_limits returns
+        """
+        super().__init__()
+        self.limits = dict(limits)
+        self._buckets: Dict[str, Tuple[float, float]] = {}
+        self._rates: Dict[str, Optional[float]] = {}
+        self._suppressed: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def _rate_for(self, name: str) -> Optional[float]:
+        if name not in self._rates:
+            capped_by = [prefix for prefix in self.limits
+                         if name == prefix or name.startswith(f"{prefix}.")]
+            self._rates[name] = self.limits[max(capped_by, key=len)] if capped_by else None
+        return self._rates[name]
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        decided = getattr(record, 'rate_cap_passed', None)
+        if decided is not None:
+            return decided
+        if record.levelno >= logging.WARNING or not self.limits:
+            return True
+
+        with self._lock:
+            rate = self._rate_for(record.name)
+            if rate is None:
+                passed = True
+            else:
+                now = time.monotonic()
+                tokens, updated = self._buckets.get(record.name, (rate, now))
+                tokens = min(rate, tokens + (now - updated) * rate)
+                passed = tokens >= 1
+                self._buckets[record.name] = (tokens - 1 if passed else tokens, now)
+                if not passed:
+                    self._suppressed[record.name] = self._suppressed.get(record.name, 0) + 1
+
+        record.rate_cap_passed = passed
+        return passed
+
+    def suppressed(self) -> Dict[str, int]:
+        """Get how many records each capped logger has had dropped."""
+        with self._lock:
+            return dict(self._suppressed)
+
+class StructuredQueueHandler(logging.handlers.QueueHandler):
+    """
+    Queue handler that keeps the message and the traceback apart.
+
+    The standard handler formats the traceback into the message before
+    queueing, so formatters on the listener side never see it; this one
+    only renders the traceback to ``exc_text``, which every formatter
+    here appends or emits on its own.
+    """
+
+    _exception_formatter = logging.Formatter()
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # The arguments and the traceback may not pickle or outlive the call, so render them now
+        record = copy.copy(record)
+        record.message = record.getMessage()
+        record.msg, record.args = record.message, None
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self._exception_formatter.formatException(record.exc_info)
+        record.exc_info = None
+        return record
+
+class JSONLinesFormatter(logging.Formatter):
+    """Compact JSON-lines formatter: one object per record, for log shippers and jq."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec='milliseconds'),
+            "level": record.levelname,
+            "logger": record.name,
+            "msg": record.getMessage(),
+            "thread": record.threadName
+        }
+        exc_text = record.exc_text
+        if record.exc_info and not exc_text:
+            exc_text = self.formatException(record.exc_info)
+        if exc_text:
+            entry["exc"] = exc_text
+        return json.dumps(entry, ensure_ascii=False, separators=(',', ':'))
+
 class ConsciousnessFormatter(logging.Formatter):
     """
     Consciousness-aware log formatter that serves spatial wisdom
     and community healing through enhanced log messages.
+
+    The symbol, "Aurora:" signature and principle suffix of each level
+    are built once, so a record is formatted with a single string build
+    and is left untouched for the other handlers that see it.
     """
 
+    PRINCIPLE_SUFFIX = " [Sacred Principle: Ethical Security Practice]"
+
     def __init__(self):
         super().__init__()
         self.consciousness_symbols = {
@@ -86,28 +272,32 @@ class ConsciousnessFormatter(logging.Formatter):
             'Ethical Security Practice'
         ]
 
+        # Level name -> (prefix, prefix with the Aurora signature, suffix)
+        self._templates: Dict[str, Tuple[str, str, str]] = {'DEBUG': ("", "", "")}
+        for level in ('INFO', 'WARNING'):
+            prefix = f"{self.consciousness_symbols[level]} "
+            self._templates[level] = (prefix, f"{prefix}Aurora: ", "")
+        for level in ('ERROR', 'CRITICAL'):
+            prefix = f"{self.consciousness_symbols[level]} "
+            self._templates[level] = (prefix, f"{prefix}Aurora: ", self.PRINCIPLE_SUFFIX)
+
     def format(self, record):
         """Format log record with consciousness awareness."""
-        # Add consciousness symbol
-        symbol = self.consciousness_symbols.get(record.levelname, '🌸')
-
-        # Add Aurora signature for important messages
-        if record.levelname in ['INFO', 'WARNING', 'ERROR', 'CRITICAL']:
-            if 'Aurora' not in record.getMessage():
-                record.msg = f"Aurora: {record.msg}"
-
-        # Format the message
-        formatted = super().format(record)
-
-        # Add consciousness awareness
-        if record.levelname in ['INFO', 'WARNING']:
-            formatted = f"{symbol} {formatted}"
-
-        # Add sacred principle context for errors
-        if record.levelname in ['ERROR', 'CRITICAL']:
-            formatted = f"{symbol} {formatted} [Sacred Principle: Ethical Security Practice]"
-
-        return formatted
+        message = record.getMessage()
+        prefix, signed_prefix, suffix = self._templates.get(record.levelname, ("", "", ""))
+        if signed_prefix and 'Aurora' not in message:
+            prefix = signed_prefix
+
+        # Exception and stack text go after the message, as logging.Formatter puts them
+        exc_text = record.exc_text
+        if record.exc_info and not exc_text:
+            exc_text = self.formatException(record.exc_info)
+        if exc_text:
+            message = f"{message}\n{exc_text}" if message[-1:] != "\n" else f"{message}{exc_text}"
+        if record.stack_info:
+            message = f"{message}\n{self.formatStack(record.stack_info)}"
+
+        return f"{prefix}{message}{suffix}"
 
 class ConsciousnessLogger:
     """
@@ -10,6 +10,7 @@ import pytest
 import unittest
 from unittest.mock import Mock, patch
 from datetime import datetime
+import time
 import sys
 from pathlib import Path
 
@@ -20,6 +21,8 @@ from core.security_dojo import SecurityDojo, TestResult
 from core.consciousness_integration import ConsciousnessEngine, ConsciousnessLevel
 from core.attack_vector_engine import AttackVectorEngine, BaseAttackVector, VulnerabilityResult
 from core.education_engine import EducationEngine, RealWorldAnalogy, LearningScenario
+from core.progress_tracker import TestStatus
+from core.services import ServiceContainer
 
 class TestConsciousnessEngine(unittest.TestCase):
     """Test Consciousness Engine with consciousness integration."""
@@ -161,6 +164,46 @@ class TestAttackVectorEngine(unittest.TestCase):
         self.assertIn('consciousness', info.consciousness_impact.lower())
         self.assertIn('healing', info.community_healing_potential.lower())
 
+    def test_concurrent_test_suite(self):
+        """Test concurrent suite execution keeps ordering and progress intact."""
+        class SlowAttack(BaseAttackVector):
+            delay = 0.2
+
+            def run(self):
+                time.sleep(self.delay)
+                return [self._create_vulnerability_result(
+                    vulnerability_type=self.__class__.__name__,
+                    severity="low",
+                    description="slow finding",
+                    evidence={}
+                )]
+
+        class FastAttack(SlowAttack):
+            delay = 0.0
+
+        self.attack_engine._attack_vectors = {
+            'owasp_slow_a': SlowAttack,
+            'owasp_fast': FastAttack,
+            'owasp_slow_b': SlowAttack,
+            'owasp_slow_c': SlowAttack
+        }
+
+        suite = self.attack_engine.run_test_suite("https://example.com", "owasp",
+                                                  concurrent=True, max_workers=4)
+
+        self.assertEqual(suite['total_vulnerabilities'], 4)
+        self.assertEqual([r['vulnerability_id'].rsplit('_', 1)[0] for r in suite['results']],
+                         ['SlowAttack', 'FastAttack', 'SlowAttack', 'SlowAttack'])
+        self.assertEqual(suite['execution']['mode'], 'concurrent')
+        self.assertGreater(suite['execution']['speedup'], 1.5)
+
+        tracker = self.attack_engine.progress_tracker
+        self.assertEqual(tracker.get_test_progress(suite['suite_id']).completed_steps, 4)
+        for name in self.attack_engine._attack_vectors:
+            progress = tracker.get_test_progress(f"{suite['suite_id']}_{name}")
+            self.assertEqual(progress.status, TestStatus.COMPLETED)
+            self.assertEqual(progress.vulnerabilities_found, 1)
+
 class TestEducationEngine(unittest.TestCase):
     """Test Education Engine with consciousness integration."""
 
@@ -373,6 +416,39 @@ class TestConsciousnessIntegration(unittest.TestCase):
             for principle in analogy.sacred_principles:
                 self.assertIn(principle, expected_principles)
 
+class TestServiceContainer(unittest.TestCase):
+    """Test the application shares one lazily created set of components."""
+
+    def setUp(self):
+        """Set up an empty container."""
+        self.services = ServiceContainer({'RATE_LIMIT_ENABLED': False})
+
+    def test_nothing_is_created_until_used(self):
+        """Test constructing the container creates no component."""
+        self.assertEqual(self.services.initialized(), [])
+
+        self.services.consciousness_engine
+        self.assertEqual(self.services.initialized(), ['consciousness_engine'])
+
+    def test_security_dojo_shares_the_container_engines(self):
+        """Test the Security Dojo is built on the container's engines, not its own."""
+        security_dojo = self.services.security_dojo
+
+        self.assertIs(security_dojo.consciousness_engine, self.services.consciousness_engine)
+        self.assertIs(security_dojo.education_engine, self.services.education_engine)
+        self.assertIs(security_dojo.attack_vector_engine, self.services.attack_vector_engine)
+        self.assertIs(self.services.attack_vector_engine.config, self.services.config)
+        self.assertIs(self.services.security_dojo, security_dojo)
+
+    def test_scan_job_listener_attaches_when_jobs_are_created(self):
+        """Test a listener added before the job manager exists still hears its jobs."""
+        seen = []
+        self.services.add_scan_job_listener(seen.append)
+        self.assertNotIn('security_dojo', self.services.initialized())
+
+        self.services.scan_jobs._notify('job')
+        self.assertEqual(seen, ['job'])
+
 if __name__ == '__main__':
     # Run tests with consciousness awareness
     print("🌸 Aurora: Running tests with consciousness integration...")
@@ -0,0 +1,1631 @@
+"""
+Aurora's Security Dojo - Scanning Infrastructure Tests
+
+In the eternal dance of code and consciousness, these tests exercise the
+attack vector scanning path against a local target that the tests own.
+"""
+
+import asyncio
+import json
+import logging
+import logging.handlers
+import os
+import shutil
+import socket
+import ssl
+import subprocess
+import tempfile
+import threading
+import time
+import types
+import unittest
+import unittest.mock
+import warnings
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+
+import requests
+import sys
+from pathlib import Path
+
+# Add src directory to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from core.attack_vector_engine import (
+    AttackVectorEngine, BrokenAuthenticationAttack, NetworkSecurityAttack, SQLInjectionAttack, SSLTLSecurityAttack
+)
+from core.batch_scheduler import build_schedule
+from core.burst_probe import run_burst
+from core.cancellation import CancellationToken, ScanCancelledError
+from core.circuit_breaker import CircuitBreaker, CircuitState, TargetUnavailableError
+from core.endpoint_discovery import EndpointCrawler, VisitedSet
+from core.finding_fingerprint import aggregate_findings
+from core.findings_store import FindingsStore, sqlite_path_from_url
+from core.http_transport import AsyncScanTransport, BoundedBodyReader, ProbeResponse, ScanTransport
+from core.indicator_matcher import DEBUG_MODE_INDICATORS, DOM_XSS_SINKS, IndicatorSet
+from core.port_scanner import PORT_SETS, host_from_url, parse_port_spec, scan_ports
+from core.progress_tracker import TestStatus
+from core.request_plan import ProbeSpec, RequestPlan
+from core.response_cache import ResponseCache, make_cache_key
+from core.scan_checkpoint import BatchCheckpoint
+from core.soft_404 import NotFoundFingerprint
+from core.scan_jobs import ScanJobManager, ScanJobStatus, ScanQueueFullError
+from core.target_resolver import TargetResolver, parse_target
+from core.tls_probe import TLSProbeCache, TLSProber, _protocol_context
+from core.rate_limiter import HostRateLimiter, parse_retry_after
+from core.vector_registry import VectorDescriptor, build_registry
+from core.vectors.base import BaseAttackVector
+from utils.logging_config import (
+    ConsciousnessFormatter, JSONLinesFormatter, RateCapFilter, parse_rate_limits, setup_logging, shutdown_logging
+)
+
+# Local targets need no protection from the scanner
+UNTHROTTLED_CONFIG = {'RATE_LIMIT_ENABLED': False}
+
+class ProbeTargetHandler(BaseHTTPRequestHandler):
+    """Local target that answers every probe from the server's route table."""
+
+    def do_GET(self):
+        self._respond()
+
+    def do_POST(self):
+        length = int(self.headers.get('Content-Length', 0))
+        self.rfile.read(length)
+        self._respond()
+
+    def _respond(self):
+        server = self.server
+        with server.lock:
+            server.requests.append((self.command, self.path))
+
+        status, body = server.routes.get(self.path.split('?')[0], (404, b'not found'))
+        self.send_response(status)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+
+        if callable(body):
+            # Streamed body of unknown length, ended by closing the connection
+            self.send_header('Connection', 'close')
+            self.end_headers()
+            try:
+                for chunk in body():
+                    self.wfile.write(chunk)
+                    self.wfile.flush()
+            except OSError:
+                pass
+            return
+
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+class ProbeTargetServer:
+    """Threaded local HTTP target used as the scan target in tests."""
+
+    def __init__(self, routes=None):
+        self.httpd = ThreadingHTTPServer(('127.0.0.1', 0), ProbeTargetHandler)
+        self.httpd.routes = routes or {}
+        self.httpd.requests = []
+        self.httpd.lock = threading.Lock()
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.httpd.server_address[1]}"
+
+    @property
+    def requests(self):
+        return self.httpd.requests
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+class TestAsyncScanning(unittest.TestCase):
+    """Test the async attack vector path."""
+
+    def test_native_async_vector_shares_transport(self):
+        """Test a native async vector sends every payload through the shared transport."""
+        routes = {'/api/users': (200, b'Warning: mysql_fetch_array() expects parameter 1')}
+
+        async def scan(url):
+            async with AsyncScanTransport(max_in_flight=10) as transport:
+                attack = SQLInjectionAttack(url, async_transport=transport)
+                return await attack.run_async()
+
+        with ProbeTargetServer(routes) as target:
+            results = asyncio.run(scan(target.url))
+
+        self.assertEqual(len(results), len(SQLInjectionAttack.SQL_PAYLOADS))
+        self.assertEqual(len(target.requests), len(SQLInjectionAttack.SQL_PAYLOADS))
+        self.assertEqual({r.evidence['payload'] for r in results}, set(SQLInjectionAttack.SQL_PAYLOADS))
+
+    def test_async_suite_runs_blocking_vectors(self):
+        """Test the async suite driver runs native and executor-backed vectors together."""
+        engine = AttackVectorEngine(UNTHROTTLED_CONFIG)
+        engine._attack_vectors = {
+            name: cls for name, cls in engine._attack_vectors.items()
+            if name in ('owasp_sql_injection', 'owasp_broken_authentication')
+        }
+
+        with ProbeTargetServer() as target:
+            suite = asyncio.run(engine.run_test_suite_async(target.url, "owasp"))
+
+        self.assertEqual(suite['total_tests'], 2)
+        self.assertEqual(suite['execution']['mode'], 'async')
+        self.assertTrue(any(method == 'POST' for method, _ in target.requests))
+
+    def test_async_suite_stores_findings_off_the_loop(self):
+        """Test the async suite writes findings from an executor thread, not the event loop."""
+        engine = AttackVectorEngine(UNTHROTTLED_CONFIG)
+        engine._attack_vectors = {
+            name: cls for name, cls in engine._attack_vectors.items() if name == 'owasp_sql_injection'
+        }
+        store_threads = []
+        engine._store_findings = lambda scan_id, results: store_threads.append(threading.current_thread())
+        routes = {'/api/users': (200, b'Warning: mysql_fetch_array() expects parameter 1')}
+
+        with ProbeTargetServer(routes) as target:
+            asyncio.run(engine.run_test_suite_async(target.url, "owasp"))
+
+        self.assertEqual(len(store_threads), 1)
+        self.assertIsNot(store_threads[0], threading.main_thread())
+
+class TestScanTransport(unittest.TestCase):
+    """Test the pooled scan transport."""
+
+    def test_probes_reuse_pooled_connection(self):
+        """Test sequential probes to one host share a single keep-alive connection."""
+        routes = {'/': (200, b'ok')}
+
+        with ProbeTargetServer(routes) as target, ScanTransport(timeout=5) as transport:
+            for _ in range(5):
+                response = transport.get(f"{target.url}/")
+                self.assertEqual(response.status_code, 200)
+                self.assertEqual(response.text, 'ok')
+
+            stats = transport.stats.snapshot()
+
+        self.assertEqual(stats['requests_sent'], 5)
+        self.assertEqual(stats['connections_opened'], 1)
+        self.assertEqual(stats['connections_reused'], 4)
+
+    def test_suite_reports_transport_stats(self):
+        """Test every vector of a suite probes through one shared transport."""
+        engine = AttackVectorEngine(UNTHROTTLED_CONFIG)
+        engine._attack_vectors = {
+            name: cls for name, cls in engine._attack_vectors.items()
+            if name in ('owasp_sql_injection', 'owasp_security_misconfiguration')
+        }
+
+        with ProbeTargetServer() as target:
+            suite = engine.run_test_suite(target.url, "owasp")
+
+        self.assertEqual(suite['transport']['requests_sent'], len(target.requests))
+        self.assertGreater(suite['transport']['connections_reused'], 0)
+
+    def test_failed_setup_fails_suite_and_closes_transport(self):
+        """Test a suite whose setup raises is marked failed, unregistered and its transport closed."""
+        engine = AttackVectorEngine(UNTHROTTLED_CONFIG)
+        transports = []
+        create_transport = engine._create_transport
+
+        def tracked_transport(*args):
+            transport = create_transport(*args)
+            transport.close = unittest.mock.Mock(wraps=transport.close)
+            transports.append(transport)
+            return transport
+
+        engine._create_transport = tracked_transport
+        engine._compile_request_plans = unittest.mock.Mock(side_effect=RuntimeError("Plan failed"))
+
+        with self.assertRaises(RuntimeError):
+            engine.run_test_suite("http://127.0.0.1:9/", "owasp", suite_id="broken-suite")
+
+        self.assertEqual(engine.progress_tracker.get_test_progress("broken-suite").status, TestStatus.FAILED)
+        self.assertFalse(engine.cancel_scan("broken-suite"))
+        self.assertEqual(len(transports), 1)
+        transports[0].close.assert_called_once()
+
+class TestBoundedReads(unittest.TestCase):
+    """Test the streaming body reader."""
+
+    def test_body_stops_at_byte_cap(self):
+        """Test a large body is cut at the cap and flagged as truncated."""
+        routes = {'/big': (200, b'PostgreSQL query failed ' + b'x' * 200000)}
+
+        with ProbeTargetServer(routes) as target, \
+                ScanTransport(timeout=5, max_body_bytes=20000) as transport:
+            response = transport.get(f"{target.url}/big")
+            stats = transport.stats.snapshot()
+
+        self.assertTrue(response.truncated)
+        self.assertEqual(len(response.content), 20000)
+        self.assertEqual(response.indicator_hits['sql_error'], ["PostgreSQL query failed"])
+        self.assertEqual(stats['truncated_responses'], 1)
+
+    def test_endless_stream_stops_at_deadline(self):
+        """Test a slow endless body is abandoned once the read deadline passes."""
+        def trickle():
+            for _ in range(400):
+                yield b'tick ' * 100
+                time.sleep(0.02)
+
+        with ProbeTargetServer({'/stream': (200, trickle)}) as target, \
+                ScanTransport(timeout=5, max_body_bytes=None, read_deadline=0.3) as transport:
+            started = time.monotonic()
+            response = transport.get(f"{target.url}/stream")
+            elapsed = time.monotonic() - started
+
+        self.assertTrue(response.truncated)
+        self.assertLess(elapsed, 3)
+        self.assertTrue(response.text.startswith('tick'))
+
+    def test_complete_body_is_not_truncated(self):
+        """Test a body within the limits is read in full."""
+        with ProbeTargetServer({'/': (200, b'home')}) as target, \
+                ScanTransport(timeout=5, max_body_bytes=4) as transport:
+            response = transport.get(f"{target.url}/")
+
+        self.assertFalse(response.truncated)
+        self.assertEqual(response.text, 'home')
+
+    def test_indicator_split_across_chunks(self):
+        """Test incremental detection finds an indicator spanning two chunks."""
+        reader = BoundedBodyReader('utf-8', max_bytes=None)
+        for chunk in (b'<html>Warning: my', b'sql_fetch_array() \xe2\x9c', b'\x93 done'):
+            reader.feed(chunk)
+        response = reader.finish('http://target/', 200, {}, 0.0)
+
+        self.assertEqual(response.indicator_hits['sql_error'], ["mysql_fetch", "Warning: mysql_"])
+        self.assertEqual(response.text, '<html>Warning: mysql_fetch_array() \u2713 done')
+
+class TestRateLimiter(unittest.TestCase):
+    """Test the per-host token bucket."""
+
+    def test_burst_then_sustained_rate(self):
+        """Test the bucket admits a burst at once and then spaces probes out."""
+        limiter = HostRateLimiter(requests_per_minute=600, burst=3)
+
+        delays = [limiter.reserve('http://target/a') for _ in range(5)]
+
+        self.assertEqual(delays[:3], [0.0, 0.0, 0.0])
+        self.assertAlmostEqual(delays[3], 0.1, places=2)
+        self.assertAlmostEqual(delays[4], 0.2, places=2)
+        # Another host has its own bucket
+        self.assertEqual(limiter.reserve('http://other/a'), 0.0)
+
+    def test_burst_reserves_all_its_slots_at_once(self):
+        """Test a burst waits once for its last slot and pushes later probes back by its size."""
+        limiter = HostRateLimiter(requests_per_minute=600, burst=3)
+
+        self.assertAlmostEqual(limiter.reserve('http://target/login', count=5), 0.2, places=2)
+        self.assertAlmostEqual(limiter.reserve('http://target/a'), 0.3, places=2)
+
+    def test_reservations_are_first_come_first_served(self):
+        """Test concurrent vectors are admitted in arrival order without sharing slots."""
+        limiter = HostRateLimiter(requests_per_minute=6000, burst=1)
+        delays = []
+        lock = threading.Lock()
+
+        def vector():
+            for _ in range(5):
+                delay = limiter.reserve('http://target/')
+                with lock:
+                    delays.append(delay)
+
+        threads = [threading.Thread(target=vector) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        slots = sorted(round(delay / 0.01) for delay in delays)
+        self.assertEqual(slots, list(range(20)))
+
+    def test_backoff_honors_retry_after(self):
+        """Test a 429 slows the host down and holds probes for the Retry-After delay."""
+        limiter = HostRateLimiter(requests_per_minute=600, burst=5)
+        limiter.reserve('http://target/')
+        limiter.observe('http://target/', 429, '2')
+
+        self.assertGreaterEqual(limiter.reserve('http://target/'), 1.9)
+        stats = limiter.stats()['hosts']['target']
+        self.assertEqual(stats['backoffs'], 1)
+        self.assertEqual(stats['current_requests_per_minute'], 300)
+
+        for _ in range(20):
+            limiter.observe('http://target/', 200)
+        self.assertEqual(limiter.stats()['hosts']['target']['current_requests_per_minute'], 600)
+
+    def test_parse_retry_after(self):
+        """Test Retry-After parsing for seconds, dates and garbage."""
+        self.assertEqual(parse_retry_after('3'), 3.0)
+        self.assertEqual(parse_retry_after('3600'), 60)
+        self.assertEqual(parse_retry_after('Wed, 21 Oct 2015 07:28:00 GMT'), 0.0)
+        self.assertIsNone(parse_retry_after('soon'))
+        self.assertIsNone(parse_retry_after(None))
+
+    def test_suite_reports_throttled_time(self):
+        """Test a rate-limited suite spaces its probes and reports the time throttled."""
+        engine = AttackVectorEngine({'RATE_LIMIT_REQUESTS_PER_MINUTE': 1200, 'RATE_LIMIT_BURST': 2})
+        engine._attack_vectors = {
+            name: cls for name, cls in engine._attack_vectors.items()
+            if name == 'owasp_sql_injection'
+        }
+
+        with ProbeTargetServer() as target:
+            suite = engine.run_test_suite(target.url, "owasp")
+
+        host = suite['rate_limit']['hosts'][target.url.split('//')[1]]
+        self.assertEqual(host['requests'], len(target.requests))
+        self.assertEqual(host['throttled_requests'], len(target.requests) - 2)
+        self.assertGreater(suite['rate_limit']['throttled_seconds'], 0)
+
+def unused_local_url() -> str:
+    """Get a local URL on which nothing is listening."""
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        port = sock.getsockname()[1]
+    return f"http://127.0.0.1:{port}"
+
+class TestBatchScan(unittest.TestCase):
+    """Test fair multi-target batch scanning."""
+
+    def test_targets_take_turns(self):
+        """Test work items alternate between targets instead of draining one target first."""
+        scheduler = build_schedule(['http://a', 'http://b'], {'x': None, 'y': None}, max_per_host=5)
+        order = []
+        while True:
+            item = scheduler.next_item()
+            if item is None:
+                break
+            order.append((item.host, item.test_name))
+            scheduler.task_done(item)
+
+        self.assertEqual(order, [('a', 'x'), ('b', 'x'), ('a', 'y'), ('b', 'y')])
+
+    def test_host_cap_skips_busy_host(self):
+        """Test a target whose host is at its cap waits without losing its turn."""
+        scheduler = build_schedule(['http://a/1', 'http://a/2', 'http://b'], {'x': None}, max_per_host=1)
+
+        first = scheduler.next_item()
+        second = scheduler.next_item()
+        self.assertEqual((first.target_url, second.target_url), ('http://a/1', 'http://b'))
+
+        scheduler.task_done(first)
+        self.assertEqual(scheduler.next_item().target_url, 'http://a/2')
+
+    def test_batch_reports_progress_tree(self):
+        """Test a batch scans every target and nests suites and vectors under the batch."""
+        engine = AttackVectorEngine(UNTHROTTLED_CONFIG)
+        engine._attack_vectors = {
+            name: cls for name, cls in engine._attack_vectors.items()
+            if name in ('owasp_sql_injection', 'owasp_cross_site_scripting')
+        }
+        routes = {'/api/users': (200, b'Warning: mysql_fetch_array() expects parameter 1')}
+        batch_steps = []
+        engine.progress_tracker.add_callback(
+            lambda progress: batch_steps.append(progress.completed_steps)
+            if progress.test_id == 'batch-progress' else None)
+
+        with ProbeTargetServer(routes) as first, ProbeTargetServer() as second:
+            batch = engine.run_batch_scan([first.url, second.url], "owasp", max_workers=4, max_per_host=1,
+                                          batch_id='batch-progress')
+
+        self.assertEqual(batch['total_work_items'], 4)
+        self.assertEqual(set(batch['scheduling']['peak_in_flight_per_host'].values()), {1})
+        self.assertGreater(batch['targets'][0]['total_vulnerabilities'], 0)
+        self.assertEqual(batch['targets'][1]['total_vulnerabilities'], 0)
+
+        tree = batch['progress']
+        self.assertEqual(tree['status'], TestStatus.COMPLETED.value)
+        self.assertEqual(tree['completed_steps'], 4)
+        # Workers finishing out of order never move the batch backwards
+        self.assertEqual(batch_steps, sorted(batch_steps))
+        self.assertEqual([suite['status'] for suite in tree['children']], ['completed', 'completed'])
+        self.assertEqual(sorted(vector['test_name'] for vector in tree['children'][0]['children']),
+                         ['Owasp Cross Site Scripting', 'Owasp Sql Injection'])
+
+class TestBatchCheckpoint(unittest.TestCase):
+    """Test batch checkpointing and resume."""
+
+    def setUp(self):
+        self.checkpoint_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.checkpoint_dir, ignore_errors=True)
+
+    def _engine(self):
+        engine = AttackVectorEngine(dict(UNTHROTTLED_CONFIG, SCAN_CHECKPOINT_DIR=self.checkpoint_dir))
+        engine._attack_vectors = {
+            name: cls for name, cls in engine._attack_vectors.items()
+            if name in ('owasp_sql_injection', 'owasp_cross_site_scripting')
+        }
+        return engine
+
+    def test_resume_skips_checkpointed_units(self):
+        """Test a batch resumed after a crash restores finished units and runs only the rest."""
+        routes = {'/api/users': (200, b'Warning: mysql_fetch_array() expects parameter 1')}
+
+        with ProbeTargetServer(routes) as target:
+            first = self._engine().run_batch_scan([target.url], "owasp", batch_id="overnight")
+            path = first['checkpoint']
+
+            # Simulate a crash after the first unit, part-way through writing the second
+            with open(path) as checkpoint_file:
+                header, sql_unit = [line for line in checkpoint_file
+                                    if json.loads(line).get('test_name') != 'owasp_cross_site_scripting'][:2]
+            self.assertEqual(json.loads(sql_unit)['test_name'], 'owasp_sql_injection')
+            with open(path, 'w') as checkpoint_file:
+                checkpoint_file.write(header + sql_unit + '{"type": "unit", "target_in')
+
+            probes_before = len(target.requests)
+            resumed = self._engine().resume_batch_scan("overnight")
+            probes_on_resume = target.requests[probes_before:]
+
+        self.assertEqual(resumed['restored_work_items'], 1)
+        self.assertEqual(resumed['total_vulnerabilities'], first['total_vulnerabilities'])
+        self.assertEqual(resumed['progress']['status'], TestStatus.COMPLETED.value)
+        self.assertFalse(any(path_.startswith('/api/users') for _, path_ in probes_on_resume))
+
+        state = BatchCheckpoint(path).load()
+        self.assertEqual(set(state.completed), {(0, 'owasp_sql_injection'), (0, 'owasp_cross_site_scripting')})
+
+    def test_resume_without_checkpoint(self):
+        """Test resuming an unknown batch is refused."""
+        with self.assertRaises(ValueError):
+            self._engine().resume_batch_scan("never-ran")
+        self.assertFalse(os.listdir(self.checkpoint_dir))
+
+class TestFindingFingerprints(unittest.TestCase):
+    """Test deterministic finding IDs and duplicate merging."""
+
+    def test_same_issue_gets_same_id_across_payloads_and_scans(self):
+        """Test the ID ignores payload and time but not the endpoint or signature."""
+        def finding(target_url, payload, endpoint='/api/users', indicators=('mysql_fetch_array',)):
+            vector = SQLInjectionAttack(target_url, transport=ScanTransport())
+            return vector._create_vulnerability_result(
+                vulnerability_type="sql_injection", severity="high", description=f"payload {payload}",
+                evidence={'endpoint': f"{endpoint}?id={payload}", 'payload': payload,
+                          'matched_indicators': list(indicators)})
+
+        first = finding('http://target', "' OR 1=1")
+        self.assertEqual(finding('http://TARGET/', "1; DROP TABLE").vulnerability_id, first.vulnerability_id)
+        self.assertTrue(first.vulnerability_id.startswith('sql_injection_'))
+        self.assertNotEqual(finding('http://target', "'", endpoint='/search').fingerprint, first.fingerprint)
+        self.assertNotEqual(finding('http://target', "'", indicators=('ORA-00933',)).fingerprint, first.fingerprint)
+
+    def test_duplicates_merge_with_occurrence_count(self):
+        """Test findings sharing a fingerprint collapse into one carrying every payload."""
+        vector = SQLInjectionAttack('http://target', transport=ScanTransport())
+        results = [
+            vector._create_vulnerability_result("sql_injection", "high", "found",
+                                                {'payload': payload, 'matched_indicators': [signature]})
+            for payload, signature in (("'", 'mysql'), ("''", 'mysql'), ("1'", 'oracle'), ("'", 'mysql'))
+        ]
+
+        merged = aggregate_findings(results)
+
+        self.assertEqual([result.occurrences for result in merged], [3, 1])
+        self.assertEqual(merged[0].evidence['payloads'], ["'", "''"])
+        self.assertIn('first_seen', merged[0].evidence)
+        self.assertNotIn('payloads', merged[1].evidence)
+
+class TestFindingsStore(unittest.TestCase):
+    """Test the SQLite findings history."""
+
+    @staticmethod
+    def _finding(target_url, severity, index):
+        return {
+            'vulnerability_id': f"finding_{index}",
+            'attack_vector': 'owasp_sql_injection',
+            'target_url': target_url,
+            'severity': severity,
+            'description': 'SQL error disclosed',
+            'evidence': {'payload': "' OR '1'='1", 'index': index},
+            'timestamp': datetime(2026, 1, 1, 12, 0, index % 60),
+            'sacred_principles_validated': True
+        }
+
+    def test_filters_and_pages_newest_first(self):
+        """Test keyset pages cover every matching finding exactly once, newest first."""
+        store = FindingsStore("sqlite:///:memory:")
+        store.add_findings('suite_a', [self._finding('http://a', 'high', i) for i in range(5)])
+        store.add_findings('suite_b', [self._finding('http://b', 'low', i) for i in range(5, 8)])
+
+        seen, cursor = [], None
+        while True:
+            page = store.query(target_url='http://a', limit=2, cursor=cursor)
+            seen.extend(finding['vulnerability_id'] for finding in page['findings'])
+            cursor = page['next_cursor']
+            if cursor is None:
+                break
+
+        self.assertEqual(seen, [f"finding_{i}" for i in range(4, -1, -1)])
+        low = store.query(severity='low')['findings']
+        self.assertEqual(len(low), 3)
+        self.assertEqual(low[0]['evidence']['index'], 7)
+        self.assertEqual(store.count_by_severity(), {'high': 5, 'low': 3})
+        self.assertEqual(len(store.query(since='2026-01-01T12:00:06')['findings']), 2)
+
+    def test_suite_findings_are_stored(self):
+        """Test a suite writes its findings to the DATABASE_URL database."""
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory, ignore_errors=True)
+        engine = AttackVectorEngine(dict(UNTHROTTLED_CONFIG, DATABASE_URL=f"sqlite:///{directory}/findings.db"))
+        engine._attack_vectors = {
+            name: cls for name, cls in engine._attack_vectors.items()
+            if name == 'owasp_sql_injection'
+        }
+        routes = {'/api/users': (200, b'Warning: mysql_fetch_array() expects parameter 1')}
+
+        with ProbeTargetServer(routes) as target:
+            suite = engine.run_test_suite(target.url, "owasp")
+
+        stored = engine.findings_store.query(scan_id=suite['suite_id'], limit=500)['findings']
+        self.assertEqual(len(stored), suite['total_vulnerabilities'])
+        self.assertGreater(len(stored), 0)
+        self.assertEqual(sqlite_path_from_url("sqlite:///data/x.db"), "data/x.db")
+        with self.assertRaises(ValueError):
+            sqlite_path_from_url("postgresql://localhost/aurora")
+
+class TestEndpointDiscovery(unittest.TestCase):
+    """Test the endpoint discovery crawler and its use by the vectors."""
+
+    SITE = {
+        '/robots.txt': (200, b"User-agent: *\nDisallow: /private/\nSitemap: /sitemap.xml\n"),
+        '/sitemap.xml': (200, b"<urlset><url><loc>{origin}/docs</loc></url></urlset>"),
+        '/openapi.json': (200, json.dumps({"paths": {"/api/orders/{id}": {
+            "get": {"parameters": [{"name": "expand", "in": "query"}]},
+            "post": {"requestBody": {"content": {"application/json": {
+                "schema": {"properties": {"item": {}, "quantity": {}}}}}}}}}}).encode()),
+        '/': (200, b'<a href="/products?sku=1">p</a><a href="https://elsewhere.test/x">x</a>'
+                   b'<a href="/style.css">s</a>'
+                   b'<form action="/search" method="get"><input name="term"></form>'),
+        '/products': (200, b'<a href="/products?sku=2">next</a><a href="/deep">d</a>'),
+        '/docs': (200, b'docs'),
+        '/deep': (200, b'<a href="/deeper">dd</a>'),
+        '/deeper': (200, b'bottom')
+    }
+
+    def _site(self):
+        server = ProbeTargetServer(dict(self.SITE))
+        origin = server.url.encode()
+        server.httpd.routes['/sitemap.xml'] = (200, self.SITE['/sitemap.xml'][1].replace(b"{origin}", origin))
+        return server
+
+    def test_ingests_discovery_documents_and_crawls_within_depth(self):
+        """Test robots, sitemap, OpenAPI, links and forms all feed one inventory."""
+        with self._site() as target:
+            transport = ScanTransport()
+            try:
+                inventory = EndpointCrawler(transport, max_depth=1).discover(target.url)
+            finally:
+                transport.close()
+
+        endpoints = {(endpoint.method, endpoint.path): endpoint for endpoint in inventory.endpoints()}
+        self.assertEqual(endpoints[('GET', '/products')].parameters, ['sku'])
+        self.assertEqual(endpoints[('GET', '/search')].parameters, ['term'])
+        self.assertEqual(endpoints[('GET', '/api/orders/1')].parameters, ['expand'])
+        self.assertEqual(endpoints[('POST', '/api/orders/1')].parameters, ['item', 'quantity'])
+        self.assertIn('robots', endpoints[('GET', '/private/')].sources)
+        self.assertIn('sitemap', endpoints[('GET', '/docs')].sources)
+        self.assertIn(('GET', '/deep'), endpoints)
+        # Depth 1 records /deeper as a link but never fetches it
+        self.assertNotIn(('GET', '/deeper'), target.requests)
+        # Query values do not make a page new, off-origin and static links are not followed
+        self.assertEqual(target.requests.count(('GET', '/products?sku=1')), 1)
+        self.assertNotIn(('GET', '/products?sku=2'), target.requests)
+        self.assertNotIn(('GET', '/style.css'), target.requests)
+        self.assertEqual(inventory.injection_points(), [('/api/orders/1', 'expand'), ('/products', 'sku'),
+                                                        ('/search', 'term')])
+
+    def test_request_budget_caps_discovery(self):
+        """Test discovery stops sending once its request budget is spent."""
+        with self._site() as target:
+            transport = ScanTransport()
+            try:
+                inventory = EndpointCrawler(transport, max_depth=5, max_requests=4).discover(target.url)
+            finally:
+                transport.close()
+
+        self.assertEqual(len(target.requests), 4)
+        self.assertEqual(inventory.stats()['requests_sent'], 4)
+        self.assertTrue(inventory.stats()['budget_exhausted'])
+
+    def test_visited_set_stores_digests(self):
+        """Test the visited set answers membership without keeping the URLs."""
+        visited = VisitedSet()
+        url = '/search?' + 'q' * 10000
+
+        self.assertTrue(visited.add(url))
+        self.assertFalse(visited.add(url))
+        self.assertIn(url, visited)
+        self.assertEqual(len(visited), 1)
+
+    def test_vectors_probe_discovered_parameters(self):
+        """Test a suite with discovery enabled injects into parameters it found."""
+        engine = AttackVectorEngine(dict(UNTHROTTLED_CONFIG, ENDPOINT_DISCOVERY_ENABLED=True))
+        engine._attack_vectors = {'owasp_sql_injection': engine._attack_vectors['owasp_sql_injection']}
+
+        with ProbeTargetServer({'/': (200, b'<a href="/reports?year=2024">r</a>'),
+                                '/reports': (200, b'PostgreSQL query failed: syntax error')}) as target:
+            suite = engine.run_test_suite(target.url, "owasp")
+
+        self.assertEqual(suite['discovery']['stats']['parameterized_endpoints'], 1)
+        self.assertEqual({(result['evidence']['endpoint'], result['evidence']['parameter'])
+                          for result in suite['results']}, {('/reports', 'year')})
+
+    def test_target_with_base_path(self):
+        """Test a target under a base path is crawled and probed at the paths its pages link to."""
+        engine = AttackVectorEngine(dict(UNTHROTTLED_CONFIG, ENDPOINT_DISCOVERY_ENABLED=True))
+        engine._attack_vectors = {'owasp_sql_injection': engine._attack_vectors['owasp_sql_injection']}
+
+        with ProbeTargetServer({'/app': (200, b'<a href="/app/reports?year=2024">r</a>'),
+                                '/app/reports': (200, b'<a href="/app/archive">a</a> '
+                                                      b'PostgreSQL query failed: syntax error'),
+                                '/app/archive': (200, b'archive')}) as target:
+            suite = engine.run_test_suite(f"{target.url}/app", "owasp")
+
+        paths = [path.split('?')[0] for _, path in target.requests]
+        self.assertIn('/app/archive', paths)
+        self.assertFalse(any(path.startswith('/app/app') for path in paths))
+        # The built-in injection point is probed under the base path too
+        self.assertIn('/app/api/users', paths)
+        self.assertEqual({(result['evidence']['endpoint'], result['evidence']['parameter'])
+                          for result in suite['results']}, {('/app/reports', 'year')})
+
+class CatchAllRoutes(dict):
+    """Route table that answers unknown paths like a single page app."""
+
+    SHELL = (200, b'<html><head><title>Shop</title></head><body><div id="app">Loading the shop, '
+                  b'please wait while we prepare your personalised experience</div></body></html>')
+
+    def get(self, key, default=None):
+        return super().get(key, self.SHELL)
+
+class TestSoftNotFound(unittest.TestCase):
+    """Test soft-404 baselines."""
+
+    def _response(self, path: str, body: bytes, status: int = 200) -> ProbeResponse:
+        return ProbeResponse(url=f'http://target{path}', status_code=status, headers={}, content=body)
+
+    def test_fingerprint_tolerates_dynamic_parts(self):
+        """Test pages differing in a token or the echoed path match, other pages do not."""
+        page = b'<html><body><h1>Welcome</h1><p>Sorry, %s could not be found on this server today. ' \
+               b'Return to the home page or search the catalogue.</p><p>request %s</p></body></html>'
+        baseline = NotFoundFingerprint.of(self._response('/aurora-1', page % (b'/aurora-1', b'8c1f')))
+
+        self.assertTrue(baseline.matches(self._response('/.git/', page % (b'/.git/', b'77ad'))))
+        self.assertFalse(baseline.matches(self._response('/.git/', page % (b'/.git/', b'77ad'), status=404)))
+        self.assertFalse(baseline.matches(self._response('/package.json', b'{"dependencies": {"lodash": "4.17.4"}}')))
+
+    def test_catch_all_target_drops_matching_responses(self):
+        """Test a single page app's 200-for-everything answers raise no findings, real files still do."""
+        engine = AttackVectorEngine(UNTHROTTLED_CONFIG)
+        engine._attack_vectors = {
+            name: cls for name, cls in engine._attack_vectors.items()
+            if name in ('owasp_security_misconfiguration', 'owasp_known_vulnerabilities')
+        }
+        routes = CatchAllRoutes({'/package.json': (200, b'{"name": "shop", "dependencies": {"express": "4.0.0"}}')})
+
+        with ProbeTargetServer(routes) as target:
+            suite = engine.run_test_suite(target.url, "owasp")
+
+        # The server header is real; every path and login probe answered by the app shell is dropped
+        findings = {result['evidence']['test_type']: result['evidence'] for result in suite['results']}
+        self.assertEqual(sorted(findings), ['dependency_check', 'server_info_disclosure'])
+        self.assertEqual(findings['dependency_check']['dependency_file'], '/package.json')
+        self.assertEqual(suite['soft_404']['catch_all_targets'], 1)
+        self.assertGreater(suite['soft_404']['dropped_responses'], 0)
+        self.assertEqual(len([path for _, path in target.requests if path.startswith('/aurora-')]), 2)
+
+    def test_no_baseline_when_nothing_succeeds(self):
+        """Test a target that 404s every probe costs no baseline requests."""
+        engine = AttackVectorEngine(UNTHROTTLED_CONFIG)
+        engine._attack_vectors = {'owasp_known_vulnerabilities': engine._attack_vectors['owasp_known_vulnerabilities']}
+
+        with ProbeTargetServer() as target:
+            suite = engine.run_test_suite(target.url, "owasp")
+
+        self.assertEqual(suite['soft_404']['targets'], 0)
+        self.assertFalse([path for _, path in target.requests if path.startswith('/aurora-')])
+
+class LoginLimiterRoutes(dict):
+    """Route table whose login endpoint answers 429 once it has seen ``allowed`` attempts."""
+
+    def __init__(self, allowed=None):
+        super().__init__({'/': (200, b'home')})
+        self.allowed = allowed
+        self.attempts = 0
+        self.lock = threading.Lock()
+
+    def get(self, key, default=None):
+        if key != '/api/login':
+            return super().get(key, default)
+        with self.lock:
+            self.attempts += 1
+            over = self.allowed is not None and self.attempts > self.allowed
+        return (429, b'slow down') if over else (401, b'invalid credentials')
+
+class TestBurstProbe(unittest.TestCase):
+    """Test burst-mode brute force detection."""
+
+    def test_finds_limit_threshold(self):
+        """Test a limiter that allows four attempts is found at the fifth."""
+        with ProbeTargetServer(LoginLimiterRoutes(allowed=4)) as target, ScanTransport() as transport:
+            started = time.monotonic()
+            report = run_burst(transport, 'POST', f"{target.url}/api/login", size=10, window=0.2,
+                               json={"username": "admin", "password": "wrong"})
+            elapsed = time.monotonic() - started
+
+        self.assertLess(elapsed, 5)
+        self.assertTrue(report.limited)
+        self.assertEqual(report.threshold, 5)
+        self.assertEqual(report.status_distribution, {'401': 4, '429': 6})
+
+    def test_burst_threads_are_capped(self):
+        """Test a burst larger than its worker cap still sends every attempt on at most that many threads."""
+        with ProbeTargetServer(LoginLimiterRoutes()) as target, ScanTransport() as transport:
+            threads = set()
+            request_reserved = transport.request_reserved
+
+            def tracked(*args, **kwargs):
+                threads.add(threading.current_thread().name)
+                return request_reserved(*args, **kwargs)
+
+            transport.request_reserved = tracked
+            report = run_burst(transport, 'POST', f"{target.url}/api/login", size=8, window=0,
+                               max_workers=2, json={"username": "admin", "password": "wrong"})
+
+        self.assertEqual(len(report.attempts), 8)
+        self.assertEqual(len(report.answered), 8)
+        self.assertLessEqual(len(threads), 2)
+
+    def test_unprotected_login_is_reported_with_burst_evidence(self):
+        """Test a login that never pushes back is a finding carrying the burst statistics."""
+        with ProbeTargetServer(LoginLimiterRoutes()) as target:
+            attack = BrokenAuthenticationAttack(target.url, brute_force_burst_size=6, brute_force_burst_window=0)
+            try:
+                result = attack._test_brute_force_protection()
+            finally:
+                attack.transport.close()
+
+        self.assertEqual(result.evidence['attempts_made'], 6)
+        self.assertEqual(result.evidence['status_distribution'], {'401': 6})
+        self.assertIsNone(result.evidence['limit_threshold'])
+
+    def test_limited_login_is_not_a_finding(self):
+        """Test a login that rate limits the burst passes."""
+        with ProbeTargetServer(LoginLimiterRoutes(allowed=2)) as target:
+            attack = BrokenAuthenticationAttack(target.url, brute_force_burst_size=6, brute_force_burst_window=0)
+            try:
+                self.assertIsNone(attack._test_brute_force_protection())
+            finally:
+                attack.transport.close()
+
+class TestRequestPlan(unittest.TestCase):
+    """Test merging declared probes into one request plan."""
+
+    def test_identical_probes_are_sent_once(self):
+        """Test probes equal on method, path and body merge and the counts are reported."""
+        plan = RequestPlan('http://target')
+        plan.add('First', [ProbeSpec('GET', '/', 'a'), ProbeSpec('POST', '/login', 'b', json={'u': 1, 'p': 2})])
+        plan.add('Second', [ProbeSpec('GET', '/', 'c'), ProbeSpec('POST', '/login', 'd', json={'p': 2, 'u': 1}),
+                            ProbeSpec('POST', '/login', 'e', json={'u': 2, 'p': 2})])
+
+        self.assertEqual(plan.stats(), {"vectors": 2, "declared_probes": 5,
+                                        "planned_requests": 3, "merged_requests": 2})
+
+    def test_each_response_reaches_every_subscriber(self):
+        """Test a merged request is sent once and its response handed to every vector that declared it."""
+        with ProbeTargetServer({'/': (200, b'home'), '/admin': (403, b'no')}) as target:
+            transport = ScanTransport()
+            try:
+                plan = RequestPlan(target.url, batch_size=2)
+                plan.add('First', [ProbeSpec('GET', '/', 'a'), ProbeSpec('GET', '/admin', 'b')])
+                plan.add('Second', [ProbeSpec('GET', '/', 'c')])
+                plan.execute(transport)
+                plan.execute(transport)
+            finally:
+                transport.close()
+
+        self.assertEqual(sorted(target.requests), [('GET', '/'), ('GET', '/admin')])
+        first = plan.outcomes_for('First')
+        second = plan.outcomes_for('Second')
+        self.assertEqual([probe.detector for probe, _ in first], ['a', 'b'])
+        self.assertEqual(first[1][1].status_code, 403)
+        self.assertIs(second[0][1], first[0][1])
+
+class TestScanJobs(unittest.TestCase):
+    """Test the background scan job queue."""
+
+    def test_job_runs_under_its_progress_id(self):
+        """Test a queued suite is pollable at once and finishes under the job ID."""
+        engine = AttackVectorEngine(UNTHROTTLED_CONFIG)
+        engine._attack_vectors = {
+            name: cls for name, cls in engine._attack_vectors.items()
+            if name == 'owasp_sql_injection'
+        }
+        manager = ScanJobManager(engine, max_workers=1)
+        updates = []
+        manager.add_listener(lambda job: updates.append(job.status))
+
+        with ProbeTargetServer() as target:
+            job = manager.submit_suite(target.url, "owasp")
+            self.assertIsNotNone(engine.progress_tracker.get_test_progress(job.job_id))
+            manager.wait(job.job_id, timeout=30)
+
+        self.assertEqual(job.status, ScanJobStatus.COMPLETED)
+        self.assertEqual(job.result['suite_id'], job.job_id)
+        self.assertEqual(engine.progress_tracker.get_test_progress(job.job_id).status, TestStatus.COMPLETED)
+        self.assertEqual(updates[-1], ScanJobStatus.COMPLETED)
+        self.assertEqual(manager.stats()['completed'], 1)
+
+    def test_full_queue_rejects_and_reports_depth(self):
+        """Test submissions beyond the queue size are refused while waiting jobs are counted."""
+        engine = AttackVectorEngine(UNTHROTTLED_CONFIG)
+        started, release = threading.Event(), threading.Event()
+
+        def slow_suite(target_url, test_category, concurrent=False, suite_id=None, cancel_token=None):
+            started.set()
+            release.wait(10)
+            return {'suite_id': suite_id}
+
+        engine.run_test_suite = slow_suite
+        manager = ScanJobManager(engine, max_workers=1, max_queue_size=1)
+
+        running = manager.submit_suite('http://127.0.0.1:1', "owasp")
+        self.assertTrue(started.wait(5))
+        waiting = manager.submit_suite('http://127.0.0.1:2', "owasp")
+        with self.assertRaises(ScanQueueFullError):
+            manager.submit_suite('http://127.0.0.1:3', "owasp")
+
+        stats = manager.stats()
+        self.assertEqual((stats['queue_depth'], stats['running'], stats['rejected']), (1, 1, 1))
+        self.assertEqual(engine.progress_tracker.get_test_progress(waiting.job_id).status, TestStatus.PENDING)
+
+        time.sleep(0.05)
+        release.set()
+        manager.wait(running.job_id, timeout=5)
+        manager.wait(waiting.job_id, timeout=5)
+        self.assertEqual(waiting.status, ScanJobStatus.COMPLETED)
+        self.assertGreaterEqual(manager.stats()['max_wait_seconds'], 0.05)
+
+    def test_cancel_waiting_job(self):
+        """Test a job cancelled while queued finishes at once and is never started."""
+        engine = AttackVectorEngine(UNTHROTTLED_CONFIG)
+        started, release = threading.Event(), threading.Event()
+        ran = []
+
+        def slow_suite(target_url, test_category, concurrent=False, suite_id=None, cancel_token=None):
+            ran.append(suite_id)
+            started.set()
+            release.wait(10)
+            return {'suite_id': suite_id}
+
+        engine.run_test_suite = slow_suite
+        manager = ScanJobManager(engine, max_workers=1)
+
+        running = manager.submit_suite('http://127.0.0.1:1', "owasp")
+        self.assertTrue(started.wait(5))
+        waiting = manager.submit_suite('http://127.0.0.1:2', "owasp")
+        manager.cancel(waiting.job_id, "No longer needed")
+
+        self.assertEqual(waiting.status, ScanJobStatus.CANCELLED)
+        self.assertEqual(engine.progress_tracker.get_test_progress(waiting.job_id).status, TestStatus.CANCELLED)
+
+        release.set()
+        manager.wait(running.job_id, timeout=5)
+        manager._queue.join()
+        self.assertEqual(ran, [running.job_id])
+        self.assertEqual(manager.stats()['cancelled'], 1)
+
+class TestCancellation(unittest.TestCase):
+    """Test cooperative scan cancellation."""
+
+    def test_cancel_interrupts_waits(self):
+        """Test a cancelled token cuts sync and async sleeps short."""
+        token = CancellationToken()
+        threading.Timer(0.05, token.cancel, args=("Stop",)).start()
+
+        started = time.perf_counter()
+        with self.assertRaises(ScanCancelledError):
+            token.sleep(10)
+        self.assertLess(time.perf_counter() - started, 2)
+        self.assertFalse(token.cancel())
+
+        with self.assertRaises(ScanCancelledError):
+            asyncio.run(token.sleep_async(10))
+
+    def test_concurrent_cancels_have_one_winner(self):
+        """Test only one of many racing cancels succeeds and its reason is the one kept."""
+        token = CancellationToken()
+        barrier = threading.Barrier(16)
+        winners = []
+
+        def cancel(n):
+            barrier.wait()
+            if token.cancel(f"Stop {n}"):
+                winners.append(n)
+
+        threads = [threading.Thread(target=cancel, args=(n,)) for n in range(16)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(winners), 1)
+        self.assertEqual(token.reason, f"Stop {winners[0]}")
+
+    def test_cancel_running_suite_keeps_partial_progress(self):
+        """Test a suite cancelled mid-run stops waiting on the rate limiter and records where it stopped."""
+        engine = AttackVectorEngine({'RATE_LIMIT_REQUESTS_PER_MINUTE': 60, 'RATE_LIMIT_BURST': 1})
+        engine._attack_vectors = {
+            name: cls for name, cls in engine._attack_vectors.items()
+            if name in ('owasp_sql_injection', 'owasp_cross_site_scripting')
+        }
+
+        # Probes a vector still sends once the scan is cancelled, and errors it logs
+        probes_after_cancel = []
+        original_probe = BaseAttackVector._probe
+
+        def probe(vector, method, url, **kwargs):
+            if vector.cancel_token.cancelled:
+                probes_after_cancel.append(url)
+            return original_probe(vector, method, url, **kwargs)
+
+        errors = []
+        error_handler = logging.Handler(logging.ERROR)
+        error_handler.emit = errors.append
+        vectors_logger = logging.getLogger('core.vectors')
+        vectors_logger.addHandler(error_handler)
+
+        try:
+            with ProbeTargetServer() as target, \
+                    unittest.mock.patch.object(BaseAttackVector, '_probe', probe):
+                threading.Timer(0.5, engine.cancel_scan, args=("suite-to-cancel", "Operator stop")).start()
+                started = time.perf_counter()
+                result = engine.run_test_suite(target.url, "owasp", suite_id="suite-to-cancel")
+        finally:
+            vectors_logger.removeHandler(error_handler)
+
+        self.assertLess(time.perf_counter() - started, 5)
+        # The vector stops at its first cancelled probe instead of logging one error per payload
+        self.assertLessEqual(len(probes_after_cancel), 1)
+        self.assertEqual([record.getMessage() for record in errors], [])
+        self.assertTrue(result['cancelled'])
+        self.assertEqual(result['cancel_reason'], "Operator stop")
+
+        tree = engine.progress_tracker.get_progress_tree("suite-to-cancel")
+        self.assertEqual(tree['status'], TestStatus.CANCELLED.value)
+        self.assertEqual(tree['cancel_point'], "Running owasp_sql_injection")
+        self.assertEqual([child['status'] for child in tree['children']], [TestStatus.CANCELLED.value] * 2)
+        self.assertFalse(engine.cancel_scan("suite-to-cancel"))
+
+    def test_native_async_vector_raises_cancellation(self):
+        """Test a cancelled probe gathered with the others stops the async vector instead of being logged."""
+        token = CancellationToken()
+        token.cancel("Operator stop")
+
+        async def scan(url):
+            async with AsyncScanTransport(cancel_token=token) as transport:
+                return await SQLInjectionAttack(url, cancel_token=token, async_transport=transport).run_async()
+
+        with ProbeTargetServer() as target:
+            with self.assertRaises(ScanCancelledError):
+                asyncio.run(scan(target.url))
+        self.assertEqual(target.requests, [])
+
+class TestCircuitBreaker(unittest.TestCase):
+    """Test the per-target circuit breaker."""
+
+    def test_opens_after_consecutive_failures(self):
+        """Test the circuit opens at the threshold and a success resets the count."""
+        breaker = CircuitBreaker(failure_threshold=3, reset_timeout=60)
+        url = 'http://target/'
+
+        breaker.record_failure(url)
+        breaker.record_failure(url)
+        breaker.record_success(url)
+        breaker.record_failure(url)
+        breaker.record_failure(url)
+        breaker.before_request(url)
+
+        breaker.record_failure(url)
+        with self.assertRaises(TargetUnavailableError):
+            breaker.before_request(url)
+        # Other targets are unaffected
+        breaker.before_request('http://other/')
+        self.assertEqual(breaker.stats()['target']['short_circuited_probes'], 1)
+
+    def test_half_open_trial_probe(self):
+        """Test one trial probe is admitted after the reset timeout and decides the state."""
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.05)
+        url = 'http://target/'
+        breaker.record_failure(url)
+        time.sleep(0.06)
+
+        breaker.before_request(url)
+        with self.assertRaises(TargetUnavailableError):
+            breaker.before_request(url)
+
+        breaker.record_failure(url)
+        self.assertEqual(breaker.stats()['target']['state'], CircuitState.OPEN.value)
+        self.assertEqual(breaker.stats()['target']['trips'], 2)
+
+        time.sleep(0.06)
+        breaker.before_request(url)
+        breaker.record_success(url)
+        self.assertTrue(breaker.is_available(url))
+
+    def test_dead_target_short_circuits_suite(self):
+        """Test vectors against a dead target stop early and are marked target unavailable."""
+        engine = AttackVectorEngine(dict(UNTHROTTLED_CONFIG, CIRCUIT_BREAKER_THRESHOLD=3))
+        engine._attack_vectors = {
+            name: cls for name, cls in engine._attack_vectors.items()
+            if name in ('owasp_broken_authentication', 'owasp_security_misconfiguration')
+        }
+
+        suite = engine.run_test_suite(unused_local_url(), "owasp")
+
+        circuit = next(iter(suite['circuit_breaker'].values()))
+        self.assertEqual(circuit['state'], CircuitState.OPEN.value)
+        self.assertEqual(suite['transport']['requests_sent'], 3)
+        self.assertGreater(circuit['short_circuited_probes'], 0)
+        self.assertEqual(suite['unavailable_tests'], ['owasp_broken_authentication',
+                                                      'owasp_security_misconfiguration'])
+        progress = engine.progress_tracker.get_test_progress(f"{suite['suite_id']}_owasp_broken_authentication")
+        self.assertEqual(progress.status, TestStatus.TARGET_UNAVAILABLE)
+
+    def test_stalled_body_counts_as_failure(self):
+        """Test a target that sends headers and then stalls its body opens the circuit."""
+        def stalled():
+            yield b'<html>'
+            time.sleep(1)
+
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=60)
+        with ProbeTargetServer({'/slow': (200, stalled)}) as target, \
+                ScanTransport(timeout=0.2, read_deadline=None, circuit_breaker=breaker) as transport:
+            with self.assertRaises(requests.ConnectionError):
+                transport.get(f"{target.url}/slow")
+
+            self.assertFalse(breaker.is_available(target.url))
+
+    def test_cancelled_trial_probe_frees_trial(self):
+        """Test a half-open trial cancelled mid-read lets the next probe try the target."""
+        token = CancellationToken()
+
+        def cancelled():
+            yield b'<html>'
+            token.cancel("Operator stop")
+            yield b'</html>'
+
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=60)
+        with ProbeTargetServer({'/slow': (200, cancelled), '/ok': (200, b'fine')}) as target:
+            breaker.record_failure(target.url)
+            breaker._circuit(target.url).opened_at -= 60
+
+            with ScanTransport(cancel_token=token, circuit_breaker=breaker) as transport:
+                with self.assertRaises(ScanCancelledError):
+                    transport.get(f"{target.url}/slow")
+
+            with ScanTransport(circuit_breaker=breaker) as transport:
+                self.assertEqual(transport.get(f"{target.url}/ok").text, 'fine')
+            self.assertTrue(breaker.is_available(target.url))
+
+class TestPortScanner(unittest.TestCase):
+    """Test the concurrent port scanner."""
+
+    def test_parse_port_spec(self):
+        """Test named sets, single ports and ranges combine into one sorted list."""
+        self.assertEqual(parse_port_spec("8080, 20-22 ,22"), [20, 21, 22, 8080])
+        self.assertEqual(parse_port_spec("common"), sorted(PORT_SETS['common']))
+        self.assertEqual(len(parse_port_spec("top100")), 100)
+        self.assertEqual(len(parse_port_spec("top1000")), 1000 + len([p for p in PORT_SETS['top100'] if p > 1000]))
+        with self.assertRaises(ValueError):
+            parse_port_spec("top5")
+        with self.assertRaises(ValueError):
+            parse_port_spec("70000")
+
+    def test_host_from_url(self):
+        """Test the host is taken from URLs with ports and paths."""
+        self.assertEqual(host_from_url("https://example.com:8443/app"), "example.com")
+        self.assertEqual(host_from_url("http://[::1]:8080/"), "::1")
+        self.assertEqual(host_from_url("example.com"), "example.com")
+
+    def test_sweep_finds_listening_ports(self):
+        """Test a range sweep reports open and closed ports with latencies."""
+        with ProbeTargetServer() as target:
+            port = target.httpd.server_address[1]
+            results = asyncio.run(scan_ports('127.0.0.1', [port, port + 1], timeout=1))
+
+        self.assertEqual([r.port for r in results], [port, port + 1])
+        self.assertTrue(results[0].is_open)
+        self.assertEqual(results[1].state, 'closed')
+        self.assertGreaterEqual(results[0].latency, 0)
+
+    def test_vector_reports_latency(self):
+        """Test the network vector sweeps the configured port set and records latency."""
+        with ProbeTargetServer() as target:
+            port = target.httpd.server_address[1]
+            attack = NetworkSecurityAttack(target.url, port_set=f"{port - 2}-{port + 2}")
+            results = attack.run()
+
+        self.assertEqual([r.evidence['port'] for r in results], [port])
+        self.assertIn('latency_ms', results[0].evidence)
+        self.assertEqual(results[0].evidence['host'], '127.0.0.1')
+
+class TestTargetResolver(unittest.TestCase):
+    """Test scan-scoped target resolution."""
+
+    def test_parse_target(self):
+        """Test scheme, host, port and path come out of URLs, IPv6 literals and bare hosts."""
+        self.assertEqual(parse_target("https://[2001:db8::1]:8443/app"), ('https', '2001:db8::1', 8443, '/app'))
+        self.assertEqual(parse_target("https://example.com"), ('https', 'example.com', 443, ''))
+        self.assertEqual(parse_target("example.com"), ('http', 'example.com', 80, ''))
+
+    def test_ip_literals_are_not_looked_up(self):
+        """Test IPv4 and IPv6 literals resolve to themselves without expiring."""
+        resolver = TargetResolver()
+        self.assertEqual(resolver.resolve("http://127.0.0.1:8080/").ipv4, ['127.0.0.1'])
+        target = resolver.resolve("https://[::1]/")
+        self.assertEqual(target.ipv6, ['::1'])
+        self.assertEqual(target.primary_address, '::1')
+        self.assertFalse(target.expired)
+
+    def test_lookups_are_cached_until_ttl(self):
+        """Test a host is looked up once per TTL whatever the URL around it."""
+        resolver = TargetResolver(default_ttl=0.05)
+        first = resolver.resolve("http://localhost:8080/a")
+        second = resolver.resolve("https://LOCALHOST/b")
+        self.assertIsNone(first.error)
+        self.assertEqual(first.addresses, second.addresses)
+        self.assertEqual((second.port, second.path), (443, '/b'))
+        self.assertEqual(resolver.stats()['lookups'], 1)
+
+        time.sleep(0.06)
+        resolver.resolve("http://localhost/")
+        self.assertEqual(resolver.stats()['lookups'], 2)
+
+    def test_system_resolver_answers_when_dns_does_not(self):
+        """Test a name only the system resolver knows, e.g. localhost, still resolves."""
+        class NXDOMAIN(Exception):
+            pass
+
+        def resolve(hostname, record_type):
+            raise NXDOMAIN(f"The DNS query name does not exist: {hostname}.")
+
+        dns_exception = types.ModuleType('dns.exception')
+        dns_exception.DNSException = Exception
+        dns_resolver = types.ModuleType('dns.resolver')
+        dns_resolver.NXDOMAIN = NXDOMAIN
+        dns_resolver.NoAnswer = NXDOMAIN
+        dns_resolver.resolve = resolve
+        dns = types.ModuleType('dns')
+        dns.exception, dns.resolver = dns_exception, dns_resolver
+
+        with unittest.mock.patch.dict(sys.modules, {'dns': dns, 'dns.exception': dns_exception,
+                                                    'dns.resolver': dns_resolver}):
+            target = TargetResolver(default_ttl=60).resolve("http://localhost/")
+
+        self.assertIsNone(target.error)
+        self.assertTrue(target.addresses)
+        self.assertEqual(target.ttl, 60)
+
+    def test_failed_lookup_reports_error(self):
+        """Test an unresolvable host yields an error and no addresses."""
+        target = TargetResolver().resolve("http://aurora-dojo.invalid/")
+        self.assertIsNotNone(target.error)
+        self.assertIsNone(target.primary_address)
+
+    def test_infra_suite_resolves_once(self):
+        """Test the infrastructure vectors of a suite share one lookup."""
+        with ProbeTargetServer() as target:
+            port = target.httpd.server_address[1]
+            engine = AttackVectorEngine(dict(UNTHROTTLED_CONFIG, PORT_SCAN_PORTS=str(port), PROBE_TIMEOUT=1))
+            engine._attack_vectors = {
+                name: cls for name, cls in engine._attack_vectors.items()
+                if name in ('infra_network_security', 'infra_ssl_tls_security', 'infra_dns_security')
+            }
+            suite = engine.run_test_suite(target.url.replace('127.0.0.1', 'localhost'), "infra")
+
+        self.assertEqual(suite['dns']['lookups'], 1)
+        self.assertEqual(suite['dns']['cache_hits'], 2)
+
+class LocalTLSServer:
+    """Local TLS endpoint with a throwaway self-signed certificate."""
+
+    def __init__(self, workdir: str, version: Optional[ssl.TLSVersion] = None,
+                 ciphers: Optional[str] = None):
+        cert = str(Path(workdir) / 'cert.pem')
+        key = str(Path(workdir) / 'key.pem')
+        subprocess.run(['openssl', 'req', '-x509', '-newkey', 'rsa:2048', '-nodes', '-days', '2',
+                        '-subj', '/CN=localhost', '-keyout', key, '-out', cert],
+                       check=True, capture_output=True)
+
+        self.context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+        self.context.minimum_version = ssl.TLSVersion.TLSv1_2
+        if version is not None:
+            # Only this protocol version, e.g. a legacy-only server
+            with warnings.catch_warnings():
+                warnings.simplefilter('ignore', DeprecationWarning)
+                self.context.set_ciphers(ciphers or 'ALL:@SECLEVEL=0')
+                self.context.minimum_version = version
+                self.context.maximum_version = version
+        self.context.load_cert_chain(cert, key)
+        self.sock = socket.create_server(('127.0.0.1', 0))
+        self.port = self.sock.getsockname()[1]
+        self.thread = threading.Thread(target=self._serve, daemon=True)
+
+    def _serve(self):
+        while True:
+            try:
+                conn, _ = self.sock.accept()
+            except OSError:
+                return
+            threading.Thread(target=self._handshake, args=(conn,), daemon=True).start()
+
+    def _handshake(self, conn):
+        try:
+            with self.context.wrap_socket(conn, server_side=True) as tls:
+                tls.recv(1)
+        except (ssl.SSLError, OSError):
+            conn.close()
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.sock.close()
+
+@unittest.skipUnless(shutil.which('openssl'), "openssl command not available")
+class TestTLSProbe(unittest.TestCase):
+    """Test TLS enumeration against a local endpoint."""
+
+    def setUp(self):
+        self.workdir = tempfile.TemporaryDirectory()
+        self.server = LocalTLSServer(self.workdir.name).__enter__()
+
+    def tearDown(self):
+        self.server.__exit__(None, None, None)
+        self.workdir.cleanup()
+
+    def test_enumerates_protocols_and_cipher_families(self):
+        """Test each protocol and cipher family gets its own handshake result."""
+        cache = TLSProbeCache()
+        report = TLSProber(cache=cache, timeout=5).enumerate('127.0.0.1', self.server.port)
+
+        self.assertTrue(report.reachable)
+        self.assertIn('TLSv1.2', report.accepted_protocols())
+        self.assertIn('TLSv1.3', report.accepted_protocols())
+        self.assertNotIn('TLSv1', report.accepted_protocols())
+        self.assertIn('AESGCM', report.accepted_cipher_families())
+        self.assertNotIn('RC4', report.accepted_cipher_families())
+        self.assertIsNotNone(report.verification_error)
+        self.assertIsNotNone(report.certificate_der)
+
+        # The endpoint is enumerated once per scan
+        self.assertIs(TLSProber(cache=cache).enumerate('127.0.0.1', self.server.port), report)
+        self.assertEqual(cache.stats()['endpoints'], 1)
+
+    def test_repeat_handshake_resumes_session(self):
+        """Test a repeated probe resumes the cached TLS session."""
+        cache = TLSProbeCache()
+        prober = TLSProber(cache=cache, timeout=5)
+        context = cache.context('TLSv1.2', lambda: _tls12_client_context())
+
+        first = prober.handshake('127.0.0.1', self.server.port, 'TLSv1.2', context)
+        second = prober.handshake('127.0.0.1', self.server.port, 'TLSv1.2', context)
+
+        self.assertTrue(first.accepted)
+        self.assertFalse(first.session_reused)
+        self.assertTrue(second.session_reused)
+        self.assertEqual(cache.stats()['resumed_handshakes'], 1)
+
+    def test_vector_reports_untrusted_certificate(self):
+        """Test the vector reports the self-signed certificate and no weak protocols."""
+        attack = SSLTLSecurityAttack(f"https://127.0.0.1:{self.server.port}", tls_timeout=5)
+        results = attack.run()
+
+        self.assertEqual([r.evidence['test_type'] for r in results], ['ssl_tls_certificate'])
+
+    def test_probes_server_limited_to_tls1(self):
+        """Test a TLS 1.0-only server is still enumerated when the default handshake fails."""
+        with tempfile.TemporaryDirectory() as workdir, \
+                LocalTLSServer(workdir, version=ssl.TLSVersion.TLSv1) as server:
+            legacy = TLSProber(timeout=5).handshake('127.0.0.1', server.port, 'TLSv1',
+                                                    _protocol_context(ssl.TLSVersion.TLSv1))
+            if not legacy.accepted:
+                self.skipTest(f"Local OpenSSL cannot negotiate TLS 1.0: {legacy.error}")
+
+            report = TLSProber(timeout=5).enumerate('127.0.0.1', server.port)
+            results = SSLTLSecurityAttack(f"https://127.0.0.1:{server.port}", tls_timeout=5).run()
+
+        self.assertTrue(report.reachable)
+        self.assertEqual(report.accepted_protocols(), ['TLSv1'])
+        self.assertEqual(report.negotiated_version, 'TLSv1')
+        self.assertIsNotNone(report.handshake_error)
+        # A refused protocol is not a certificate problem
+        self.assertIsNone(report.verification_error)
+        self.assertIn(('ssl_tls_protocol', 'TLSv1'),
+                      [(r.evidence['test_type'], r.evidence.get('protocol')) for r in results])
+
+def _tls12_client_context() -> ssl.SSLContext:
+    context = ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
+    context.check_hostname = False
+    context.verify_mode = ssl.CERT_NONE
+    context.maximum_version = ssl.TLSVersion.TLSv1_2
+    return context
+
+class TestResponseCache(unittest.TestCase):
+    """Test the scan-scoped response cache."""
+
+    def test_lru_eviction_and_hit_rate(self):
+        """Test the cache evicts the least recently used entry over its cap."""
+        cache = ResponseCache(max_entries=2)
+        first = make_cache_key('GET', 'http://target/a')
+        second = make_cache_key('GET', 'http://target/b')
+        third = make_cache_key('GET', 'http://target/c')
+
+        cache.store(first, 'a')
+        cache.store(second, 'b')
+        self.assertEqual(cache.lookup(first), 'a')
+        cache.store(third, 'c')
+
+        self.assertIsNone(cache.lookup(second))
+        self.assertEqual(cache.lookup(third), 'c')
+
+        stats = cache.stats()
+        self.assertEqual(stats['entries'], 2)
+        self.assertEqual(stats['evictions'], 1)
+        self.assertEqual(stats['hit_rate'], round(2 / 3, 3))
+
+    def test_key_includes_request_body(self):
+        """Test requests that differ only in body or params get different keys."""
+        self.assertEqual(make_cache_key('get', 'http://t/', params={'a': 1, 'b': 2}),
+                         make_cache_key('GET', 'http://t/', params={'b': 2, 'a': 1}))
+        self.assertNotEqual(make_cache_key('POST', 'http://t/', json={'q': 1}),
+                            make_cache_key('POST', 'http://t/', json={'q': 2}))
+
+    def test_transport_serves_repeat_probes_from_cache(self):
+        """Test a repeated GET is served from the cache and a POST invalidates its path."""
+        routes = {'/': (200, b'home'), '/api/comments': (200, b'[]')}
+
+        with ProbeTargetServer(routes) as target, \
+                ScanTransport(timeout=5, cache=ResponseCache()) as transport:
+            transport.get(f"{target.url}/")
+            transport.get(f"{target.url}/api/comments")
+            transport.get(f"{target.url}/")
+            transport.post(f"{target.url}/api/comments", json={'content': 'x'})
+            transport.get(f"{target.url}/api/comments")
+            transport.get(f"{target.url}/")
+
+            self.assertEqual(target.requests, [('GET', '/'), ('GET', '/api/comments'),
+                                               ('POST', '/api/comments'), ('GET', '/api/comments')])
+            self.assertEqual(transport.cache.stats()['hits'], 2)
+
+    def test_in_flight_read_is_not_cached_after_write(self):
+        """Test a GET that was in flight when a POST invalidated its path is not cached."""
+        cache = ResponseCache()
+        key = make_cache_key('GET', 'http://target/api/comments?page=1')
+
+        def fetch():
+            cache.invalidate('http://target/api/comments')
+            return 'before write'
+
+        self.assertEqual(cache.get_or_fetch(key, fetch), 'before write')
+        self.assertIsNone(cache.lookup(key))
+        self.assertEqual(cache.get_or_fetch(key, lambda: 'after write'), 'after write')
+        self.assertEqual(cache.lookup(key), 'after write')
+
+        generation = cache.generation(key)
+        cache.invalidate('http://target/api/comments/')
+        cache.store(key, 'stale', generation)
+        self.assertIsNone(cache.lookup(key))
+        cache.store(key, 'fresh', cache.generation(key))
+        self.assertEqual(cache.lookup(key), 'fresh')
+
+    def test_suite_probes_shared_url_once(self):
+        """Test vectors that fetch the same page share one request per suite."""
+        engine = AttackVectorEngine(UNTHROTTLED_CONFIG)
+        engine._attack_vectors = {
+            name: cls for name, cls in engine._attack_vectors.items()
+            if name in ('owasp_security_misconfiguration', 'owasp_known_vulnerabilities')
+        }
+
+        with ProbeTargetServer({'/': (200, b'home')}) as target:
+            suite = engine.run_test_suite(target.url, "owasp", concurrent=True)
+
+        self.assertEqual(target.requests.count(('GET', '/')), 1)
+        self.assertGreater(suite['request_plan']['merged_requests'], 0)
+        self.assertEqual(suite['transport']['requests_sent'], len(target.requests))
+
+class TestIndicatorMatcher(unittest.TestCase):
+    """Test the compiled indicator families."""
+
+    def _response(self, body: bytes) -> ProbeResponse:
+        return ProbeResponse(url='http://target/', status_code=200, headers={}, content=body)
+
+    def test_match_all_finds_overlapping_indicators(self):
+        """Test indicators nested in or overlapping other indicators are all reported."""
+        indicators = IndicatorSet('nested', ["debug", "debug info", "bug", "info leak"])
+
+        self.assertEqual(indicators.match_all("DEBUG INFO LEAK"), ["debug", "debug info", "bug", "info leak"])
+        self.assertEqual(indicators.match_all("nothing here"), [])
+
+    def test_case_sensitive_family(self):
+        """Test case-sensitive families only match the exact spelling."""
+        self.assertEqual(DOM_XSS_SINKS.match_all("el.innerHTML = x; el.innerhtml"), ["innerHTML"])
+        self.assertEqual(DOM_XSS_SINKS.match_all("EVAL(x)"), [])
+
+    def test_response_is_scanned_once_per_family(self):
+        """Test matches are memoized on the response."""
+        response = self._response(b"Running in Development mode")
+
+        self.assertEqual(DEBUG_MODE_INDICATORS.match_response(response), ["development"])
+        response.indicator_hits[DEBUG_MODE_INDICATORS.name] = ["memoized"]
+        self.assertEqual(DEBUG_MODE_INDICATORS.match_response(response), ["memoized"])
+
+    def test_evidence_names_matched_signature(self):
+        """Test a finding's evidence says which signature fired."""
+        attack = SQLInjectionAttack('http://target')
+        result = attack._evaluate_response("/api/users", "id", "' OR 1=1",
+                                           self._response(b"PostgreSQL query failed: syntax"))
+
+        self.assertEqual(result.evidence['matched_indicators'], ["PostgreSQL query failed"])
+
+class TestVectorRegistry(unittest.TestCase):
+    """Test vectors are registered as descriptors and imported only when selected."""
+
+    def test_engine_construction_imports_no_vector_module(self):
+        """Test a fresh process loads a category's module only once a suite selects it."""
+        script = (
+            "import sys\n"
+            "from core.attack_vector_engine import AttackVectorEngine\n"
+            "engine = AttackVectorEngine({})\n"
+            "loaded = lambda: sorted(m for m in sys.modules if m.startswith('core.vectors.'))\n"
+            "print(len(engine._attack_vectors), loaded())\n"
+            "engine._select_tests('llm')\n"
+            "print(loaded())\n"
+        )
+        output = subprocess.run([sys.executable, '-c', script], cwd=Path(__file__).parent.parent / 'src',
+                                capture_output=True, text=True, check=True).stdout.splitlines()
+
+        self.assertEqual(output[-2], "19 ['core.vectors.base']")
+        self.assertEqual(output[-1], "['core.vectors.base', 'core.vectors.llm']")
+
+    def test_plugins_join_registry_without_replacing_builtins(self):
+        """Test entry point vectors are added by name and cannot shadow a built-in vector."""
+        plugins = (VectorDescriptor('custom_prompt_probe', 'core.vectors.llm:PromptInjectionAttack'),
+                   VectorDescriptor('owasp_sql_injection', 'core.vectors.llm:DataPoisoningAttack'))
+        with unittest.mock.patch('core.vector_registry.plugin_vectors', return_value=plugins):
+            registry = build_registry()
+
+        self.assertEqual(registry['custom_prompt_probe'].category, 'custom')
+        self.assertEqual(registry['custom_prompt_probe'].load().__name__, 'PromptInjectionAttack')
+        self.assertIs(registry['owasp_sql_injection'].load(), SQLInjectionAttack)
+
+    def test_missing_plugin_class_raises_import_error(self):
+        """Test a descriptor naming a class its module lacks fails to load clearly."""
+        with self.assertRaises(ImportError):
+            VectorDescriptor('custom_missing', 'core.vectors.llm:NoSuchAttack').load()
+
+class TestLogging(unittest.TestCase):
+    """Test the queued logging pipeline, its JSON output and per-logger rate caps."""
+
+    @staticmethod
+    def _record(name='core.vectors.owasp', level=logging.INFO, msg="probe sent"):
+        return logging.LogRecord(name, level, __file__, 1, msg, None, None)
+
+    def test_parse_rate_limits(self):
+        """Test rate caps parse from logger=rate pairs and reject malformed ones."""
+        self.assertEqual(parse_rate_limits("core.vectors=50, core.progress_tracker=2.5"),
+                         {'core.vectors': 50.0, 'core.progress_tracker': 2.5})
+        self.assertEqual(parse_rate_limits(""), {})
+        for spec in ("core.vectors", "=5", "core.vectors=0", "core.vectors=fast"):
+            with self.assertRaises(ValueError):
+                parse_rate_limits(spec)
+
+    def test_rate_cap_drops_hot_records_only(self):
+        """Test a capped logger passes a second's worth of INFO records, never drops warnings and spares others."""
+        rate_filter = RateCapFilter({'core.vectors': 5, 'core.vectors.owasp.sql': 1000})
+
+        passed = sum(rate_filter.filter(self._record()) for _ in range(20))
+        self.assertEqual(passed, 5)
+        self.assertTrue(rate_filter.filter(self._record(level=logging.WARNING)))
+        self.assertTrue(rate_filter.filter(self._record(name='core.scan_jobs')))
+        self.assertTrue(rate_filter.filter(self._record(name='core.vectors.owasp.sql')))
+        self.assertEqual(rate_filter.suppressed(), {'core.vectors.owasp': 15})
+
+        # A record reaching a second handler keeps its first decision
+        record = self._record()
+        self.assertFalse(rate_filter.filter(record))
+        self.assertFalse(rate_filter.filter(record))
+        self.assertEqual(rate_filter.suppressed(), {'core.vectors.owasp': 16})
+
+    def test_json_lines_formatter(self):
+        """Test each record becomes one compact JSON object."""
+        line = JSONLinesFormatter().format(self._record(msg="🌸 Aurora: probe sent"))
+
+        self.assertNotIn("\n", line)
+        entry = json.loads(line)
+        self.assertEqual((entry['level'], entry['logger'], entry['msg']),
+                         ('INFO', 'core.vectors.owasp', "🌸 Aurora: probe sent"))
+        self.assertTrue(entry['ts'].endswith('+00:00'))
+
+    def test_consciousness_formatter_templates(self):
+        """Test each level gets its symbol, signature and suffix, and the record is left untouched."""
+        formatter = ConsciousnessFormatter()
+        record = logging.LogRecord('core.vectors.owasp', logging.INFO, __file__, 1, "probe %d sent", (3,), None)
+
+        self.assertEqual(formatter.format(record), "🌸 Aurora: probe 3 sent")
+        self.assertEqual((record.msg, record.args), ("probe %d sent", (3,)))
+        self.assertEqual(formatter.format(self._record(msg="🌸 Aurora: probe sent")), "🌸 🌸 Aurora: probe sent")
+        self.assertEqual(formatter.format(self._record(level=logging.DEBUG)), "probe sent")
+        self.assertEqual(formatter.format(self._record(level=logging.ERROR)),
+                         "❌ Aurora: probe sent [Sacred Principle: Ethical Security Practice]")
+
+    def test_consciousness_formatter_appends_exception(self):
+        """Test a traceback follows the message and precedes the principle suffix."""
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            record = logging.LogRecord('core.scan_jobs', logging.ERROR, __file__, 1, "scan failed", None,
+                                       sys.exc_info())
+
+        lines = ConsciousnessFormatter().format(record).splitlines()
+        self.assertEqual(lines[0], "❌ Aurora: scan failed")
+        self.assertEqual(lines[-1], "ValueError: boom [Sacred Principle: Ethical Security Practice]")
+        self.assertIsNone(record.exc_text)
+
+    def test_queued_pipeline_writes_json_lines(self):
+        """Test queued records reach the log file, capped, once the background writer is drained."""
+        root = logging.getLogger()
+        saved_handlers, saved_level = list(root.handlers), root.level
+        temp_dir = tempfile.mkdtemp()
+        log_file = os.path.join(temp_dir, 'aurora.log')
+        environment = {'LOG_FILE': log_file, 'LOG_FORMAT': 'json', 'LOG_ASYNC': 'True',
+                       'LOG_RATE_LIMITS': 'core.vectors=3'}
+        try:
+            with open(os.devnull, 'w') as devnull, unittest.mock.patch.dict(os.environ, environment), \
+                    unittest.mock.patch('sys.stderr', new=devnull):
+                cwd = os.getcwd()
+                os.chdir(temp_dir)
+                try:
+                    setup_logging()
+                    self.assertIsInstance(root.handlers[0], logging.handlers.QueueHandler)
+                    for i in range(10):
+                        logging.getLogger('core.vectors.llm').info(f"probe {i}")
+                    logging.getLogger('core.vectors.llm').error("probe failed")
+                    try:
+                        raise ValueError("bad response")
+                    except ValueError:
+                        logging.getLogger('core.scan_jobs').exception("job %s failed", "job-1")
+                    shutdown_logging()
+                finally:
+                    os.chdir(cwd)
+            with open(log_file, encoding='utf-8') as f:
+                entries = [json.loads(line) for line in f]
+        finally:
+            root.handlers[:] = saved_handlers
+            root.setLevel(saved_level)
+            shutil.rmtree(temp_dir)
+
+        messages = [entry['msg'] for entry in entries if entry['logger'] == 'core.vectors.llm']
+        self.assertEqual(messages, ["probe 0", "probe 1", "probe 2", "probe failed"])
+        # The traceback stays out of the message and is written as its own field
+        failure = next(entry for entry in entries if entry['logger'] == 'core.scan_jobs')
+        self.assertEqual(failure['msg'], "job job-1 failed")
+        self.assertIn("ValueError: bad response", failure['exc'])
+        self.assertIn("{'core.vectors.llm': 7}", entries[-1]['msg'])
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)